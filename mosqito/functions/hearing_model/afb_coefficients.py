@@ -8,8 +8,10 @@ import numpy as np
 import math
 import scipy as sp
 from scipy.special import comb
+from mosqito.functions.shared.filter_cache import cached_design
 
 
+@cached_design
 def afb_coefficients(fs, filter_order_k, centre_freq, d_coefficients):
     """ Function for the calculation of the filter coefficients in the Auditory Filtering Bank section (5.1.3). Here, as
     it has been mentioned in the principal function for the specific loudness, it is calculated the band-pass equivalent
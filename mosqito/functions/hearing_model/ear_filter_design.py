@@ -2,8 +2,10 @@
 """
 @author: Daniel Jiménez-Caminero Costa and modifications by "martin_g" of Eomys
 """
+from mosqito.functions.shared.filter_cache import cached_design
 
 
+@cached_design
 def ear_filter_design():
     """Return second-order filter coefficients of outer and middle/inner ear filter according to ECMA-418-2
     section 5.1.2.
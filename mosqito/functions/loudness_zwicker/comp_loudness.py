@@ -16,9 +16,25 @@ from mosqito.functions.loudness_zwicker.loudness_zwicker_stationary import (
 from mosqito.functions.loudness_zwicker.loudness_zwicker_time import (
     loudness_zwicker_time,
 )
+from mosqito.functions.loudness_zwicker.loudness_zwicker_time_parallel import (
+    loudness_zwicker_time_parallel,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_time_stats import (
+    loudness_zwicker_time_stats,
+)
 
 
-def comp_loudness(is_stationary, signal, fs, field_type="free"):
+def comp_loudness(
+    is_stationary,
+    signal,
+    fs,
+    field_type="free",
+    chunk_duration=None,
+    max_workers=None,
+    statistics=None,
+    out=None,
+    dtype=np.float64,
+):
     """Acoustic loudness calculation according to Zwicker method for
     stationary and time-varying signals.
 
@@ -27,30 +43,60 @@ def comp_loudness(is_stationary, signal, fs, field_type="free"):
     is_stationary: boolean
         TRUE if the signal is stationary, FALSE if it is time-varying
     signal : numpy.array
-        time signal values
+        time signal values (for time-varying signals, dim [time] or
+        [channels, time])
     fs : integer
         sampling frequency
     field-type: string
         'free' by default or 'diffuse'
+    chunk_duration: float
+        for time-varying signals, duration of the time chunks processed in
+        parallel [s] (None by default: the signal is processed at once, see
+        loudness_zwicker_time_parallel)
+    max_workers: int
+        number of processes used for the time chunks (number of cores by
+        default)
+    statistics: list
+        for time-varying signals, percentages of time x of the loudness
+        Nx exceeded during x % of the time, returned with Nmax instead of
+        the loudness over time (None by default, see
+        loudness_zwicker_time_stats)
+    out: numpy.array
+        for time-varying signals, array where the specific loudness is
+        written, e.g. a numpy.memmap or a h5py dataset (None by default)
+    dtype: numpy.dtype
+        for time-varying signals, data type of the specific loudness if
+        out is None (np.float32 or np.float16 to reduce the memory use,
+        np.float64 by default)
 
     Outputs
     -------
-    N: float/numpy.array
-        loudness value
-    N_specific: numpy.array
-        specific loudness values
+    N: float/numpy.array/dict
+        loudness value (with a leading channel dimension for multichannel
+        signals, or dict of statistics "N5", "N10"... and "Nmax")
+    N_specific: numpy.array/dict
+        specific loudness values (with a leading channel dimension for
+        multichannel signals, or dict of statistics)
     bark_axis: numpy.array
         frequency axis correpsondong to N_specific values in bark
     """
 
-    third_spec = comp_third_spec(is_stationary, signal, fs)
-
     if is_stationary == True:
+        third_spec = comp_third_spec(is_stationary, signal, fs)
         N, N_specific = loudness_zwicker_stationary(
             third_spec["values"], third_spec["freqs"], field_type
         )
+    elif statistics is not None:
+        N, N_specific = loudness_zwicker_time_stats(signal, fs, field_type, statistics)
+    elif chunk_duration is not None:
+        N, N_specific = loudness_zwicker_time_parallel(
+            signal, fs, field_type, chunk_duration, max_workers, out=out, dtype=dtype
+        )
     elif is_stationary == False:
-        N, N_specific = loudness_zwicker_time(third_spec["values"], field_type)
+        third_spec = comp_third_spec(is_stationary, signal, fs)
+        N, N_specific = loudness_zwicker_time(
+            third_spec["values"], field_type, out, dtype
+        )
 
     # critical band rate scale
     bark_axis = np.linspace(0.1, 24, int(24 / 0.1))
@@ -85,9 +131,11 @@ def comp_loudness_from_3spec(
     Outputs
     -------
     N: float/numpy.array
-        loudness value
+        loudness value (with a leading channel dimension for multichannel
+        signals)
     N_specific: numpy.array
-        specific loudness values
+        specific loudness values (with a leading channel dimension for
+        multichannel signals)
     bark_axis: numpy.array
         frequency axis correpsondong to N_specific values in bark
     """
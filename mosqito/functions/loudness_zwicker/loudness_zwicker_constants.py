@@ -0,0 +1,497 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+
+Constant tables of the Zwicker loudness calculation (ISO 532-1) and
+quantities derived from them, computed once at import instead of at
+each call. The arrays are shared by all the calls and are read-only.
+"""
+
+# Standard library imports
+import math
+
+# Third party imports
+import numpy as np
+
+#
+# Third octave filter bank (see calc_third_octave_levels)
+#
+# Preferred center frequencies of the third octave bands [Hz]
+THIRD_OCTAVE_FREQ = np.array(
+    [
+        25,
+        31.5,
+        40,
+        50,
+        63,
+        80,
+        100,
+        125,
+        160,
+        200,
+        250,
+        315,
+        400,
+        500,
+        630,
+        800,
+        1000,
+        1250,
+        1600,
+        2000,
+        2500,
+        3150,
+        4000,
+        5000,
+        6300,
+        8000,
+        10000,
+        12500,
+    ]
+)
+# Exact center frequencies of the third octave bands [Hz]
+THIRD_OCTAVE_CENTER_FREQ = 10 ** ((np.arange(28) - 16) / 10) * 1000
+# Filter coefficients of one-third-octave-band filters (reference
+# table)
+# ISO 532-1 Table A.1
+THIRD_OCTAVE_FILTER_REF = np.array(
+    [[1, 2, 1, 1, -2, 1], [1, 0, -1, 1, -2, 1], [1, -2, 1, 1, -2, 1]]
+)
+# Filter coefficients of one-third-octave-band filters (difference to
+# reference table for 28 one-third-octave-band filters)
+# ISO 532-1 Table A.2
+THIRD_OCTAVE_FILTER_DIFF = np.array(
+    [
+        [
+            [0, 0, 0, 0, -6.70260e-004, 6.59453e-004],
+            [0, 0, 0, 0, -3.75071e-004, 3.61926e-004],
+            [0, 0, 0, 0, -3.06523e-004, 2.97634e-004],
+        ],
+        [
+            [0, 0, 0, 0, -8.47258e-004, 8.30131e-004],
+            [0, 0, 0, 0, -4.76448e-004, 4.55616e-004],
+            [0, 0, 0, 0, -3.88773e-004, 3.74685e-004],
+        ],
+        [
+            [0, 0, 0, 0, -1.07210e-003, 1.04496e-003],
+            [0, 0, 0, 0, -6.06567e-004, 5.73553e-004],
+            [0, 0, 0, 0, -4.94004e-004, 4.71677e-004],
+        ],
+        [
+            [0, 0, 0, 0, -1.35836e-003, 1.31535e-003],
+            [0, 0, 0, 0, -7.74327e-004, 7.22007e-004],
+            [0, 0, 0, 0, -6.29154e-004, 5.93771e-004],
+        ],
+        [
+            [0, 0, 0, 0, -1.72380e-003, 1.65564e-003],
+            [0, 0, 0, 0, -9.91780e-004, 9.08866e-004],
+            [0, 0, 0, 0, -8.03529e-004, 7.47455e-004],
+        ],
+        [
+            [0, 0, 0, 0, -2.19188e-003, 2.08388e-003],
+            [0, 0, 0, 0, -1.27545e-003, 1.14406e-003],
+            [0, 0, 0, 0, -1.02976e-003, 9.40900e-004],
+        ],
+        [
+            [0, 0, 0, 0, -2.79386e-003, 2.62274e-003],
+            [0, 0, 0, 0, -1.64828e-003, 1.44006e-003],
+            [0, 0, 0, 0, -1.32520e-003, 1.18438e-003],
+        ],
+        [
+            [0, 0, 0, 0, -3.57182e-003, 3.30071e-003],
+            [0, 0, 0, 0, -2.14252e-003, 1.81258e-003],
+            [0, 0, 0, 0, -1.71397e-003, 1.49082e-003],
+        ],
+        [
+            [0, 0, 0, 0, -4.58305e-003, 4.15355e-003],
+            [0, 0, 0, 0, -2.80413e-003, 2.28135e-003],
+            [0, 0, 0, 0, -2.23006e-003, 1.87646e-003],
+        ],
+        [
+            [0, 0, 0, 0, -5.90655e-003, 5.22622e-003],
+            [0, 0, 0, 0, -3.69947e-003, 2.87118e-003],
+            [0, 0, 0, 0, -2.92205e-003, 2.36178e-003],
+        ],
+        [
+            [0, 0, 0, 0, -7.65243e-003, 6.57493e-003],
+            [0, 0, 0, 0, -4.92540e-003, 3.61318e-003],
+            [0, 0, 0, 0, -3.86007e-003, 2.97240e-003],
+        ],
+        [
+            [0, 0, 0, 0, -1.00023e-002, 8.29610e-003],
+            [0, 0, 0, 0, -6.63788e-003, 4.55999e-003],
+            [0, 0, 0, 0, -5.15982e-003, 3.75306e-003],
+        ],
+        [
+            [0, 0, 0, 0, -1.31230e-002, 1.04220e-002],
+            [0, 0, 0, 0, -9.02274e-003, 5.73132e-003],
+            [0, 0, 0, 0, -6.94543e-003, 4.71734e-003],
+        ],
+        [
+            [0, 0, 0, 0, -1.73693e-002, 1.30947e-002],
+            [0, 0, 0, 0, -1.24176e-002, 7.20526e-003],
+            [0, 0, 0, 0, -9.46002e-003, 5.93145e-003],
+        ],
+        [
+            [0, 0, 0, 0, -2.31934e-002, 1.64308e-002],
+            [0, 0, 0, 0, -1.73009e-002, 9.04761e-003],
+            [0, 0, 0, 0, -1.30358e-002, 7.44926e-003],
+        ],
+        [
+            [0, 0, 0, 0, -3.13292e-002, 2.06370e-002],
+            [0, 0, 0, 0, -2.44342e-002, 1.13731e-002],
+            [0, 0, 0, 0, -1.82108e-002, 9.36778e-003],
+        ],
+        [
+            [0, 0, 0, 0, -4.28261e-002, 2.59325e-002],
+            [0, 0, 0, 0, -3.49619e-002, 1.43046e-002],
+            [0, 0, 0, 0, -2.57855e-002, 1.17912e-002],
+        ],
+        [
+            [0, 0, 0, 0, -5.91733e-002, 3.25054e-002],
+            [0, 0, 0, 0, -5.06072e-002, 1.79513e-002],
+            [0, 0, 0, 0, -3.69401e-002, 1.48094e-002],
+        ],
+        [
+            [0, 0, 0, 0, -8.26348e-002, 4.05894e-002],
+            [0, 0, 0, 0, -7.40348e-002, 2.24476e-002],
+            [0, 0, 0, 0, -5.34977e-002, 1.85371e-002],
+        ],
+        [
+            [0, 0, 0, 0, -1.17018e-001, 5.08116e-002],
+            [0, 0, 0, 0, -1.09516e-001, 2.81387e-002],
+            [0, 0, 0, 0, -7.85097e-002, 2.32872e-002],
+        ],
+        [
+            [0, 0, 0, 0, -1.67714e-001, 6.37872e-002],
+            [0, 0, 0, 0, -1.63378e-001, 3.53729e-002],
+            [0, 0, 0, 0, -1.16419e-001, 2.93723e-002],
+        ],
+        [
+            [0, 0, 0, 0, -2.42528e-001, 7.98576e-002],
+            [0, 0, 0, 0, -2.45161e-001, 4.43370e-002],
+            [0, 0, 0, 0, -1.73972e-001, 3.70015e-002],
+        ],
+        [
+            [0, 0, 0, 0, -3.53142e-001, 9.96330e-002],
+            [0, 0, 0, 0, -3.69163e-001, 5.53535e-002],
+            [0, 0, 0, 0, -2.61399e-001, 4.65428e-002],
+        ],
+        [
+            [0, 0, 0, 0, -5.16316e-001, 1.24177e-001],
+            [0, 0, 0, 0, -5.55473e-001, 6.89403e-002],
+            [0, 0, 0, 0, -3.93998e-001, 5.86715e-002],
+        ],
+        [
+            [0, 0, 0, 0, -7.56635e-001, 1.55023e-001],
+            [0, 0, 0, 0, -8.34281e-001, 8.58123e-002],
+            [0, 0, 0, 0, -5.94547e-001, 7.43960e-002],
+        ],
+        [
+            [0, 0, 0, 0, -1.10165e000, 1.91713e-001],
+            [0, 0, 0, 0, -1.23939e000, 1.05243e-001],
+            [0, 0, 0, 0, -8.91666e-001, 9.40354e-002],
+        ],
+        [
+            [0, 0, 0, 0, -1.58477e000, 2.39049e-001],
+            [0, 0, 0, 0, -1.80505e000, 1.28794e-001],
+            [0, 0, 0, 0, -1.32500e000, 1.21333e-001],
+        ],
+        [
+            [0, 0, 0, 0, -2.50630e000, 1.42308e-001],
+            [0, 0, 0, 0, -2.19464e000, 2.76470e-001],
+            [0, 0, 0, 0, -1.90231e000, 1.47304e-001],
+        ],
+    ]
+)
+# Filter gain values
+# ISO 532-1 Table A.2
+THIRD_OCTAVE_GAIN = np.array(
+    [
+        4.30764e-011,
+        8.59340e-011,
+        1.71424e-010,
+        3.41944e-010,
+        6.82035e-010,
+        1.36026e-009,
+        2.71261e-009,
+        5.40870e-009,
+        1.07826e-008,
+        2.14910e-008,
+        4.28228e-008,
+        8.54316e-008,
+        1.70009e-007,
+        3.38215e-007,
+        6.71990e-007,
+        1.33531e-006,
+        2.65172e-006,
+        5.25477e-006,
+        1.03780e-005,
+        2.04870e-005,
+        4.05198e-005,
+        7.97914e-005,
+        1.56511e-004,
+        3.04954e-004,
+        5.99157e-004,
+        1.16544e-003,
+        2.27488e-003,
+        3.91006e-003,
+    ]
+)
+# Second order sections of the 28 filters (dim [28, 3, 6])
+THIRD_OCTAVE_SOS = THIRD_OCTAVE_FILTER_REF - THIRD_OCTAVE_FILTER_DIFF
+# Time constants of the smoothing low-pass filters (see
+# smoothing_time_constant) and feedback coefficient of the filters at
+# 48 kHz: y[n] = (1 - SMOOTHING_A1) * x[n] + SMOOTHING_A1 * y[n - 1]
+SMOOTHING_TAU = np.where(
+    THIRD_OCTAVE_CENTER_FREQ <= 1000,
+    2 / (3 * THIRD_OCTAVE_CENTER_FREQ),
+    2 / (3 * 1000),
+)
+SMOOTHING_A1 = np.exp(-1 / (48000 * SMOOTHING_TAU))
+
+#
+# Core loudness (see calc_main_loudness), variable names and description
+# according to Zwicker:1991
+#
+# Ranges of 1/3 octave band levels for correction at low frequencies
+# according to equal loudness contours
+RAP = np.array([45, 55, 65, 71, 80, 90, 100, 120])
+# Reduction of 1/3 octave band levels at low frequencies according to
+# equal loudness contours within the eight ranges defined by RAP
+DLL = np.array(
+    [
+        (-32, -24, -16, -10, -5, 0, -7, -3, 0, -2, 0),
+        (-29, -22, -15, -10, -4, 0, -7, -2, 0, -2, 0),
+        (-27, -19, -14, -9, -4, 0, -6, -2, 0, -2, 0),
+        (-25, -17, -12, -9, -3, 0, -5, -2, 0, -2, 0),
+        (-23, -16, -11, -7, -3, 0, -4, -1, 0, -1, 0),
+        (-20, -14, -10, -6, -3, 0, -4, -1, 0, -1, 0),
+        (-18, -12, -9, -6, -2, 0, -3, -1, 0, -1, 0),
+        (-15, -10, -8, -4, -2, 0, -3, -1, 0, -1, 0),
+    ]
+)
+# Critical band level at absolute threshold without taking into
+# account the transmission characteristics of the ear
+LTQ = np.array([30, 18, 12, 8, 7, 6, 5, 4, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3])
+# Correction of levels according to the transmission characteristics
+# of the ear
+A0 = np.array(
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.5, -1.6, -3.2, -5.4, -5.6, -4, -1.5, 2, 5, 12]
+)
+# Level difference between free and diffuse sound fields
+DDF = np.array(
+    [
+        0,
+        0,
+        0.5,
+        0.9,
+        1.2,
+        1.6,
+        2.3,
+        2.8,
+        3,
+        2,
+        0,
+        -1.4,
+        -2,
+        -1.9,
+        -1,
+        0.5,
+        3,
+        4,
+        4.3,
+        4,
+    ]
+)
+# Adaptation of 1/3 oct. band levels to the corresponding critical
+# band level
+DCB = np.array(
+    [
+        -0.25,
+        -0.6,
+        -0.8,
+        -0.8,
+        -0.5,
+        0,
+        0.5,
+        1.1,
+        1.5,
+        1.7,
+        1.8,
+        1.8,
+        1.7,
+        1.6,
+        1.4,
+        1.2,
+        0.8,
+        0.5,
+        0,
+        -0.5,
+    ]
+)
+# Upper limits of the ranges RAP corrected by DLL, for each band
+RANGE_LIM = RAP[:, np.newaxis] - DLL
+# Main loudness constant factor at threshold for each critical band
+MP1 = 0.0635 * np.power(10, 0.025 * LTQ)
+
+#
+# Specific loudness pattern (see calc_slopes)
+#
+# Upper limits of approximated critical bands in terms of critical
+# band rate
+ZUP = np.array(
+    [
+        0.9,
+        1.8,
+        2.8,
+        3.5,
+        4.4,
+        5.4,
+        6.6,
+        7.9,
+        9.2,
+        10.6,
+        12.3,
+        13.8,
+        15.2,
+        16.7,
+        18.1,
+        19.3,
+        20.6,
+        21.8,
+        22.7,
+        23.6,
+        24,
+    ]
+)
+# Range of specific loudness for the determination of the steepness
+# of the upper slopes in the specific loudness - critical band rate
+# pattern
+RNS = np.array(
+    [
+        21.5,
+        18,
+        15.1,
+        11.5,
+        9,
+        6.1,
+        4.4,
+        3.1,
+        2.13,
+        1.36,
+        0.82,
+        0.42,
+        0.30,
+        0.22,
+        0.15,
+        0.10,
+        0.035,
+        0,
+    ]
+)
+# Steepness of the upper slopes in the specific loudness = Critical
+# band rate pattern for the ranges RNS as a function of the number
+# of the critical band
+USL = np.array(
+    [
+        (13, 8.2, 6.3, 5.5, 5.5, 5.5, 5.5, 5.5),
+        (9, 7.5, 6, 5.1, 4.5, 4.5, 4.5, 4.5),
+        (7.8, 6.7, 5.6, 4.9, 4.4, 3.9, 3.9, 3.9),
+        (6.2, 5.4, 4.6, 4.0, 3.5, 3.2, 3.2, 3.2),
+        (4.5, 3.8, 3.6, 3.2, 2.9, 2.7, 2.7, 2.7),
+        (3.7, 3.0, 2.8, 2.35, 2.2, 2.2, 2.2, 2.2),
+        (2.9, 2.3, 2.1, 1.9, 1.8, 1.7, 1.7, 1.7),
+        (2.4, 1.7, 1.5, 1.35, 1.3, 1.3, 1.3, 1.3),
+        (1.95, 1.45, 1.3, 1.15, 1.1, 1.1, 1.1, 1.1),
+        (1.5, 1.2, 0.94, 0.86, 0.82, 0.82, 0.82, 0.82),
+        (0.72, 0.67, 0.64, 0.63, 0.62, 0.62, 0.62, 0.62),
+        (0.59, 0.53, 0.51, 0.50, 0.42, 0.42, 0.42, 0.42),
+        (0.40, 0.33, 0.26, 0.24, 0.24, 0.22, 0.22, 0.22),
+        (0.27, 0.21, 0.20, 0.18, 0.17, 0.17, 0.17, 0.17),
+        (0.16, 0.15, 0.14, 0.12, 0.11, 0.11, 0.11, 0.11),
+        (0.12, 0.11, 0.10, 0.08, 0.08, 0.08, 0.08, 0.08),
+        (0.09, 0.08, 0.07, 0.06, 0.06, 0.06, 0.06, 0.05),
+        (0.06, 0.05, 0.03, 0.02, 0.02, 0.02, 0.02, 0.02),
+    ]
+)
+# Upper limits of the critical bands as used for the comparisons
+ZUP_LIMITS = ZUP + 0.0001
+# Critical band rate values of the specific loudness pattern: z is
+# incremented by 0.1 each time a value is stored (N_specific[iz]
+# corresponds to Z_AXIS[iz])
+Z_AXIS = np.cumsum(np.full(int(24 / 0.1) + 1, 0.1))
+
+#
+# Nonlinear temporal decay (see calc_nl_init)
+#
+# Sampling rate of the core loudness [Hz]
+NL_SAMPLE_RATE = 2000
+# Time constants for non_linear temporal decay [s]
+NL_T_SHORT = 0.005
+NL_T_LONG = 0.015
+NL_T_VAR = 0.075
+# Default factor for virtual upsampling/inner iterations
+NL_ITER = 24
+
+
+def calc_nl_coefficients(nl_iter=NL_ITER):
+    """Constants B of the non linear temporal decay
+
+    Parameters
+    ----------
+    nl_iter : int
+        Factor for virtual upsampling/inner iterations
+
+    Outputs
+    -------
+    B : list
+        Constants B
+    """
+    delta_t = 1 / (NL_SAMPLE_RATE * nl_iter)
+    P = (NL_T_VAR + NL_T_LONG) / (NL_T_VAR * NL_T_SHORT)
+    Q = 1 / (NL_T_SHORT * NL_T_VAR)
+    lambda_1 = -P / 2 + math.sqrt(P * P / 4 - Q)
+    lambda_2 = -P / 2 - math.sqrt(P * P / 4 - Q)
+    den = NL_T_VAR * (lambda_1 - lambda_2)
+    e1 = math.exp(lambda_1 * delta_t)
+    e2 = math.exp(lambda_2 * delta_t)
+    B = [
+        (e1 - e2) / den,
+        ((NL_T_VAR * lambda_2 + 1) * e1 - (NL_T_VAR * lambda_1 + 1) * e2) / den,
+        ((NL_T_VAR * lambda_1 + 1) * e1 - (NL_T_VAR * lambda_2 + 1) * e2) / den,
+        (NL_T_VAR * lambda_1 + 1) * (NL_T_VAR * lambda_2 + 1) * (e1 - e2) / den,
+        math.exp(-delta_t / NL_T_LONG),
+        math.exp(-delta_t / NL_T_VAR),
+    ]
+    return B
+
+
+# Constants B for the default number of inner iterations
+NL_B = tuple(calc_nl_coefficients(NL_ITER))
+
+for _table in [
+    THIRD_OCTAVE_FREQ,
+    THIRD_OCTAVE_CENTER_FREQ,
+    THIRD_OCTAVE_FILTER_REF,
+    THIRD_OCTAVE_FILTER_DIFF,
+    THIRD_OCTAVE_GAIN,
+    THIRD_OCTAVE_SOS,
+    SMOOTHING_TAU,
+    SMOOTHING_A1,
+    RAP,
+    DLL,
+    LTQ,
+    A0,
+    DDF,
+    DCB,
+    RANGE_LIM,
+    MP1,
+    ZUP,
+    RNS,
+    USL,
+    ZUP_LIMITS,
+    Z_AXIS,
+]:
+    _table.setflags(write=False)
+del _table
@@ -7,45 +7,108 @@
 # Standard library imports
 import math
 import numpy as np
+from scipy import signal
 
 
-def loudness_zwicker_lowpass_intp(loudness, tau, sample_rate):
+def loudness_zwicker_lowpass_intp(loudness, tau, sample_rate, zi=None):
     """1st order low-pass with linear interpolation of signal for
     increased precision
 
+    The low-pass is run at 24x virtual upsampling of the linearly
+    interpolated signal. As the interpolation and the filter are both
+    linear, the whole process is equivalent to a 1st order IIR filter
+    at the loudness sampling frequency, whose coefficients are computed
+    by lowpass_intp_coeff.
+
     Parameters
     ----------
     loudness : numpy.ndarray
-        Loudness vs. time
+        Loudness vs. time (filtered along the last axis)
     tau : float
         Filter parameter
     sample_rate : int
         Louness signal sampling frequency
+    zi : numpy.ndarray, optional
+        Initial state of the equivalent filter (final state of the
+        previous block, see lowpass_intp_zi for the first block). If None,
+        the filter is at rest before the first sample.
 
     Outputs
     -------
     filt_loudness : numpy.ndarray
         Filtered loudness
+    zf : numpy.ndarray
+        Final state of the equivalent filter (only returned if zi is
+        given)
+    """
+    loudness = np.asarray(loudness, dtype=float)
+    if zi is not None:
+        b, a, _ = lowpass_intp_coeff(tau, sample_rate)
+        return signal.lfilter(b, a, loudness, zi=zi)
+    if loudness.shape[-1] == 0:
+        return np.zeros(np.shape(loudness))
+    b, a, _ = lowpass_intp_coeff(tau, sample_rate)
+    zi = lowpass_intp_zi(loudness[..., 0], tau, sample_rate)
+    filt_loudness, _ = signal.lfilter(b, a, loudness, zi=zi)
+    return filt_loudness
+
+
+def lowpass_intp_zi(loudness_0, tau, sample_rate):
+    """Initial state of the equivalent filter at rest before the first
+    sample
+
+    Parameters
+    ----------
+    loudness_0 : float or numpy.ndarray
+        First loudness sample (of each channel)
+    tau : float
+        Filter parameter
+    sample_rate : int
+        Louness signal sampling frequency
+
+    Outputs
+    -------
+    zi : numpy.ndarray
+        Initial state such that the first output is b0 * loudness_0
     """
-    filt_loudness = np.zeros(np.shape(loudness))
-    # Factor for virtual upsampling/inner iterations
-    lp_iter = 24
+    b, _, b0 = lowpass_intp_coeff(tau, sample_rate)
+    return np.asarray((b0 - b[0]) * loudness_0)[..., np.newaxis]
 
-    num_samples = np.shape(loudness)[0]
+
+def lowpass_intp_coeff(tau, sample_rate, lp_iter=24):
+    """Coefficients of the 1st order low-pass with linear interpolation
+
+    Between two samples x[i] and x[i+1], the low-pass (y = b0 * x + a1 * y)
+    is iterated lp_iter times on the interpolated values
+    x[i] + k * (x[i+1] - x[i]) / lp_iter (k = 1, ..., lp_iter) and then
+    once on x[i+1]. Hence y[i+1] = A * y[i] + c1 * x[i+1] + c0 * x[i].
+
+    Parameters
+    ----------
+    tau : float
+        Filter parameter
+    sample_rate : int
+        Louness signal sampling frequency
+    lp_iter : int
+        Factor for virtual upsampling/inner iterations
+
+    Outputs
+    -------
+    b : numpy.ndarray
+        Numerator coefficients [c1, c0] of the equivalent filter
+    a : numpy.ndarray
+        Denominator coefficients [1, -A] of the equivalent filter
+    b0 : float
+        Gain of the 1st order low-pass applied to the first sample
+    """
     a1 = math.exp(-1 / (sample_rate * lp_iter * tau))
     b0 = 1 - a1
-    y1 = 0
-
-    for i in range(num_samples):
-        x0 = loudness[i]
-        y1 = b0 * x0 + a1 * y1
-        filt_loudness[i] = y1
-
-        # Linear interpolation steps between current and next sample
-        if i < num_samples - 1:
-            xd = (loudness[i + 1] - x0) / lp_iter
-            # Inner iterations/interpolation
-            for ii in range(lp_iter):
-                x0 += xd
-                y1 = b0 * x0 + a1 * y1
-    return filt_loudness
+    # Weight of x[i+1] in the interpolated value of each update step
+    weight = np.minimum(np.arange(1, lp_iter + 2), lp_iter) / lp_iter
+    # Decay of each update step until the next output sample
+    decay = a1 ** np.arange(lp_iter, -1, -1)
+    c1 = b0 * np.sum(decay * weight)
+    c0 = b0 * np.sum(decay * (1 - weight))
+    b = np.array([c1, c0])
+    a = np.array([1, -(a1 ** (lp_iter + 1))])
+    return b, a, b0
@@ -4,117 +4,333 @@
 @author martin_g for Eomys
 """
 
-# Standard library imports
-import math
-
 # Third party import
 import numpy as np
 
+# Local application imports
+from mosqito.functions.loudness_zwicker.loudness_zwicker_constants import (
+    NL_ITER,
+    NL_B,
+    calc_nl_coefficients,
+)
+
+# Minimum number of core loudness samples of the chunks processed together
+# (see calc_nl_block)
+NL_CHUNK = 500
+
 
 def calc_nl_loudness(core_loudness):
     """Simulate the nonlinear temporal decay of the hearing system
 
+    All the critical bands (and channels) are advanced together: the
+    states of the capacitors C1 and C2 are stored as arrays (one value
+    per band) and updated sample by sample. Long signals are split into
+    time chunks also advanced together (see calc_nl_block).
+
     Parameters
     ----------
     core_loudness : numpy.ndarray
-        Core loudness
+        Core loudness (dim [bands, time] or [bands, channels, time])
 
     Outputs
     -------
     nl_loudness :  numpy.ndarray
         Loudness with non linear temporal decay
     """
-    # Initialization
-    sample_rate = 2000
-    nl_loudness = core_loudness
-    # Factor for virtual upsampling/inner iterations
-    nl_iter = 24
-    # Time constants for non_linear temporal decay
-    t_short = 0.005
-    t_long = 0.015
-    t_var = 0.075
-    # Initializes constants B and states of capacitors C1 and C2
-    delta_t = 1 / (sample_rate * nl_iter)
-    P = (t_var + t_long) / (t_var * t_short)
-    Q = 1 / (t_short * t_var)
-    lambda_1 = -P / 2 + math.sqrt(P * P / 4 - Q)
-    lambda_2 = -P / 2 - math.sqrt(P * P / 4 - Q)
-    den = t_var * (lambda_1 - lambda_2)
-    e1 = math.exp(lambda_1 * delta_t)
-    e2 = math.exp(lambda_2 * delta_t)
-    B = [
-        (e1 - e2) / den,
-        ((t_var * lambda_2 + 1) * e1 - (t_var * lambda_1 + 1) * e2) / den,
-        ((t_var * lambda_1 + 1) * e1 - (t_var * lambda_2 + 1) * e2) / den,
-        (t_var * lambda_1 + 1) * (t_var * lambda_2 + 1) * (e1 - e2) / den,
-        math.exp(-delta_t / t_long),
-        math.exp(-delta_t / t_var),
-    ]
-    nl_lp = {"B": B}
-
-    for i_cl in np.arange(np.shape(core_loudness)[0]):
-        # At beginning capacitors C1 and C2 are discharged
-        nl_lp["uo_last"] = 0
-        nl_lp["u2_last"] = 0
-
-        for i_time in np.arange(np.shape(core_loudness)[1] - 1):
-            # interpolation steps between current and next sample
-            delta = (
-                core_loudness[i_cl, i_time + 1] - core_loudness[i_cl, i_time]
-            ) / nl_iter
-            ui = core_loudness[i_cl, i_time]
-            nl_lp = calc_nl_lp(ui, nl_lp)
-            nl_loudness[i_cl, i_time] = nl_lp["uo_last"]
-            ui += delta
+    core_loudness = np.asarray(core_loudness, dtype=float)
+    shape = core_loudness.shape
+    core_loudness = core_loudness.reshape((-1, shape[-1]))
+    nl_loudness = np.zeros(core_loudness.shape)
+    if shape[-1] == 0:
+        return nl_loudness.reshape(shape)
+    # At beginning capacitors C1 and C2 are discharged
+    nl_lp = calc_nl_init(core_loudness.shape[0])
+    nl_loudness[:, :-1] = calc_nl_block(core_loudness, nl_lp)
+    nl_loudness[:, -1] = calc_nl_last(nl_lp)
+    return nl_loudness.reshape(shape)
+
+
+def calc_nl_block(core_loudness, nl_lp):
+    """Nonlinear temporal decay of a block of core loudness samples
+
+    The output at a given time needs the next core loudness sample (for
+    the linear interpolation of the inner iterations). The last sample of
+    the block is then kept in nl_lp and processed with the next block, or
+    by calc_nl_last at the end of the signal.
+
+    Long blocks are split into time chunks of at least NL_CHUNK samples,
+    processed together. Each chunk is computed with the preceding chunk
+    as lead-in, starting from discharged capacitors. The states of the
+    capacitors at the beginning of each chunk are then compared with the
+    states at the end of the preceding chunk: the decay forgets its
+    initial state, so that they are usually identical and the chunk is
+    identical to the sample by sample calculation. The chunks (and bands)
+    that differ are computed again from the states at the end of the
+    preceding chunk, until all the states match (e.g. a band decaying
+    after a loud sound may need a few passes).
+
+    Parameters
+    ----------
+    core_loudness : numpy.ndarray
+        Core loudness block (dim [bands, time])
+    nl_lp : dict
+        Parameters for non_linear temporal decay (see calc_nl_init),
+        updated in place
+
+    Outputs
+    -------
+    nl_loudness :  numpy.ndarray
+        Loudness with non linear temporal decay, starting at the sample
+        kept from the previous block (if any)
+    """
+    core_loudness = np.asarray(core_loudness, dtype=float)
+    if nl_lp["cl_next"] is not None:
+        core_loudness = np.concatenate(
+            (nl_lp["cl_next"][:, np.newaxis], core_loudness), axis=1
+        )
+    num_bands, num_samples = core_loudness.shape
+    if num_samples > 0:
+        nl_lp["cl_next"] = core_loudness[:, -1].copy()
+    num_chunks = (num_samples - 1) // NL_CHUNK
+    if num_chunks < 3:
+        return calc_nl_run(core_loudness, nl_lp)
+
+    # Chunk i + 1 is computed by lane i with chunk i as lead-in, chunk 0
+    # by lane 0 from the current state (dim [lanes, bands, time])
+    chunk = (num_samples - 1) // num_chunks
+    lanes = np.stack(
+        [
+            core_loudness[:, i * chunk : (i + 2) * chunk + 1]
+            for i in range(num_chunks - 1)
+        ]
+    )
+    nl_lanes = calc_nl_init((num_chunks - 1) * num_bands, nl_lp["nl_iter"])
+    nl_lanes["state"][:, 0, :num_bands] = nl_lp["state"][:, 0, :]
+    nl_loudness = np.empty((num_bands, num_samples - 1))
+    nl_loudness[:, :chunk] = calc_nl_run(
+        lanes[:, :, : chunk + 1].reshape((-1, chunk + 1)), nl_lanes
+    )[:num_bands]
+    state_start = nl_lanes["state"][:, 0, :].reshape((2, -1, num_bands)).copy()
+    nl_chunks = calc_nl_run(
+        lanes[:, :, chunk:].reshape((-1, chunk + 1)), nl_lanes
+    ).reshape((num_chunks - 1, num_bands, chunk))
+    state_end = nl_lanes["state"][:, 0, :].reshape((2, -1, num_bands)).copy()
+
+    # Chunks whose initial state differs from the end of the preceding
+    # chunk are computed again (at least the first one of each band is
+    # then identical to the sample by sample calculation)
+    while True:
+        i_lane, i_band = np.nonzero(
+            np.any(state_start[:, 1:] != state_end[:, :-1], axis=0)
+        )
+        if i_lane.size == 0:
+            break
+        i_lane += 1
+        nl_lanes = calc_nl_init(i_lane.size, nl_lp["nl_iter"])
+        state_start[:, i_lane, i_band] = state_end[:, i_lane - 1, i_band]
+        nl_lanes["state"][:, 0, :] = state_start[:, i_lane, i_band]
+        nl_chunks[i_lane, i_band] = calc_nl_run(
+            lanes[i_lane, i_band, chunk:], nl_lanes
+        )
+        state_end[:, i_lane, i_band] = nl_lanes["state"][:, 0, :]
+
+    nl_loudness[:, chunk : num_chunks * chunk] = (
+        nl_chunks.transpose((1, 0, 2)).reshape((num_bands, -1))
+    )
+    # Remaining samples after the last chunk
+    nl_lp["state"][:, 0, :] = state_end[:, -1]
+    nl_loudness[:, num_chunks * chunk :] = calc_nl_run(
+        core_loudness[:, num_chunks * chunk :], nl_lp
+    )
+    return nl_loudness
+
+
+def calc_nl_run(core_loudness, nl_lp):
+    """Nonlinear temporal decay of core loudness samples, sample by sample
+
+    Parameters
+    ----------
+    core_loudness : numpy.ndarray
+        Core loudness (dim [bands, time]), the last sample is only used
+        as interpolation end point
+    nl_lp : dict
+        Parameters for non_linear temporal decay (see calc_nl_init),
+        updated in place
+
+    Outputs
+    -------
+    nl_loudness :  numpy.ndarray
+        Loudness with non linear temporal decay (dim [bands, time - 1])
+    """
+    nl_iter = nl_lp["nl_iter"]
+    num_bands, num_samples = core_loudness.shape
+    # Number of time samples interpolated at once
+    block_size = max(min(256, 2 ** 18 // max(num_bands, 1)), 1)
+    nl_loudness = np.zeros((num_bands, max(num_samples - 1, 0)))
+
+    for i_start in range(0, num_samples - 1, block_size):
+        i_stop = min(i_start + block_size, num_samples - 1)
+        # interpolation steps between current and next sample
+        ui = calc_nl_input(core_loudness[:, i_start : i_stop + 1], nl_iter)
+        for i_time in range(i_stop - i_start):
+            calc_nl_lp(ui[i_time, 0], nl_lp)
+            nl_loudness[:, i_start + i_time] = nl_lp["uo_last"]
 
             # inner iterations
-            for i_in in np.arange(1, nl_iter):
-                nl_lp = calc_nl_lp(ui, nl_lp)
-                ui += delta
-        nl_lp = calc_nl_lp(core_loudness[i_cl, i_time + 1], nl_lp)
-        nl_loudness[i_cl, i_time + 1] = nl_lp["uo_last"]
-    return core_loudness
+            for i_in in range(1, nl_iter):
+                calc_nl_lp(ui[i_time, i_in], nl_lp)
+    return nl_loudness
+
+
+def calc_nl_last(nl_lp):
+    """Nonlinear temporal decay of the last sample of the signal
+
+    Parameters
+    ----------
+    nl_lp : dict
+        Parameters for non_linear temporal decay (see calc_nl_init),
+        updated in place
+
+    Outputs
+    -------
+    nl_loudness :  numpy.ndarray
+        Loudness with non linear temporal decay of the sample kept by
+        calc_nl_block (dim [bands])
+    """
+    calc_nl_lp(nl_lp["cl_next"], nl_lp)
+    nl_lp["cl_next"] = None
+    return nl_lp["uo_last"].copy()
+
+
+def calc_nl_init(num_bands, nl_iter=NL_ITER):
+    """Initialize the parameters of the non linear temporal decay
+
+    Parameters
+    ----------
+    num_bands : int
+        Number of core loudness bands processed together
+    nl_iter : int
+        Factor for virtual upsampling/inner iterations
+
+    Outputs
+    -------
+    nl_lp : dict
+        Parameters for non_linear temporal decay (constants B, states
+        of capacitors C1 and C2, core loudness sample waiting for the
+        next block and work arrays)
+    """
+    # Constants B (precomputed for the default number of iterations)
+    if nl_iter == NL_ITER:
+        B = NL_B
+    else:
+        B = calc_nl_coefficients(nl_iter)
+    # States uo_last and u2_last are stored together so that the
+    # discharge candidates are computed with a single product:
+    # [uo * B[2] - u2 * B[3], uo * B[4] - u2 * 0, uo * B[0] - u2 * B[1]]
+    # (constants are stored as arrays to avoid scalar conversions at
+    # each step)
+    state = np.zeros((2, num_bands))
+    nl_lp = {
+        "nl_iter": nl_iter,
+        "cl_next": None,
+        "B": B,
+        "B_dis": np.array([[B[2], B[4], B[0]], [B[3], 0, B[1]]])[:, :, np.newaxis],
+        "B_charge": np.full(num_bands, B[5]),
+        "threshold": np.full(num_bands, 1e-5),
+        "state": state[:, np.newaxis, :],
+        "uo_last": state[0],
+        "u2_last": state[1],
+        "prod": np.zeros((2, 3, num_bands)),
+        "cand": np.zeros((3, num_bands)),
+        "u2_charge": np.zeros(num_bands),
+        "diff": np.zeros(num_bands),
+        "mask_1": np.zeros(num_bands, dtype=bool),
+        "mask_2": np.zeros(num_bands, dtype=bool),
+        "discharge": np.zeros(num_bands, dtype=bool),
+    }
+    return nl_lp
+
+
+def calc_nl_input(core_loudness, nl_iter=24):
+    """Linear interpolation of core loudness for the inner iterations
+
+    The interpolated values are accumulated (ui += delta) as in the
+    sample by sample implementation, so that the results are identical.
+
+    Parameters
+    ----------
+    core_loudness : numpy.ndarray
+        Core loudness (dim [bands, time]), the last sample is only used
+        as interpolation end point
+    nl_iter : int
+        Factor for virtual upsampling/inner iterations
+
+    Outputs
+    -------
+    ui : numpy.ndarray
+        Interpolated core loudness (dim [time - 1, nl_iter, bands])
+    """
+    num_bands, num_samples = core_loudness.shape
+    ui = np.empty((num_samples - 1, nl_iter, num_bands))
+    ui[:, 0, :] = core_loudness[:, :-1].T
+    ui[:, 1:, :] = ((core_loudness[:, 1:] - core_loudness[:, :-1]) / nl_iter).T[
+        :, np.newaxis, :
+    ]
+    return np.cumsum(ui, axis=1, out=ui)
 
 
 def calc_nl_lp(ui, nl_lp):
     """Calculates Uo(t) from Ui(t) using UoLast and U2Last
 
+    The four charge/discharge cases are evaluated for all the bands at
+    once, the states stored in nl_lp are updated in place.
+
     Parameters
     ----------
-    ui : float
-        TODO: description cf. standard
+    ui : numpy.ndarray
+        Core loudness per band
     nl_lp : dict
-        Parameters for non_linear temporal decay
+        Parameters for non_linear temporal decay (see calc_nl_init)
+
     Outputs
     -------
     nl_lp : dict
         Updated parameters for non_linear temporal decay
     """
-    if ui < nl_lp["uo_last"]:  # case 1 (discharge)
-        if nl_lp["uo_last"] > nl_lp["u2_last"]:  # case 1.1
-            u2 = nl_lp["uo_last"] * nl_lp["B"][0] - nl_lp["u2_last"] * nl_lp["B"][1]
-            uo = nl_lp["uo_last"] * nl_lp["B"][2] - nl_lp["u2_last"] * nl_lp["B"][3]
-            if uo < ui:  # uo can't become
-                uo = ui  # lower than ui
-            if u2 > uo:  # u2 can't become
-                u2 = uo  # higher than uo
-        else:  # case 1.2
-            uo = nl_lp["uo_last"] * nl_lp["B"][4]
-            if uo < ui:  # uo can't become
-                uo = ui  # lower than ui
-            u2 = uo
-    else:
-        if abs(ui - nl_lp["uo_last"] < 1e-5):  # case 2 (charge)
-            uo = ui
-            if uo > nl_lp["u2_last"]:  # case 2.1
-                u2 = (nl_lp["u2_last"] - ui) * nl_lp["B"][5] + ui
-            else:  # case 2.2
-                u2 = ui
-        else:
-            uo = ui
-            u2 = (nl_lp["u2_last"] - ui) * nl_lp["B"][5] + ui
+    uo_last = nl_lp["uo_last"]
+    u2_last = nl_lp["u2_last"]
+    u2 = nl_lp["u2_charge"]
+    cand = nl_lp["cand"]
+    mask_1 = nl_lp["mask_1"]
+    mask_2 = nl_lp["mask_2"]
+    discharge = nl_lp["discharge"]
+
+    # case 1 (discharge): candidates [uo (1.1), uo (1.2), u2 (1.1)]
+    np.less(ui, uo_last, out=discharge)
+    np.multiply(nl_lp["state"], nl_lp["B_dis"], out=nl_lp["prod"])
+    np.subtract(nl_lp["prod"][0], nl_lp["prod"][1], out=cand)
+    # uo can't become lower than ui
+    np.maximum(cand[:2], ui, out=cand[:2])
+    # u2 can't become higher than uo
+    np.minimum(cand[2], cand[0], out=cand[2])
+    # case 1.2 (uo_last <= u2_last): u2 = uo
+    np.less_equal(uo_last, u2_last, out=mask_1)
+    np.copyto(cand[::2], cand[1], where=mask_1)
+
+    # case 2 (charge)
+    np.subtract(u2_last, ui, out=u2)
+    np.multiply(u2, nl_lp["B_charge"], out=u2)
+    np.add(u2, ui, out=u2)
+    # case 2.2 (ui - uo_last < 1e-5 and uo <= u2_last): u2 = ui
+    np.subtract(ui, uo_last, out=nl_lp["diff"])
+    np.less(nl_lp["diff"], nl_lp["threshold"], out=mask_1)
+    np.less_equal(ui, u2_last, out=mask_2)
+    np.logical_and(mask_1, mask_2, out=mask_1)
+    np.copyto(u2, ui, where=mask_1)
+
     # Preparation for next step
-    nl_lp["uo_last"] = uo
-    nl_lp["u2_last"] = u2
+    np.copyto(uo_last, ui)
+    np.copyto(u2_last, u2)
+    np.copyto(nl_lp["state"][:, 0, :], cand[::2], where=discharge)
 
     return nl_lp
@@ -7,6 +7,21 @@
 # Standard library imports
 import numpy as np
 
+# Local application imports
+from mosqito.functions.loudness_zwicker.loudness_zwicker_constants import (
+    RANGE_LIM,
+    DLL,
+    LTQ,
+    MP1,
+    A0,
+    DDF,
+    DCB,
+    ZUP_LIMITS,
+    RNS,
+    USL,
+    Z_AXIS,
+)
+
 
 def calc_main_loudness(spec_third, field_type):
     """Calculate core loudness
@@ -21,10 +36,16 @@ def calc_main_loudness(spec_third, field_type):
     - f_calc_core_loudness
     - f_corr_loudness
 
+    The calculation is vectorized along the time axis so that the
+    whole third octave band levels matrix of a time-varying signal
+    can be processed in one call.
+
     Parameters
     ----------
     spec_third : numpy.ndarray
-        A third octave band spectrum [dB ref. 2e-5 Pa]
+        A third octave band spectrum [dB ref. 2e-5 Pa] (dim [28]) or
+        third octave band levels versus time (dim [28, time] or
+        [28, channels, time])
     field_type : str
         Type of soundfield correspondin to spec_third ("free" or
         "diffuse")
@@ -32,230 +53,236 @@ def calc_main_loudness(spec_third, field_type):
     Outputs
     -------
     nm :  numpy.ndarray
-        Core loudness
+        Core loudness (dim [21] or [21, time] or [21, channels, time])
     """
     #
-    # Date tables definition (variable names and description according to
-    # Zwicker:1991)
-    # Ranges of 1/3 octave band levels for correction at low frequencies
-    # according to equal loudness contours
-    rap = np.array([45, 55, 65, 71, 80, 90, 100, 120])
-    # Reduction of 1/3 octave band levels at low frequencies according to
-    # equal loudness contours within the eight ranges defined by RAP
-    dll = np.array(
-        [
-            (-32, -24, -16, -10, -5, 0, -7, -3, 0, -2, 0),
-            (-29, -22, -15, -10, -4, 0, -7, -2, 0, -2, 0),
-            (-27, -19, -14, -9, -4, 0, -6, -2, 0, -2, 0),
-            (-25, -17, -12, -9, -3, 0, -5, -2, 0, -2, 0),
-            (-23, -16, -11, -7, -3, 0, -4, -1, 0, -1, 0),
-            (-20, -14, -10, -6, -3, 0, -4, -1, 0, -1, 0),
-            (-18, -12, -9, -6, -2, 0, -3, -1, 0, -1, 0),
-            (-15, -10, -8, -4, -2, 0, -3, -1, 0, -1, 0),
-        ]
-    )
-    # Critical band level at absolute threshold without taking into
-    # account the transmission characteristics of the ear
-    ltq = np.array([30, 18, 12, 8, 7, 6, 5, 4, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3])
-    # Correction of levels according to the transmission characteristics
-    # of the ear
-    a0 = np.array(
-        [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -0.5, -1.6, -3.2, -5.4, -5.6, -4, -1.5, 2, 5, 12]
-    )
-    # Level difference between free and diffuse sound fields
-    ddf = np.array(
-        [
-            0,
-            0,
-            0.5,
-            0.9,
-            1.2,
-            1.6,
-            2.3,
-            2.8,
-            3,
-            2,
-            0,
-            -1.4,
-            -2,
-            -1.9,
-            -1,
-            0.5,
-            3,
-            4,
-            4.3,
-            4,
-        ]
-    )
-    # Adaptation of 1/3 oct. band levels to the corresponding critical
-    # band level
-    dcb = np.array(
-        [
-            -0.25,
-            -0.6,
-            -0.8,
-            -0.8,
-            -0.5,
-            0,
-            0.5,
-            1.1,
-            1.5,
-            1.7,
-            1.8,
-            1.8,
-            1.7,
-            1.6,
-            1.4,
-            1.2,
-            0.8,
-            0.5,
-            0,
-            -0.5,
-        ]
-    )
+    # Spectra are processed as columns of a [28, time] matrix
+    spec_third = np.asarray(spec_third, dtype=float)
+    spec_shape = spec_third.shape[1:]
+    spec_third = spec_third.reshape((spec_third.shape[0], -1))
     #
     # Correction of 1/3 oct. band levels according to equal loudness
     # contours 'xp' and calculation of the intensities for 1/3 oct.
     # bands up to 315 Hz
-    ti = np.zeros((dll.shape[1], 1))
-    for i in np.arange(dll.shape[1]):
-        j = 0
-        while spec_third[i] > rap[j] - dll[j, i] and j < dll.shape[0]:
-            j += 1
-        xp = spec_third[i] + dll[j, i]
-        ti[i] = np.power(10, (xp / 10))
+    # The range j is the first one whose upper limit rap[j] - dll[j, i]
+    # is not exceeded. As the limits increase with j, it is given by the
+    # number of exceeded limits (levels above the last range use the
+    # last correction).
+    j = np.sum(
+        spec_third[np.newaxis, : DLL.shape[1], :] > RANGE_LIM[:, :, np.newaxis],
+        axis=0,
+    )
+    j = np.minimum(j, DLL.shape[0] - 1)
+    xp = spec_third[: DLL.shape[1], :] + DLL[j, np.arange(DLL.shape[1])[:, np.newaxis]]
+    ti = np.power(10, (xp / 10))
 
     # Determination of levels LCB(1), LCB(2) and LCB(3) within the
     # first three critical bands
-    gi = np.zeros(3)
-    gi[0] = ti[0:6].sum()
-    gi[1] = ti[6:9].sum()
-    gi[2] = ti[9:11].sum()
-    lcb = np.zeros(3)
+    gi = np.zeros((3, spec_third.shape[1]))
+    gi[0] = ti[0:6].sum(axis=0)
+    gi[1] = ti[6:9].sum(axis=0)
+    gi[2] = ti[9:11].sum(axis=0)
+    lcb = np.zeros(gi.shape)
     lcb[gi > 0] = 10 * np.log10(gi[gi > 0])
 
     # Calculation of main loudness
     s = 0.25
-    nm = np.zeros(20)
-    le = spec_third[8:]
-    le = le.reshape((20))
+    nm = np.zeros((21, spec_third.shape[1]))
+    le = spec_third[8:].copy()
     le[0:3] = lcb
-    le = le - a0
+    le = le - A0[:, np.newaxis]
     if field_type == "diffuse":
-        le += ddf
-    i = le > ltq
-    le[i] -= dcb[i]
-    mp1 = 0.0635 * np.power(10, 0.025 * ltq[i])
+        le += DDF[:, np.newaxis]
+    i = le > LTQ[:, np.newaxis]
+    le -= np.where(i, DCB[:, np.newaxis], 0)
+    ltq = np.broadcast_to(LTQ[:, np.newaxis], le.shape)
+    mp1 = np.broadcast_to(MP1[:, np.newaxis], le.shape)[i]
     mp2 = np.power(1 - s + s * np.power(10, 0.1 * (le[i] - ltq[i])), 0.25) - 1
-    nm[i] = mp1 * mp2
+    nm[:20][i] = mp1 * mp2
     nm[nm < 0] = 0
-    nm = np.append(nm, 0)
     #
     # Correction of specific loudness in the lowest critical band
     # taking into account the dependance of absolute threshold
     # within this critical band
     korry = 0.4 + 0.32 * nm[0] ** 0.2
-    if korry <= 1:
-        nm[0] *= korry
-    return nm
+    nm[0] = np.where(korry <= 1, nm[0] * korry, nm[0])
+    return nm.reshape((nm.shape[0],) + spec_shape)
 
 
-def calc_slopes(nm):
-    """"""
-    # Upper limits of approximated critical bands in terms of critical
-    # band rate
-    zup = np.array(
-        [
-            0.9,
-            1.8,
-            2.8,
-            3.5,
-            4.4,
-            5.4,
-            6.6,
-            7.9,
-            9.2,
-            10.6,
-            12.3,
-            13.8,
-            15.2,
-            16.7,
-            18.1,
-            19.3,
-            20.6,
-            21.8,
-            22.7,
-            23.6,
-            24,
-        ]
+def calc_slopes(nm, dec_factor=1):
+    """Calculate specific loudness pattern and total loudness
+
+    Calculation of the specific loudness pattern and integration of
+    the total loudness by attaching slopes towards higher frequencies.
+    The state machine is evaluated for all the time frames at once,
+    each frame being advanced through the critical bands with its own
+    segment boundaries. A single spectrum is processed band by band
+    (see calc_slopes_spectrum), which is faster for one frame.
+
+    Parameters
+    ----------
+    nm : numpy.ndarray
+        Core loudness (dim [21] or [21, time] or [21, channels, time])
+    dec_factor : int
+        The specific loudness is only computed for one frame out of
+        dec_factor along the time axis (the total loudness is computed
+        for all frames)
+
+    Outputs
+    -------
+    N : float or numpy.ndarray
+        Total loudness [sones] (dim [time] or [channels, time] for
+        time-varying input)
+    N_specific : numpy.ndarray
+        Specific loudness [sones/bark] (dim [240] or
+        [240, ceil(time / dec_factor)] or
+        [240, channels, ceil(time / dec_factor)])
+    """
+    nm = np.asarray(nm, dtype=float)
+    if nm.ndim == 1:
+        return calc_slopes_spectrum(nm)
+    #
+    # Frames are processed as columns of a [21, time] matrix
+    frame_shape = nm.shape[1:]
+    num_times = frame_shape[-1]
+    num_spec_times = int(np.ceil(num_times / dec_factor))
+    nm = nm.reshape((nm.shape[0], -1))
+    num_frames = nm.shape[1]
+    frames = np.arange(num_frames)
+    # Column of N_specific corresponding to each frame (-1 if the
+    # specific loudness of the frame is not computed), frames of the
+    # channels being stored one after another
+    i_time = frames % max(num_times, 1)
+    spec_col = np.where(
+        i_time % dec_factor == 0,
+        frames // max(num_times, 1) * num_spec_times + i_time // dec_factor,
+        -1,
     )
-    # Range of specific loudness for the determination of the steepness
-    # of the upper slopes in the specific loudness - critical band rate
-    # pattern
-    rns = np.array(
-        [
-            21.5,
-            18,
-            15.1,
-            11.5,
-            9,
-            6.1,
-            4.4,
-            3.1,
-            2.13,
-            1.36,
-            0.82,
-            0.42,
-            0.30,
-            0.22,
-            0.15,
-            0.10,
-            0.035,
-            0,
-        ]
+    #
+    # Start values
+    j = np.zeros(num_frames, dtype=int)
+    N = np.zeros(num_frames)
+    z1 = np.zeros(num_frames)
+    n1 = np.zeros(num_frames)
+    iz = np.zeros(num_frames, dtype=int)
+    N_specific = np.zeros(
+        (int(24 / 0.1), int(np.prod(frame_shape[:-1])) * num_spec_times)
     )
-    # Steepness of the upper slopes in the specific loudness = Critical
-    # band rate pattern for the ranges 'rns' as a function of the number
-    # of the critical band
-    usl = np.array(
-        [
-            (13, 8.2, 6.3, 5.5, 5.5, 5.5, 5.5, 5.5),
-            (9, 7.5, 6, 5.1, 4.5, 4.5, 4.5, 4.5),
-            (7.8, 6.7, 5.6, 4.9, 4.4, 3.9, 3.9, 3.9),
-            (6.2, 5.4, 4.6, 4.0, 3.5, 3.2, 3.2, 3.2),
-            (4.5, 3.8, 3.6, 3.2, 2.9, 2.7, 2.7, 2.7),
-            (3.7, 3.0, 2.8, 2.35, 2.2, 2.2, 2.2, 2.2),
-            (2.9, 2.3, 2.1, 1.9, 1.8, 1.7, 1.7, 1.7),
-            (2.4, 1.7, 1.5, 1.35, 1.3, 1.3, 1.3, 1.3),
-            (1.95, 1.45, 1.3, 1.15, 1.1, 1.1, 1.1, 1.1),
-            (1.5, 1.2, 0.94, 0.86, 0.82, 0.82, 0.82, 0.82),
-            (0.72, 0.67, 0.64, 0.63, 0.62, 0.62, 0.62, 0.62),
-            (0.59, 0.53, 0.51, 0.50, 0.42, 0.42, 0.42, 0.42),
-            (0.40, 0.33, 0.26, 0.24, 0.24, 0.22, 0.22, 0.22),
-            (0.27, 0.21, 0.20, 0.18, 0.17, 0.17, 0.17, 0.17),
-            (0.16, 0.15, 0.14, 0.12, 0.11, 0.11, 0.11, 0.11),
-            (0.12, 0.11, 0.10, 0.08, 0.08, 0.08, 0.08, 0.08),
-            (0.09, 0.08, 0.07, 0.06, 0.06, 0.06, 0.06, 0.05),
-            (0.06, 0.05, 0.03, 0.02, 0.02, 0.02, 0.02, 0.02),
-        ]
+    #
+    # Step to first and subsequent critical bands
+    zup = ZUP_LIMITS
+    for i in np.arange(21):
+        ig = i - 1
+        if ig > 7:
+            ig = 7
+        # Frames for which the critical band is not completed
+        act = np.nonzero(z1 < zup[i])[0]
+        while act.size > 0:
+            n1_a = n1[act]
+            z1_a = z1[act]
+            nm_a = nm[i, act]
+            #
+            # Determination of the number j corresponding to the range
+            # of specific loudness (where n1 < nm)
+            j_a = np.where(
+                n1_a < nm_a, np.sum(RNS[:17, np.newaxis] > nm_a, axis=0), j[act]
+            )
+            #
+            # Unmasked main loudness (where n1 <= nm)
+            unmasked = n1_a <= nm_a
+            #
+            # Decision wether the critical band in question is completely
+            # or partially masked by accessory loudness (where n1 > nm)
+            slope = USL[j_a, ig]
+            n2 = RNS[j_a]
+            n2 = np.where(n2 < nm_a, nm_a, n2)
+            dz = (n1_a - n2) / slope
+            z2 = z1_a + dz
+            is_up = z2 > zup[i]
+            z2[is_up] = zup[i]
+            dz[is_up] = z2[is_up] - z1_a[is_up]
+            n2[is_up] = n1_a[is_up] - dz[is_up] * slope[is_up]
+            #
+            # Contribution of unmasked main loudness or accessory
+            # loudness to total loudness
+            N[act] = np.where(
+                unmasked, N[act] + nm_a * (zup[i] - z1_a), N[act] + dz * (n1_a + n2) / 2
+            )
+            n2[unmasked] = nm_a[unmasked]
+            z2[unmasked] = zup[i]
+            #
+            # Calculation of values N_specific(iz) with a spacing of
+            # z = iz * 0.1 bark
+            iz_a = iz[act]
+            iz_end = np.maximum(iz_a, np.searchsorted(Z_AXIS, z2, side="left"))
+            # (all the values of the segments at once: frame index f and
+            # critical band rate index iz of each value)
+            num_fill = np.where(spec_col[act] >= 0, iz_end - iz_a, 0)
+            fill = np.arange(np.max(num_fill)) < num_fill[:, np.newaxis]
+            f, k = np.nonzero(fill)
+            if f.size > 0:
+                iz_f = iz_a[f] + k
+                N_specific[iz_f, spec_col[act[f]]] = np.where(
+                    unmasked[f],
+                    nm_a[f],
+                    n1_a[f] - (Z_AXIS[iz_f] - z1_a[f]) * slope[f],
+                )
+            iz[act] = iz_end
+            #
+            # Step to next segment
+            j[act] = np.maximum(j_a, np.sum(RNS[:17, np.newaxis] >= n2, axis=0))
+            z1[act] = z2
+            n1[act] = n2
+            act = act[z2 < zup[i]]
+    #
+    # Final correction
+    N[N < 0] = 0
+    N = np.where(
+        N <= 16, np.floor(N * 1000 + 0.5) / 1000, np.floor(N * 100 + 0.5) / 100
     )
+    N = N.reshape(frame_shape)
+    N_specific = N_specific.reshape(
+        (N_specific.shape[0],) + frame_shape[:-1] + (num_spec_times,)
+    )
+
+    return N, N_specific
+
+
+def calc_slopes_spectrum(nm):
+    """Calculate specific loudness pattern and total loudness of a
+    single spectrum
+
+    Band by band evaluation of the state machine of calc_slopes, on
+    Python floats.
 
+    Parameters
+    ----------
+    nm : numpy.ndarray
+        Core loudness (dim [21])
+
+    Outputs
+    -------
+    N : float
+        Total loudness [sones]
+    N_specific : numpy.ndarray
+        Specific loudness [sones/bark] (dim [240])
+    """
+    nm = nm.tolist()
+    rns = RNS.tolist()
+    usl = USL.tolist()
+    zup = ZUP_LIMITS.tolist()
     #
     # Start values
     j = 0
     N = 0
     z1 = 0
     n1 = 0
-    iz = 0
     z = 0.1
-    N_specific = np.zeros(int(24 / 0.1))
+    spec = []
     #
     # Step to first and subsequent critical bands
-    for i in np.arange(21):
-        zup[i] += 0.0001
-        ig = i - 1
-        if ig > 7:
-            ig = 7
+    for i in range(21):
+        ig = min(i - 1, 7)
         while z1 < zup[i]:
             if n1 <= nm[i]:
                 if n1 < nm[i]:
@@ -273,8 +300,7 @@ def calc_slopes(nm):
                 n2 = nm[i]
                 N = N + n2 * (z2 - z1)
                 while z < z2:
-                    N_specific[iz] = n2
-                    iz += 1
+                    spec.append(n2)
                     z += 0.1
             else:
                 #
@@ -283,25 +309,22 @@ def calc_slopes(nm):
                 n2 = rns[j]
                 if n2 < nm[i]:
                     n2 = nm[i]
-                dz = (n1 - n2) / usl[j, ig]
+                dz = (n1 - n2) / usl[j][ig]
                 z2 = z1 + dz
                 if z2 > zup[i]:
                     z2 = zup[i]
                     dz = z2 - z1
-                    n2 = n1 - dz * usl[j, ig]
+                    n2 = n1 - dz * usl[j][ig]
                 #
                 # Contribution of accessory loudness to total loudness
                 N = N + dz * (n1 + n2) / 2
                 while z < z2:
-                    N_specific[iz] = n1 - (z - z1) * usl[j, ig]
-                    iz += 1
+                    spec.append(n1 - (z - z1) * usl[j][ig])
                     z += 0.1
             #
             # Step to next segment
             while n2 <= rns[j] and j < 17:
                 j += 1
-            if n2 <= rns[j] and j >= 17:
-                j = 17
             z1 = z2
             n1 = n2
     #
@@ -312,5 +335,7 @@ def calc_slopes(nm):
         N = np.floor(N * 1000 + 0.5) / 1000
     else:
         N = np.floor(N * 100 + 0.5) / 100
+    N_specific = np.zeros(int(24 / 0.1))
+    N_specific[: len(spec)] = spec
 
     return N, N_specific
@@ -12,6 +12,9 @@ from mosqito.functions.loudness_zwicker.loudness_zwicker_shared import (
     calc_main_loudness,
 )
 from mosqito.functions.loudness_zwicker.loudness_zwicker_shared import calc_slopes
+from mosqito.functions.loudness_zwicker.loudness_zwicker_constants import (
+    THIRD_OCTAVE_FREQ,
+)
 
 
 def loudness_zwicker_stationary(spec_third, third_axis=[], field_type="free"):
@@ -49,43 +52,17 @@ def loudness_zwicker_stationary(spec_third, third_axis=[], field_type="free"):
     """
     #
     # Input parameters control and formating
-    fr = [
-        25,
-        31.5,
-        40,
-        50,
-        63,
-        80,
-        100,
-        125,
-        160,
-        200,
-        250,
-        315,
-        400,
-        500,
-        630,
-        800,
-        1000,
-        1250,
-        1600,
-        2000,
-        2500,
-        3150,
-        4000,
-        5000,
-        6300,
-        8000,
-        10000,
-        12500,
-    ]
+    # Spectrum given as a column vector (e.g. output of oct3spec)
+    spec_third = np.asarray(spec_third).ravel()
     if field_type != "diffuse" and field_type != "free":
         raise ValueError("ERROR: field_type should be either 'diffuse' or 'free'")
     if len(spec_third) != 28:
         raise ValueError("ERROR: spectrum must contains 28 third octave bands values")
     if len(third_axis) == 0:
-        third_axis = fr
-    elif (len(third_axis) == 28 and np.all(third_axis != fr)) or len(third_axis) < 28:
+        third_axis = THIRD_OCTAVE_FREQ
+    elif (
+        len(third_axis) == 28 and np.all(third_axis != THIRD_OCTAVE_FREQ)
+    ) or len(third_axis) < 28:
         raise ValueError(
             """ERROR: third_axis does not contains 1/3 oct between 25 and 
             12.5 kHz. Check the input parameters"""
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from mosqito.functions.loudness_zwicker.loudness_zwicker_shared import (
+    calc_main_loudness,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_shared import calc_slopes
+from mosqito.functions.loudness_zwicker.loudness_zwicker_constants import (
+    THIRD_OCTAVE_FREQ,
+)
+
+
+def loudness_zwicker_stationary_batch(spec_third, third_axis=[], field_type="free"):
+    """Zwicker-loudness calculation for a batch of stationary spectra
+
+    Same calculation as loudness_zwicker_stationary for K third octave
+    band spectra at once: the main loudness and the slopes are computed
+    for all the spectra together.
+
+    Parameters
+    ----------
+    spec_third : numpy.ndarray
+        Third octave band spectra [dB ref. 2e-5 Pa] (dim [28, K])
+    third_axis : numpy.ndarray
+        Normalized center frequency of third octave bands [Hz]
+    field_type : str
+        Type of soundfield corresponding to spec_third ("free" by
+        default or "diffuse")
+
+    Outputs
+    -------
+    N : numpy.ndarray
+        Calculated loudness [sones] (dim [K])
+    N_specific : numpy.ndarray
+        Specific loudness [sones/bark] (dim [240, K])
+    """
+    #
+    # Input parameters control
+    spec_third = np.asarray(spec_third, dtype=float)
+    if field_type != "diffuse" and field_type != "free":
+        raise ValueError("ERROR: field_type should be either 'diffuse' or 'free'")
+    if spec_third.ndim != 2 or spec_third.shape[0] != 28:
+        raise ValueError(
+            "ERROR: spectra must be given as a matrix of 28 third octave bands values x K"
+        )
+    if len(third_axis) != 0 and (
+        len(third_axis) != 28 or np.any(np.asarray(third_axis) != THIRD_OCTAVE_FREQ)
+    ):
+        raise ValueError(
+            """ERROR: third_axis does not contains 1/3 oct between 25 and
+            12.5 kHz. Check the input parameters"""
+        )
+    #
+    # Calculate main loudness
+    Nm = calc_main_loudness(spec_third, field_type)
+    #
+    # Calculation of specific loudness pattern and integration of overall
+    # loudness by attaching slopes towards higher frequencies
+    N, N_specific = calc_slopes(Nm)
+
+    return N, N_specific
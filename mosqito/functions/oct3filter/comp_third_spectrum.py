@@ -15,7 +15,7 @@ from mosqito.functions.oct3filter.calc_third_octave_levels import (
 from mosqito.functions.oct3filter.oct3spec import oct3spec
 
 
-def comp_third_spec(is_stationary, signal, fs):
+def comp_third_spec(is_stationary, signal, fs, method="time"):
     """Third-octave band spectrum calculation, with the corresponding
     bands center frequencies
 
@@ -24,21 +24,26 @@ def comp_third_spec(is_stationary, signal, fs):
     is_stationary: boolean
         TRUE if the signal is stationary, FALSE if it is time-varying
     signal : numpy.array
-        time signal values
+        time signal values (for time-varying signals, dim [time] or
+        [channels, time])
     fs : integer
         sampling frequency
-
+    method : string
+        for stationary signals, 'time' (by default, filter bank) or 'fft'
+        (power spectrum integrated over the filter responses), see
+        oct3spec
 
     Outputs
     --------
     spec_third : numpy.ndarray
-        Third octave band spectrum of signal sig [dB re.2e-5 Pa]
+        Third octave band spectrum of signal sig [dB re.2e-5 Pa] (for
+        multichannel time-varying signals, dim [channels, 28, time])
     spec_third_freq : numpy.ndarray
         Corresponding third octave bands center frequencies
     """
 
     if is_stationary == True:
-        spec_third, third_axis = oct3spec(signal, fs)
+        spec_third, third_axis = oct3spec(signal, fs, method=method)
         time_axis = []
     elif is_stationary == False:
         spec_third, third_axis, time_axis = calc_third_octave_levels(signal, fs)
@@ -7,14 +7,18 @@
 import math
 from scipy import signal
 
+# Local application imports
+from mosqito.functions.shared.filter_cache import cached_design
 
+
+@cached_design
 def oct3dsgn(fc, fs, n=3):
     """Design of a one-third-octave filter
 
     Designs a digital 1/3-octave filter with center frequency fc for
     sampling frequency fs. The filter is designed according to the
     Order-N specification of the ANSI S1.1-1986 standard. Default
-    value for N is 3.
+    value for N is 3. The designs are cached (see filter_cache).
 
     References:
         ANSI S1.1-1986 (ASA 65-1986): Specifications for
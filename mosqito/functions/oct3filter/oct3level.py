@@ -6,6 +6,7 @@
 
 
 # Standard library imports
+import functools
 import numpy as np
 from scipy import signal
 
@@ -57,7 +58,7 @@ def oct3level(sig, fs, fc, sig_type="stationary", dec_factor=24):
             verify: fc <= 0.88 * (fs / 2)"""
         )
     # Check if dec_factor is a divisor of fs
-    fs_divisor = [n for n in range(1, (fs + 1)) if fs % n == 0]
+    fs_divisor = oct3divisors(fs)
     if (sig_type != "stationary") and (not dec_factor in fs_divisor):
         raise ValueError(
             """ERROR: Design not possible. Time decimation factor shall
@@ -71,16 +72,9 @@ def oct3level(sig, fs, fc, sig_type="stationary", dec_factor=24):
         dec_factors = fs_divisor
     else:
         dec_factors = [n for n in fs_divisor if dec_factor % n == 0]
-    for i in dec_factors:
-        fs_sub = fs / i
-        if fs_sub / fc < 200:
-            break
+    i = oct3dec(fs, fc, dec_factors)
+    fs_sub = fs / i
     dec_factor = int(dec_factor / i)
-    if i == dec_factors[-1] and fs_sub / fc >= 200:
-        raise ValueError(
-            """ERROR: Design not possible. No time decimation factor that 
-            satisfies fs_sub / (fc) > 200 have been found"""
-        )
     # Generate the 1/3 oct. digital filter
     b, a = oct3dsgn(fc, fs_sub, n=3)
     # Downsample the signal
@@ -92,12 +86,61 @@ def oct3level(sig, fs, fc, sig_type="stationary", dec_factor=24):
         # Calculate overall rms level
         level = np.sqrt(sum(sig_filt ** 2) / len(sig_filt))
     else:
-        # Calculate rms level versus time
-        n_level = int(np.floor(sig_filt.shape[0] / dec_factor))
-        sig_reshaped = sig_filt[: dec_factor * n_level].reshape((n_level, dec_factor))
-        level = np.sqrt(np.mean(sig_reshaped ** 2, 1))
-        if sig_filt.shape[0] % dec_factor != 0:
-            level = np.append(
-                level, np.sqrt(np.mean(sig_filt[dec_factor * n_level :] ** 2))
-            )
+        # Calculate rms level versus time (the squared signal is summed
+        # over each frame of dec_factor samples, the last one being
+        # possibly shorter, without copying it frame by frame)
+        starts = np.arange(0, sig_filt.shape[0], dec_factor)
+        lengths = np.minimum(starts + dec_factor, sig_filt.shape[0]) - starts
+        level = np.sqrt(np.add.reduceat(sig_filt ** 2, starts) / lengths)
     return level
+
+
+@functools.lru_cache()
+def oct3divisors(fs):
+    """Divisors of the sampling frequency (candidate decimation factors)
+
+    Parameters
+    ----------
+    fs : int
+        Sampling frequency [Hz]
+
+    Outputs
+    -------
+    fs_divisor : tuple
+        Divisors of fs, in increasing order
+    """
+    low = [n for n in range(1, int(fs ** 0.5) + 1) if fs % n == 0]
+    high = [fs // n for n in reversed(low) if fs // n != n]
+    return tuple(low + high)
+
+
+def oct3dec(fs, fc, dec_factors):
+    """Decimation factor of the signal before third octave filtering
+
+    The first of the candidate factors leading to a sampling frequency
+    fs_sub that verifies fs_sub / fc < 200 is chosen.
+
+    Parameters
+    ----------
+    fs : float
+        Sampling frequency [Hz]
+    fc : float
+        Filter exact center frequency [Hz]
+    dec_factors : list
+        Candidate decimation factors, in increasing order
+
+    Outputs
+    -------
+    dec_factor : int
+        Decimation factor
+    """
+    for i in dec_factors:
+        fs_sub = fs / i
+        if fs_sub / fc < 200:
+            break
+    if i == dec_factors[-1] and fs_sub / fc >= 200:
+        raise ValueError(
+            """ERROR: Design not possible. No time decimation factor that 
+            satisfies fs_sub / (fc) > 200 have been found"""
+        )
+    return i
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard library imports
+import numpy as np
+from scipy import signal
+
+# Local application imports
+from mosqito.functions.oct3filter.oct3dsgn import oct3dsgn
+from mosqito.functions.oct3filter.oct3level import oct3dec
+from mosqito.functions.oct3filter.oct3tree import (
+    oct3tree_factors,
+    oct3tree_gain,
+)
+
+
+def oct3level_fft(spec_power, freqs, fs, fc, dec_factors=None):
+    """Calculate rms level of a stationary signal in the third octave
+    band fc from its power spectrum
+
+    The power spectrum is weighted by the squared magnitude response of
+    the filter used by oct3spec (same design, same sampling frequency
+    after decimation, including the anti-aliasing filters of the stages
+    of the octave decimation tree) and integrated over frequency.
+
+    Parameters
+    ----------
+    spec_power : numpy.ndarray
+        One-sided power spectrum of the time signal [any unit ** 2] (sum
+        equal to the mean square value of the signal)
+    freqs : numpy.ndarray
+        Frequencies of spec_power [Hz]
+    fs : float
+        Sampling frequency [Hz]
+    fc : float
+        Filter exact center frequency [Hz]
+    dec_factors : list
+        Decimation factors of the levels of the octave decimation tree
+        (see oct3tree_factors, by default the tree down to fc)
+
+    Outputs
+    -------
+    level : float
+        Rms level of the signal in the third octave band centered on fc
+    """
+    # Check for Nyquist-Shannon criteria
+    if fc > 0.88 * (fs / 2):
+        raise ValueError(
+            """ERROR: Design not possible. Filter center frequency shall
+            verify: fc <= 0.88 * (fs / 2)"""
+        )
+    # Sampling frequency of the filter (see oct3spec)
+    if dec_factors is None:
+        dec_factors = oct3tree_factors(fs, fc)
+    dec_factor = oct3dec(fs, fc, dec_factors)
+    fs_sub = fs / dec_factor
+    # Frequencies kept by the decimation
+    in_band = freqs < fs_sub / 2
+    freqs = freqs[in_band]
+    # Squared magnitude response of the 1/3 oct. filter
+    b, a = oct3dsgn(fc, fs_sub, n=3)
+    _, h = signal.freqz(b, a, worN=freqs, fs=fs_sub)
+    gain = np.abs(h) ** 2
+    # Anti-aliasing filters of the stages of the tree down to dec_factor
+    # (scipy.signal.decimate: Chebyshev type I filter applied forward and
+    # backward, passband gain compensated from the second stage)
+    for i, (factor_prev, factor) in enumerate(zip(dec_factors[:-1], dec_factors[1:])):
+        if factor > dec_factor:
+            break
+        b, a = signal.cheby1(8, 0.05, 0.8 / (factor // factor_prev))
+        _, h = signal.freqz(b, a, worN=freqs, fs=fs / factor_prev)
+        gain *= np.abs(h) ** 4
+        if i > 0:
+            gain /= oct3tree_gain(factor // factor_prev) ** 2
+    return np.sqrt(np.sum(spec_power[in_band] * gain))
+
+
+def oct3power_cells(spec_power, freqs, n_cells=200):
+    """Gather a power spectrum into cells of constant relative bandwidth
+
+    The bins of a long signal spectrum are much narrower than the
+    variations of the third octave filter responses: they are summed in
+    cells of 1 / n_cells octave, located at the power-weighted mean
+    frequency of their bins (exact for a pure tone), so that the filter
+    responses are evaluated a few thousand times instead of once per
+    bin.
+
+    Parameters
+    ----------
+    spec_power : numpy.ndarray
+        One-sided power spectrum of the time signal [any unit ** 2]
+    freqs : numpy.ndarray
+        Frequencies of spec_power, in increasing order [Hz]
+    n_cells : int
+        Number of cells per octave
+
+    Outputs
+    -------
+    cell_power : numpy.ndarray
+        Power of the cells [any unit ** 2]
+    cell_freqs : numpy.ndarray
+        Frequencies of the cells [Hz]
+    """
+    # Cell index of each bin (the bin at 0 Hz, if any, is kept apart)
+    i_cells = np.zeros(freqs.shape, dtype=int)
+    is_pos = freqs > 0
+    i_cells[is_pos] = 1 + np.floor(
+        n_cells * np.log2(freqs[is_pos] / freqs[is_pos][0])
+    ).astype(int)
+    # Bins are sorted: the cells are contiguous ranges of bins
+    i_starts = np.flatnonzero(np.diff(i_cells, prepend=-1))
+    cell_power = np.add.reduceat(spec_power, i_starts)
+    cell_freqs = np.add.reduceat(spec_power * freqs, i_starts)
+    n_bins = np.diff(np.append(i_starts, freqs.size))
+    mean_freqs = np.add.reduceat(freqs, i_starts) / n_bins
+    has_power = cell_power > 0
+    cell_freqs[has_power] /= cell_power[has_power]
+    cell_freqs[~has_power] = mean_freqs[~has_power]
+    return cell_power, cell_freqs
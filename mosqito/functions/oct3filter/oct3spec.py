@@ -6,16 +6,36 @@
 
 # Standard library imports
 import numpy as np
+from scipy import signal
 
 # Local application imports
-from mosqito.functions.oct3filter.oct3level import oct3level
+from mosqito.functions.oct3filter.oct3level import oct3level, oct3dec
+from mosqito.functions.oct3filter.oct3level_fft import (
+    oct3level_fft,
+    oct3power_cells,
+)
+from mosqito.functions.oct3filter.oct3tree import oct3tree, oct3tree_factors
 
 
-def oct3spec(sig, fs, fc_min=20, fc_max=20000, sig_type="stationary", dec_factor=24):
+def oct3spec(
+    sig,
+    fs,
+    fc_min=20,
+    fc_max=20000,
+    sig_type="stationary",
+    dec_factor=24,
+    method="time",
+):
     """Calculate third-octave band spectrum
 
     Calculate the rms level of the signal "sig" sampled at freqency "fs"
-    for each third octave band between "fc_min" and "fc_max".
+    for each third octave band between "fc_min" and "fc_max". The low
+    bands are filtered at reduced sampling rates, each decimated signal
+    being computed once for all the bands by an octave decimation tree
+    (see oct3tree). For time-varying signals, the bands keep the
+    decimation factors of oct3level (divisors of dec_factor, which do not
+    nest): each decimated signal is computed once from the full rate
+    signal, and the levels are identical to the ones of oct3level.
 
     Parameters
     ----------
@@ -39,6 +59,20 @@ def oct3spec(sig, fs, fc_min=20, fc_max=20000, sig_type="stationary", dec_factor
         (dim [freq, time]) filtered time signals per third octave band
     fs_level : int
         RMS vs. time (pseudo-)sampling frequency.
+    method : str
+        Calculation method of the levels ("time" by default or "fft"):
+        "time" filters the signal for each band (see oct3level), "fft"
+        integrates the power spectrum of the signal over the magnitude
+        response of the same filters (see oct3level_fft, stationary
+        signals only). On the ISO 532-1 stationary test signals, the
+        "fft" levels differ from the "time" levels by less than 0.15 dB
+        for noises of 10 s, and by less than 0.5 dB for pure tones in the
+        bands less than 40 dB below the highest band. Larger differences
+        occur in the lowest bands of short signals (3.5 dB at 40 Hz for a
+        1 s pink noise), where the filter transients of the "time" method
+        are not negligible. The stationary loudness differs by less than
+        0.2 %. The "fft" method is 10 times faster on a 10 s signal and
+        20 times faster on a 60 s signal (see validation_oct3spec_fft.py).
 
     Outputs
     -------
@@ -48,6 +82,71 @@ def oct3spec(sig, fs, fc_min=20, fc_max=20000, sig_type="stationary", dec_factor
         Corresponding preferred third octave band center frequencies
     """
 
+    fexact, fpref = oct3bands(fc_min, fc_max)
+
+    # Calculation of the rms level of the signal in each band
+    if sig_type == "stationary":
+        spec = np.zeros((len(fexact), 1))
+    else:
+        n_level = int(np.ceil(sig.shape[0] / dec_factor))
+        spec = np.zeros((len(fexact), n_level))
+    # Decimation factors of the levels of the octave decimation tree
+    # shared by the bands
+    tree_factors = oct3tree_factors(fs, fexact[0], sig_type, dec_factor)
+    if method == "fft":
+        if sig_type != "stationary":
+            raise ValueError(
+                "ERROR: method 'fft' is only available for stationary signals"
+            )
+        # Power spectrum of the whole signal, shared by all the bands
+        freqs, spec_power = signal.periodogram(
+            sig, fs, window="boxcar", detrend=False, scaling="spectrum"
+        )
+        spec_power, freqs = oct3power_cells(spec_power, freqs)
+        for i, fc in enumerate(fexact):
+            spec[i, :] = oct3level_fft(spec_power, freqs, fs, fc, tree_factors)
+    elif method == "time":
+        # Each decimated signal is computed once and each band is
+        # filtered at the first level of the tree verifying fs_sub / fc < 200
+        if sig_type == "stationary":
+            sig_tree = oct3tree(sig, tree_factors)
+        else:
+            # (time-varying levels: each factor used by the bands is
+            # applied to the full rate signal, as by oct3level)
+            sig_tree = {
+                factor: signal.decimate(sig, factor) if factor > 1 else sig
+                for factor in {oct3dec(fs, fc, tree_factors) for fc in fexact}
+            }
+        for i, fc in enumerate(fexact):
+            factor = oct3dec(fs, fc, tree_factors)
+            spec[i, :] = oct3level(
+                sig_tree[factor], fs // factor, fc, sig_type, dec_factor // factor
+            )
+    else:
+        raise ValueError("ERROR: method should be either 'time' or 'fft'")
+
+    spec = 20 * np.log10((spec + 1e-12) / (2 * 10 ** -5))
+    return spec, fpref
+
+
+def oct3bands(fc_min=20, fc_max=20000):
+    """Third octave bands between fc_min and fc_max
+
+    Parameters
+    ----------
+    fc_min : float
+        Filter center frequency of the lowest 1/3 oct. band [Hz]
+    fc_max : float
+        Filter center frequency of the highest 1/3 oct. band [Hz]
+
+    Outputs
+    -------
+    fexact : numpy.ndarray
+        Exact center frequencies of the bands [Hz]
+    fpref : numpy.ndarray
+        Corresponding preferred center frequencies [Hz]
+    """
+
     # TODO: control that fc_min and fc_max are in the right range
     # TODO: smarter management of the frequencies by using the ANSI
     #       definitions (with base 10 and base 2 options)
@@ -123,17 +222,4 @@ def oct3spec(sig, fs, fc_min=20, fc_max=20000, sig_type="stationary", dec_factor
     fpref = fpref[fpref >= fc_min]
     fexact = fexact[fpref <= fc_max]
     fpref = fpref[fpref <= fc_max]
-
-    # Calculation of the rms level of the signal in each band
-    if sig_type == "stationary":
-        spec = np.zeros((len(fexact), 1))
-    else:
-        n_level = int(np.ceil(sig.shape[0] / dec_factor))
-        spec = np.zeros((len(fexact), n_level))
-    i = 0
-    for fc in fexact:
-        spec[i, :] = oct3level(sig, fs, fc, sig_type, dec_factor)
-        i += 1
-
-    spec = 20 * np.log10((spec + 1e-12) / (2 * 10 ** -5))
-    return spec, fpref
+    return fexact, fpref
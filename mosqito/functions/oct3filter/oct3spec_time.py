@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+from scipy import signal
+
+# Local application imports
+from mosqito.functions.oct3filter.oct3dsgn import oct3dsgn
+from mosqito.functions.oct3filter.oct3level import oct3dec
+from mosqito.functions.oct3filter.oct3spec import oct3bands
+from mosqito.functions.oct3filter.oct3tree import oct3tree, oct3tree_factors
+
+# Time constants of the exponential averagings [s]
+TIME_CONSTANTS = {"fast": 0.125, "slow": 1.0}
+
+
+def oct3spec_time(
+    sig, fs, fc_min=20, fc_max=20000, time_resolution=0.125, averaging="fast"
+):
+    """Calculate third-octave band levels versus time
+
+    The signal is filtered in each third octave band at the level of the
+    octave decimation tree shared by the bands (see oct3tree), squared
+    and averaged:
+    - "fast" or "slow": exponential averaging with a time constant of
+      0.125 s or 1 s (as a sound level meter), sampled at the end of each
+      frame,
+    - "linear": mean over each frame.
+    The frames are time_resolution long for all the bands and all the
+    sampling frequencies: their boundaries are located at each level of
+    the tree (not necessarily on an integer number of samples) and the
+    averages are computed on views of the squared signal (see
+    numpy.add.reduceat), without copying it frame by frame. The last
+    frame may be shorter. When time_resolution is shorter than the
+    sampling period of a decimated signal, the frames containing no
+    sample of it hold the value of the last sample before their end. The
+    bands higher than 0.88 * fs / 2 are ignored.
+
+    Parameters
+    ----------
+    sig : numpy.ndarray
+        time signal [Pa]
+    fs : int
+        Sampling frequency [Hz]
+    fc_min : float
+        Filter center frequency of the lowest 1/3 oct. band [Hz]
+    fc_max : float
+        Filter center frequency of the highest 1/3 oct. band [Hz]
+    time_resolution : float
+        Duration of the frames [s]
+    averaging : str
+        Time averaging of the squared band signals ("fast" by default,
+        "slow" or "linear")
+
+    Outputs
+    -------
+    spec : numpy.ndarray
+        Third octave band levels of signal sig [dB re.2e-5 Pa]
+        (dim [bands, frames])
+    fpref : numpy.ndarray
+        Corresponding preferred third octave band center frequencies
+    time_axis : numpy.ndarray
+        Time at the end of each frame [s]
+    """
+    if averaging not in ["fast", "slow", "linear"]:
+        raise ValueError(
+            "ERROR: averaging should be either 'fast', 'slow' or 'linear'"
+        )
+    if time_resolution <= 0:
+        raise ValueError("ERROR: time resolution shall be positive")
+    fexact, fpref = oct3bands(fc_min, fc_max)
+    fpref = fpref[fexact <= 0.88 * (fs / 2)]
+    fexact = fexact[fexact <= 0.88 * (fs / 2)]
+
+    # Frames boundaries at the full sampling rate [samples]
+    n_samples = sig.shape[0]
+    hop = time_resolution * fs
+    n_frames = int(np.ceil(n_samples / hop))
+    bounds = np.minimum(np.arange(n_frames + 1) * hop, n_samples)
+    time_axis = bounds[1:] / fs
+
+    # Decimated signals shared by the bands (octave decimation tree)
+    tree_factors = oct3tree_factors(fs, fexact[0])
+    sig_tree = oct3tree(sig, tree_factors)
+
+    spec = np.zeros((len(fexact), n_frames))
+    for i, fc in enumerate(fexact):
+        factor = oct3dec(fs, fc, tree_factors)
+        fs_sub = fs / factor
+        sig_sub = sig_tree[factor]
+        # Frames boundaries at the level of the tree
+        bounds_sub = np.ceil(bounds / factor).astype(int)
+        bounds_sub[-1] = sig_sub.shape[0]
+        b, a = oct3dsgn(fc, fs_sub, n=3)
+        power = signal.lfilter(b, a, sig_sub) ** 2
+        if averaging == "linear":
+            lengths = np.diff(bounds_sub)
+            starts = np.minimum(bounds_sub[:-1], sig_sub.shape[0] - 1)
+            spec[i, :] = np.add.reduceat(power, starts) / np.maximum(lengths, 1)
+            # (frames without any sample at this level hold the last
+            # sample before their end, as the exponential averagings)
+            empty = lengths == 0
+            spec[i, empty] = power[np.maximum(bounds_sub[1:][empty] - 1, 0)]
+        else:
+            alpha = np.exp(-1 / (TIME_CONSTANTS[averaging] * fs_sub))
+            power = signal.lfilter([1 - alpha], [1, -alpha], power)
+            spec[i, :] = power[np.maximum(bounds_sub[1:] - 1, 0)]
+
+    spec = 20 * np.log10((np.sqrt(spec) + 1e-12) / (2 * 10 ** -5))
+    return spec, fpref, time_axis
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+from scipy import signal
+
+# Local application imports
+from mosqito.functions.oct3filter.oct3level import oct3divisors, oct3dec
+
+
+def oct3tree_factors(fs, fc_min, sig_type="stationary", dec_factor=24):
+    """Decimation factors of the levels of an octave decimation tree
+
+    For stationary signals, each level is decimated from the previous one
+    by the smallest possible ratio (2 when possible), down to the level
+    needed by the lowest third octave band (fs_sub / fc_min < 200, see
+    oct3level). For time-varying signals, the factors are the divisors of
+    dec_factor tried by oct3level, up to the one needed by the lowest
+    band, so that each band is filtered at the same sampling frequency as
+    with oct3level (they do not nest, see oct3spec).
+
+    Parameters
+    ----------
+    fs : int
+        Sampling frequency [Hz]
+    fc_min : float
+        Exact center frequency of the lowest third octave band [Hz]
+    sig_type : str
+        Type of signal ('stationary' or 'time-varying')
+    dec_factor : int
+        Time signal to RMS vs. time decimation factor (for time-varying
+        signals, the decimation factors of the levels shall divide it)
+
+    Outputs
+    -------
+    dec_factors : list
+        Decimation factors of the levels, in increasing order (the first
+        one is 1: full rate signal)
+    """
+    fs_divisor = oct3divisors(fs)
+    if sig_type != "stationary":
+        fs_divisor = [n for n in fs_divisor if dec_factor % n == 0]
+        return fs_divisor[: fs_divisor.index(oct3dec(fs, fc_min, fs_divisor)) + 1]
+    dec_factors = [1]
+    while fs / dec_factors[-1] / fc_min >= 200:
+        multiples = [
+            n for n in fs_divisor if n > dec_factors[-1] and n % dec_factors[-1] == 0
+        ]
+        if len(multiples) == 0:
+            raise ValueError(
+                """ERROR: Design not possible. No time decimation factor that
+                satisfies fs_sub / (fc) > 200 have been found"""
+            )
+        dec_factors.append(multiples[0])
+    return dec_factors
+
+
+def oct3tree(sig, dec_factors):
+    """Signal decimated at each level of an octave decimation tree
+
+    Each level is computed once from the previous one (see
+    scipy.signal.decimate), so that the total cost of the decimations is
+    close to twice the cost of filtering the full rate signal. The
+    passband gain of the anti-aliasing filters (-0.1 dB per stage) is
+    compensated from the second stage, so that each level has the same
+    passband gain as a single decimation of the full rate signal.
+
+    Parameters
+    ----------
+    sig : numpy.ndarray
+        time signal [any unit]
+    dec_factors : list
+        Decimation factors of the levels (see oct3tree_factors)
+
+    Outputs
+    -------
+    sig_tree : dict
+        Decimated time signals indexed by their decimation factor
+    """
+    sig_tree = {dec_factors[0]: sig}
+    for i, (factor_prev, factor) in enumerate(zip(dec_factors[:-1], dec_factors[1:])):
+        sig = signal.decimate(sig, factor // factor_prev)
+        if i > 0:
+            sig = sig / oct3tree_gain(factor // factor_prev)
+        sig_tree[factor] = sig
+    return sig_tree
+
+
+def oct3tree_gain(q):
+    """Passband (DC) gain of the anti-aliasing filter of
+    scipy.signal.decimate (8th order Chebyshev type I filter applied
+    forward and backward)
+
+    Parameters
+    ----------
+    q : int
+        Decimation factor of the stage
+
+    Outputs
+    -------
+    gain : float
+        Amplitude gain of the filter at 0 Hz
+    """
+    b, a = signal.cheby1(8, 0.05, 0.8 / q)
+    return (np.sum(b) / np.sum(a)) ** 2
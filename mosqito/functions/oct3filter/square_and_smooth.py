@@ -9,34 +9,71 @@ import numpy as np
 from scipy import signal
 
 
-def square_and_smooth(sig, center_freq, fs):
+def square_and_smooth(sig, center_freq, fs, zi=None, a1=None):
     """3rd order low-pass filtering (See ISO 532-1 section 6.3)
 
     Parameters
     ----------
     sig : numpy.ndarray
-        time signal sampled at 48 kHz [pa]
-    coeff : numpy.ndarray
-        filter coeeficients
-    gain : float
-        filter gain
+        time signal sampled at 48 kHz [pa] (filtered along the last axis)
+    center_freq : float
+        center frequency of the third octave band [Hz]
+    fs : int
+        time signal sampling frequency
+    zi : numpy.ndarray, optional
+        initial states of the three low-pass filters (dim [3, 1] or
+        [3, channels, 1]), if None the filters are at rest
+    a1 : float, optional
+        feedback coefficient of the low-pass filters (see SMOOTHING_A1 in
+        loudness_zwicker_constants), computed from center_freq and fs if
+        None
 
     Outputs
     -------
     signal_filt : numpy.ndarray
         filtered time signal
+    zf : numpy.ndarray
+        final states of the three low-pass filters (only returned if zi
+        is given)
     """
     # Frequency dependent time constant
-    if center_freq <= 1000:
-        tau = 2 / (3 * center_freq)
-    else:
-        tau = 2 / (3 * 1000)
+    if a1 is None:
+        tau = smoothing_time_constant(center_freq)
+        a1 = np.exp(-1 / (fs * tau))
     # Squaring
     sig = sig ** 2
-    # Three smoothing low-pass filters
-    a1 = np.exp(-1 / (fs * tau))
+    # Three smoothing low-pass filters (computed in the precision of the
+    # signal, float32 or float64)
+    dtype = np.result_type(sig, np.float32)
     b0 = 1 - a1
-    # zi = signal.lfilter_zi([b0], [1 -a1])
+    b = np.array([b0], dtype=dtype)
+    a = np.array([1, -a1], dtype=dtype)
+    if zi is None:
+        for i in range(3):
+            sig = signal.lfilter(b, a, sig)
+        return sig
+    zf = np.zeros((3,) + np.shape(sig)[:-1] + (1,), dtype=dtype)
     for i in range(3):
-        sig = signal.lfilter([b0], [1, -a1], sig)
-    return sig
+        sig, zf[i] = signal.lfilter(b, a, sig, zi=zi[i])
+    return sig, zf
+
+
+def smoothing_time_constant(center_freq):
+    """Time constant of the smoothing low-pass filters (See ISO 532-1
+    section 6.3)
+
+    Parameters
+    ----------
+    center_freq : float
+        center frequency of the third octave band [Hz]
+
+    Outputs
+    -------
+    tau : float
+        time constant [s]
+    """
+    if center_freq <= 1000:
+        tau = 2 / (3 * center_freq)
+    else:
+        tau = 2 / (3 * 1000)
+    return tau
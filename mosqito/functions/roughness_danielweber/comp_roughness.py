@@ -7,20 +7,20 @@ Created on Mon Nov  2 10:34:04 2020
 
 # Standard imports
 import numpy as np
-from numpy.fft import fft, ifft
+from numpy.fft import fft, ifft, rfft, irfft
 import math
 
 # Local imports
-from mosqito.functions.shared.LTQ import LTQ
-from mosqito.functions.roughness_danielweber.gzi_weighting_function import (
-    gzi_definition,
+from mosqito.functions.roughness_danielweber.roughness_plan import RoughnessPlan
+from mosqito.functions.roughness_danielweber.excitation_pattern import (
+    excitation_pattern,
 )
-from mosqito.functions.roughness_danielweber.H_weighting_function import H_function
-from mosqito.functions.roughness_danielweber.a0_zwicker import a0tab
-from mosqito.functions.shared.conversion import freq2bark, db2amp, amp2db, bark2freq
+from mosqito.functions.shared.conversion import amp2db
 
 
-def comp_roughness(signal, fs, overlap):
+def comp_roughness(
+    signal, fs, overlap, plan=None, max_workers=1, executor=None, fast=False
+):
     """Roughness calculation of a signal sampled at 48kHz.
 
     The code is based on the algorithm described in "Psychoacoustical roughness:
@@ -29,6 +29,22 @@ def comp_roughness(signal, fs, overlap):
     of successive stages and calculates intermediate specific roughnesses R_spec,
     which are summed up to determine the total roughness R.
 
+    The 200 ms frames are independent from each other: they can be
+    processed by a pool of processes, either created for the call
+    (max_workers > 1) or given (executor). The signal is then copied once
+    in a shared memory block read by all the processes, each task
+    computing the roughness of consecutive frames. The roughness is
+    identical to the one computed in the calling process.
+
+    In fast mode, the envelopes of the channels are demodulated and
+    decimated before the modulation analysis and the cross correlation
+    (see roughness_modulation), which divides the computation time by 4
+    (broadband signals) to 10 (tonal signals). The roughness of the
+    amplitude-modulated tones of the validation differs by less than 0.02
+    asper from the roughness of the default mode, the deviation to the
+    reference values of Daniel and Weber being unchanged (see
+    validation_roughness_fast).
+
     Parameters
     ----------
     signal : numpy.array
@@ -37,6 +53,19 @@ def comp_roughness(signal, fs, overlap):
         sampling frequency
     overlap : float
         overlapping coefficient for the time windows of 200ms
+    plan : RoughnessPlan
+        frame-invariant data of the model computed for fs (see
+        RoughnessPlan), created by the function if not given
+    max_workers : int
+        number of processes computing the frames (1 by default: the
+        frames are computed by the calling process, more than 1 requires
+        Python >= 3.8)
+    executor : concurrent.futures.ProcessPoolExecutor, optional
+        pool of processes computing the frames (max_workers is then
+        ignored)
+    fast : bool
+        if True, the envelopes are computed at a reduced rate (False by
+        default)
 
     Outputs
     -------
@@ -51,8 +80,19 @@ def comp_roughness(signal, fs, overlap):
     # -----------------------------------Stage 0------------------------------------
     # -------Creation of overlapping frames of 200 ms from the input signal---------
 
+    # Frame-invariant data (window, frequency axes, thresholds and
+    # weighting functions)
+    if plan is None:
+        plan = RoughnessPlan(fs)
+    elif plan.fs != fs:
+        raise ValueError(
+            "ERROR: the roughness plan is defined for a sampling frequency of "
+            + str(plan.fs)
+            + " Hz"
+        )
+
     # Number of points within each frame according to the time resolution of 200ms
-    n = int(0.2 * fs)
+    n = plan.n
 
     # Number of frames according to the given overlap proportion
     nb_frame = math.floor(signal.size / ((1 - overlap) * n)) - 1
@@ -63,178 +103,356 @@ def comp_roughness(signal, fs, overlap):
     # Creation of the corresponding time axis
     time = np.linspace(0, len(signal) / fs, num=nb_frame)
 
-    # Initialization of the weighting functions H and g
-    hWeight = H_function(n, fs)
-    # Aures modulation depth weighting function
-    gzi = gzi_definition(np.arange(1, 48, 1) / 2)
+    # Number of points between the beginning of two consecutive frames
+    step = int(n * (1 - overlap))
+
+    if executor is None and max_workers <= 1:
+        R = np.zeros((nb_frame))
+        for i_frame in range(nb_frame):
+            segment = signal[i_frame * step : i_frame * step + n]
+            R[i_frame] = roughness_frame(segment, plan, fast)
+    else:
+        R = roughness_frames_parallel(
+            signal, plan, step, nb_frame, max_workers, executor, fast
+        )
+
+    output = {
+        "name": "Roughness",
+        "values": R,
+        "time": time,
+    }
 
-    R = np.zeros((nb_frame))
-    for i_frame in range(nb_frame):
-        segment = signal[
-            i_frame * int(n * (1 - overlap)) : i_frame * int(n * (1 - overlap)) + n
-        ]
+    return output
+
+
+def roughness_frame(segment, plan, fast=False):
+    """Roughness of a 200 ms frame (stages 0 to 3)
+
+    Parameters
+    ----------
+    segment : numpy.array
+        signal amplitude values of the frame
+    plan : RoughnessPlan
+        frame-invariant data of the model (see RoughnessPlan)
+    fast : bool
+        if True, the envelopes are computed at a reduced rate
+
+    Outputs
+    -------
+    R : float
+        roughness of the frame [asper]
+    """
+    # Stage 0: spectrum of the frame and audible components
+    spectrum, module, spec_dB = roughness_spectrum(segment, plan)
+    audible_index = np.where(spec_dB > plan.threshold)[0]
+
+    # Stage 1: specific excitations
+    slopes, ch_low, ch_high = excitation_pattern(
+        plan.freqs[audible_index],
+        plan.barks[audible_index],
+        spec_dB[audible_index],
+        plan.minExcitDB,
+    )
+
+    # Stage 2: envelopes and modulation depths
+    hBP, mod_depth = roughness_modulation(
+        spectrum,
+        module,
+        audible_index,
+        slopes,
+        ch_low,
+        ch_high,
+        plan.hWeight,
+        plan.n_envelope if fast else None,
+    )
+
+    # Stage 3: specific and total roughness
+    return roughness_total(hBP, mod_depth, plan.gzi)
+
+
+def roughness_frames_parallel(
+    signal, plan, step, nb_frame, max_workers, executor, fast=False
+):
+    """Roughness of the frames of a signal computed by a pool of processes
 
-        # Calculate Blackman analysis window
-        window = np.blackman(n)
-        window = window / sum(window)
-
-        # Creation of the spectrum by FFT using the Blackman window
-        spectrum = fft(segment * window) * 1.42
-        # Highest frequency
-        nMax = round(n / 2)
-        nZ = np.arange(1, nMax + 1, 1)
-        # Frequency axis in Hertz
-        freqs = np.arange(1, nMax + 1, 1) * (fs / n)
-        # Frequency axis in Bark
-        barks = freq2bark(freqs)
-
-        # Calculate Zwicker a0 factor (transfer characteristic of the outer and inner ear)
-        a0 = np.zeros((n))
-        a0[nZ - 1] = db2amp(a0tab(barks), ref=1)
-        spectrum = a0 * spectrum
-
-        # Conversion of the spectrum into dB
-        module = abs(spectrum[0:nMax])
-        spec_dB = amp2db(module, ref=0.00002)
-
-        # Find the audible components within the spectrum
-        threshold = LTQ(barks, reference="roughness")
-        audible_index = np.where(spec_dB > threshold)[0]
-        # Number of audible frequencies
-        n_aud = len(audible_index)
-
-        # --------------------------------- stage 1 ------------------------------------
-        # ----------------Creation of the specific excitations functions----------------
-
-        # Terhardt's slopes definition
-        # lower slope [dB/Bark]
-        s1 = -27
-        s2 = np.zeros((n_aud))
-        # upper slope [dB/Bark]
-        for k in np.arange(0, n_aud, 1):
-            s2[k] = min(
-                -24
-                - (230 / freqs[audible_index[k]])
-                + (0.2 * spec_dB[audible_index[k]]),
-                0,
+    Parameters
+    ----------
+    signal : numpy.array
+        signal amplitude values along time
+    plan : RoughnessPlan
+        frame-invariant data of the model (see RoughnessPlan)
+    step : integer
+        number of points between the beginning of two consecutive frames
+    nb_frame : integer
+        number of frames
+    max_workers : int
+        number of processes if executor is None
+    executor : concurrent.futures.ProcessPoolExecutor
+        pool of processes computing the frames
+    fast : bool
+        if True, the envelopes are computed at a reduced rate
+
+    Outputs
+    -------
+    R : numpy.array
+        roughness of the frames [asper]
+    """
+    # (imported here since shared memory requires Python 3.8)
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    signal = np.ascontiguousarray(signal, dtype=float)
+    # Tasks of consecutive frames (about 10 frames per task, so that the
+    # processes stay busy until the end of the signal)
+    bounds = np.linspace(0, nb_frame, -(-nb_frame // 10) + 1).astype(int)
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers)
+    shm = shared_memory.SharedMemory(create=True, size=max(signal.nbytes, 1))
+    try:
+        np.ndarray(signal.shape, dtype=float, buffer=shm.buf)[:] = signal
+        futures = [
+            executor.submit(
+                _roughness_frames_task,
+                shm.name,
+                signal.size,
+                (plan.fs, plan.n, plan.n_envelope),
+                step,
+                i_start,
+                i_stop,
+                fast,
             )
+            for i_start, i_stop in zip(bounds[:-1], bounds[1:])
+        ]
+        R = np.concatenate([future.result() for future in futures])
+    finally:
+        shm.close()
+        shm.unlink()
+        if own_executor:
+            executor.shutdown()
+    return R
+
+
+# Plans of the worker processes, built once per process and configuration
+_task_plans = {}
+
+
+def _roughness_frames_task(shm_name, size, plan_args, step, i_start, i_stop, fast):
+    """Roughness of consecutive frames of a signal stored in a shared memory
+    block (task of a worker process)"""
+    from multiprocessing import shared_memory
+
+    if plan_args not in _task_plans:
+        _task_plans[plan_args] = RoughnessPlan(*plan_args)
+    plan = _task_plans[plan_args]
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        signal = np.ndarray((size,), dtype=float, buffer=shm.buf)
+        R = np.array(
+            [
+                roughness_frame(
+                    signal[i_frame * step : i_frame * step + plan.n], plan, fast
+                )
+                for i_frame in range(i_start, i_stop)
+            ]
+        )
+        # (the shared memory cannot be closed while it is referenced)
+        del signal
+    finally:
+        shm.close()
+    return R
+
+
+def roughness_spectrum(segment, plan):
+    """Spectrum of a 200 ms frame weighted by the transfer characteristic of
+    the outer and inner ear (stage 0)
+
+    Parameters
+    ----------
+    segment : numpy.array
+        signal amplitude values of the frame
+    plan : RoughnessPlan
+        frame-invariant data of the model (see RoughnessPlan)
 
-        # The excitation pattern are calculated for 47 overlapping 1-bark-wide channels
-        n_channel = 47
-        # Channels number
-        zi = np.arange(1, n_channel + 1) / 2
-        # Center frequencies for each channel
-        zb = bark2freq(zi) * n / fs
-        # Minimum excitation level
-        minExcitDB = np.interp(zb, nZ, threshold)
-
-        ch_low = np.zeros((n_aud))
-        ch_high = np.zeros((n_aud))
-        for i in np.arange(0, n_aud):
-            # Lower limit of the channel corresponding to each component
-            ch_low[i] = math.floor(2 * barks[audible_index[i]]) - 1
-            # Higher limit
-            ch_high[i] = math.ceil(2 * barks[audible_index[i]]) - 1
-
-        # Creation of the excitation pattern
-        slopes = np.zeros((n_aud, n_channel))
-        for k in np.arange(0, n_aud):
-            levDB = spec_dB[audible_index[k]]
-            b = barks[audible_index[k]]
-            for j in np.arange(0, int(ch_low[k] + 1)):
-                sl = (s1 * (b - ((j + 1) * 0.5))) + levDB
-                if sl > minExcitDB[j]:
-                    slopes[k, j] = db2amp(sl, ref=0.00002)
-            for j in np.arange(int(ch_high[k]), n_channel):
-                sl = (s2[k] * (((j + 1) * 0.5) - b)) + levDB
-                if sl > minExcitDB[j]:
-                    slopes[k, j] = db2amp(sl, ref=0.00002)
-
-        # Initialization
-        hBP = np.zeros((n_channel, n))
-        mod_depth = np.zeros((n_channel))
-
-        # Definition of the excitation amplitude
-        for i in np.arange(0, n_channel, 1):
-            exc = np.zeros((n), dtype=complex)
-            for j in np.arange(0, n_aud, 1):
-                ind = audible_index[j]
-                # the component belongs to the bark window
-                if ch_low[j] == i:
-                    ampl = 1
-                elif ch_high[j] == i:
-                    ampl = 1
-                # the component is higher than the bark window
-                elif ch_high[j] > i:
-                    ampl = slopes[j, i + 1] / module[ind]
-                # the component is lower than the considered window
-                else:
-                    ampl = slopes[j, i - 1] / module[ind]
-
-                # reconstruction of the spectrum
-                exc[ind] = ampl * spectrum[ind]
-
-            # The temporal specific excitation functions are obtained by IFFT
-            temporal_excitation = np.abs(n * np.real(ifft(exc)))
-
-            # ------------------------------- stage 2 --------------------------------------
-            # ---------------------modulation depth calculation-----------------------------
-
-            # The fluctuations of the envelope are contained in the low frequency part
-            # of the spectrum of specific excitations in absolute value
-            h0 = np.mean(temporal_excitation)
-            envelope_spec = fft(temporal_excitation - h0)
-
-            # This spectrum is weighted to model the low-frequency  bandpass
-            # characteristic of the roughness on modulation frequency
-            envelope_spec = envelope_spec * hWeight[i, :]
-
-            # The time functions of the bandpass filtered envelopes hBPi(t)
-            # are calculated via inverse Fourier transform :
-            hBP[i, :] = 2 * np.real(ifft(envelope_spec))
-
-            # Modulation depth estimation is given by envelope RMS values
-            # and excitation functions time average :
-            hBPrms = np.sqrt(np.mean(np.power(hBP[i, :], 2)))
-            if h0 > 0:
-                mod_depth[i] = hBPrms / h0
-                if mod_depth[i] > 1:
-                    mod_depth[i] = 1
-            else:
-                mod_depth[i] = 0
-
-        # ------------------------------- stage 3 --------------------------------------
-        # ----------------roughness calculation with cross correlation------------------
-
-        # Crosscorrelation coefficients between the envelopes of the channels
-        # i and i+2 with dz= 1 bark
-        ki = np.zeros((47))
-
-        for i in range(0, 45):
-            if hBP[i].all() != 0 and hBP[i + 2].all() != 0:
-                ki[i] = np.corrcoef(hBP[i, :], hBP[i + 2, :])[0, 1]
-
-        # Specific roughness calculation with gzi the modulation depth weighting
-        # function given by Aures
-        R_spec = np.zeros((47))
-
-        R_spec[0] = gzi[0] * pow(mod_depth[0] * ki[0], 2)
-        R_spec[1] = gzi[1] * pow(mod_depth[1] * ki[1], 2)
-        for i in np.arange(2, 45):
-            R_spec[i] = gzi[i] * pow(mod_depth[i] * ki[i] * ki[i - 2], 2)
-        R_spec[45] = gzi[45] * pow(mod_depth[45] * ki[43], 2)
-        R_spec[46] = gzi[46] * pow(mod_depth[46] * ki[44], 2)
-
-        # Total roughness calculation with calibration factor of 0.25 given in the article
-        # to produce a roughness of 1 asper for a 1-kHz, 60dB tone with carrier frequency
-        # of 70 Hz and a modulation depth of 1
-
-        R[i_frame] = 0.25 * sum(R_spec)
-
-        output = {
-            "name": "Roughness",
-            "values": R,
-            "time": time,
-        }
+    Outputs
+    -------
+    spectrum : numpy.array
+        complex spectrum of the frame (dim [n])
+    module : numpy.array
+        spectrum modulus up to fs / 2 (dim [n / 2])
+    spec_dB : numpy.array
+        spectrum modulus up to fs / 2 in dB
+    """
+    # Creation of the spectrum by FFT using the Blackman window
+    spectrum = fft(segment * plan.window) * 1.42
 
-    return output
+    # Transfer characteristic of the outer and inner ear
+    spectrum = plan.a0 * spectrum
+
+    # Conversion of the spectrum into dB
+    module = abs(spectrum[0 : plan.nMax])
+    spec_dB = amp2db(module, ref=0.00002)
+
+    return spectrum, module, spec_dB
+
+
+def roughness_modulation(
+    spectrum, module, audible_index, slopes, ch_low, ch_high, hWeight, n_envelope=None
+):
+    """Envelopes and modulation depths of the specific excitations of the
+    47 channels (stage 2)
+
+    The excitation spectra of the 47 channels are assembled in one
+    [47, n / 2 + 1] array and all the channels are transformed at once by
+    each real FFT step (excitation, envelope spectrum and bandpass
+    filtered envelope).
+
+    If n_envelope is given, the envelopes are computed at a reduced rate
+    (fast mode): the excitation of each channel is demodulated (magnitude
+    of its complex analytic signal, whose low frequency part is 2 / pi
+    times the one of the rectified excitation) at n_envelope instants of
+    the frame only, obtained by folding its spectrum modulo n_envelope
+    (decimation). The modulation analysis and the cross correlation then
+    use n_envelope points per channel instead of n.
+
+    Parameters
+    ----------
+    spectrum : numpy.array
+        complex spectrum of the frame (dim [n])
+    module : numpy.array
+        spectrum modulus up to fs / 2
+    audible_index : numpy.array
+        indices of the audible components
+    slopes : numpy.array
+        excitation of each audible component in each channel (see
+        excitation_pattern)
+    ch_low : numpy.array
+        lower channel limit of each audible component
+    ch_high : numpy.array
+        higher channel limit of each audible component
+    hWeight : numpy.array
+        weighting functions of the envelope spectra (see H_function)
+    n_envelope : integer
+        number of points of the decimated envelopes (None by default: the
+        envelopes are computed with n points)
+
+    Outputs
+    -------
+    hBP : numpy.array
+        bandpass filtered envelopes of the channels (dim [47, n] or
+        [47, n_envelope])
+    mod_depth : numpy.array
+        modulation depth of the channels
+    """
+    n = spectrum.size
+    n_channel = 47
+    channels = np.arange(n_channel)
+
+    # Definition of the excitation amplitude of each audible component in
+    # each channel (dim [components, channels])
+    ch_low = ch_low[:, np.newaxis]
+    ch_high = ch_high[:, np.newaxis]
+    # the component is higher than the bark window (slopes[j, i + 1]) or
+    # lower than the considered window (slopes[j, i - 1])
+    neighbour = np.where(ch_high > channels, channels + 1, channels - 1)
+    ampl = np.take_along_axis(
+        slopes, np.clip(neighbour, 0, n_channel - 1), axis=1
+    ) / module[audible_index, np.newaxis]
+    # the component belongs to the bark window
+    ampl[(ch_low == channels) | (ch_high == channels)] = 1
+
+    if n_envelope is None:
+        n_envelope = n
+        # Reconstruction of the one-sided spectra of the 47 channels: the
+        # real part of their inverse FFT is half the inverse real FFT of the
+        # spectrum (except for the 0 Hz component)
+        exc = np.zeros((n_channel, n // 2 + 1), dtype=complex)
+        exc[:, audible_index] = ampl.T * (
+            spectrum[audible_index] * np.where(audible_index == 0, n, 0.5 * n)
+        )
+
+        # The temporal specific excitation functions are obtained by IFFT
+        temporal_excitation = irfft(exc, n, axis=1)
+        np.abs(temporal_excitation, out=temporal_excitation)
+    else:
+        # Reconstruction of the one-sided spectra of the 47 channels, folded
+        # modulo n_envelope: their inverse FFT gives the analytic signals of
+        # the excitations at n_envelope equally spaced instants
+        n_fold = -(-(n // 2 + 1) // n_envelope)
+        exc = np.zeros((n_channel, n_fold * n_envelope), dtype=complex)
+        exc[:, audible_index] = ampl.T * spectrum[audible_index]
+        exc = np.sum(exc.reshape(n_channel, n_fold, n_envelope), axis=1)
+
+        # Demodulated temporal specific excitation functions
+        temporal_excitation = np.abs(ifft(exc, axis=1)) * (2 / np.pi * n_envelope)
+
+    # The fluctuations of the envelope are contained in the low frequency part
+    # of the spectrum of specific excitations in absolute value (the mean
+    # value h0 is not removed before the FFT since the weighting functions
+    # are null at 0 Hz)
+    h0 = np.mean(temporal_excitation, axis=1)
+    envelope_spec = rfft(temporal_excitation, axis=1)
+
+    # This spectrum is weighted to model the low-frequency  bandpass
+    # characteristic of the roughness on modulation frequency
+    envelope_spec *= hWeight[:, : n_envelope // 2 + 1]
+
+    # The time functions of the bandpass filtered envelopes hBPi(t)
+    # are calculated via inverse Fourier transform (the weighting functions
+    # are null at 0 Hz and above fs / 2, hence the inverse real FFT is twice
+    # the real part of the inverse FFT) :
+    hBP = irfft(envelope_spec, n_envelope, axis=1)
+
+    # Modulation depth estimation is given by envelope RMS values
+    # and excitation functions time average :
+    hBPrms = np.sqrt(np.einsum("ij,ij->i", hBP, hBP) / n_envelope)
+    mod_depth = np.zeros((n_channel))
+    mod_depth[h0 > 0] = np.minimum(hBPrms[h0 > 0] / h0[h0 > 0], 1)
+
+    return hBP, mod_depth
+
+
+def roughness_total(hBP, mod_depth, gzi):
+    """Specific roughness of the channels with cross correlation and total
+    roughness of the frame (stage 3)
+
+    Parameters
+    ----------
+    hBP : numpy.array
+        bandpass filtered envelopes of the channels (dim [47, n])
+    mod_depth : numpy.array
+        modulation depth of the channels
+    gzi : numpy.array
+        modulation depth weighting function of the channels (see
+        gzi_definition)
+
+    Outputs
+    -------
+    R : float
+        roughness of the frame [asper]
+    """
+    # Crosscorrelation coefficients between the envelopes of the channels
+    # i and i+2 with dz= 1 bark
+    ki = np.zeros((47))
+
+    for i in range(0, 45):
+        if hBP[i].all() != 0 and hBP[i + 2].all() != 0:
+            ki[i] = np.corrcoef(hBP[i, :], hBP[i + 2, :])[0, 1]
+
+    # Specific roughness calculation with gzi the modulation depth weighting
+    # function given by Aures
+    R_spec = np.zeros((47))
+
+    R_spec[0] = gzi[0] * pow(mod_depth[0] * ki[0], 2)
+    R_spec[1] = gzi[1] * pow(mod_depth[1] * ki[1], 2)
+    for i in np.arange(2, 45):
+        R_spec[i] = gzi[i] * pow(mod_depth[i] * ki[i] * ki[i - 2], 2)
+    R_spec[45] = gzi[45] * pow(mod_depth[45] * ki[43], 2)
+    R_spec[46] = gzi[46] * pow(mod_depth[46] * ki[44], 2)
+
+    # Total roughness calculation with calibration factor of 0.25 given in the article
+    # to produce a roughness of 1 asper for a 1-kHz, 60dB tone with carrier frequency
+    # of 70 Hz and a modulation depth of 1
+
+    return 0.25 * sum(R_spec)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard imports
+import numpy as np
+
+# Local imports
+from mosqito.functions.shared.conversion import db2amp
+
+
+def excitation_pattern(freqs, barks, spec_dB, minExcitDB):
+    """Excitation of each audible spectral component in the 47 overlapping
+    1-bark-wide channels (stage 1 of the roughness model of Daniel and
+    Weber)
+
+    The excitation of each component decreases with Terhardt's slopes on
+    both sides of its own channels: -27 dB/Bark towards the lower channels
+    and a level-dependent slope towards the higher channels. The slopes
+    are evaluated for all the (components, channels) pairs at once, the
+    excitations lower than the minimum excitation level of the channel
+    being set to 0.
+
+    Parameters
+    ----------
+    freqs : numpy.array
+        frequencies of the audible components in Hertz
+    barks : numpy.array
+        frequencies of the audible components in Bark
+    spec_dB : numpy.array
+        levels of the audible components in dB
+    minExcitDB : numpy.array
+        minimum excitation level of each channel in dB (dim [47])
+
+    Outputs
+    -------
+    slopes : numpy.array
+        excitation of each component in each channel (dim [components, 47])
+    ch_low : numpy.array
+        lower channel limit of each component
+    ch_high : numpy.array
+        higher channel limit of each component
+    """
+    n_channel = minExcitDB.size
+    # Channels center in Bark
+    z_channel = np.arange(1, n_channel + 1) * 0.5
+
+    # Terhardt's slopes definition
+    # lower slope [dB/Bark]
+    s1 = -27
+    # upper slope [dB/Bark]
+    s2 = np.minimum(-24 - (230 / freqs) + (0.2 * spec_dB), 0)
+
+    # Lower and higher limit of the channel corresponding to each component
+    ch_low = np.floor(2 * barks) - 1
+    ch_high = np.ceil(2 * barks) - 1
+
+    # Creation of the excitation pattern (the upper slope prevails in the
+    # channel of the components located at a channel limit)
+    slopes = np.zeros((barks.size, n_channel))
+    channels = np.arange(n_channel)
+    sl = (s1 * (barks[:, np.newaxis] - z_channel)) + spec_dB[:, np.newaxis]
+    is_excited = (channels <= ch_low[:, np.newaxis]) & (sl > minExcitDB)
+    slopes[is_excited] = db2amp(sl[is_excited], ref=0.00002)
+    sl = (s2[:, np.newaxis] * (z_channel - barks[:, np.newaxis])) + spec_dB[
+        :, np.newaxis
+    ]
+    is_excited = (channels >= ch_high[:, np.newaxis]) & (sl > minExcitDB)
+    slopes[is_excited] = db2amp(sl[is_excited], ref=0.00002)
+
+    return slopes, ch_low, ch_high
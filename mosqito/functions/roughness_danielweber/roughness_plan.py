@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard imports
+import numpy as np
+
+# Local imports
+from mosqito.functions.shared.LTQ import LTQ
+from mosqito.functions.roughness_danielweber.gzi_weighting_function import (
+    gzi_definition,
+)
+from mosqito.functions.roughness_danielweber.H_weighting_function import H_function
+from mosqito.functions.roughness_danielweber.a0_zwicker import a0tab
+from mosqito.functions.shared.conversion import freq2bark, db2amp, bark2freq
+
+
+class RoughnessPlan:
+    """Frame-invariant data of the roughness model of Daniel and Weber
+
+    The analysis window, the frequency axes, the transfer characteristic
+    of the outer and inner ear, the threshold in quiet, the minimum
+    excitation level of the channels and the weighting functions H and g
+    only depend on the sampling frequency and on the frame length. They
+    are computed once when the plan is created, and the plan can be given
+    to comp_roughness to be reused for all the frames of a signal and for
+    all the signals sampled at the same frequency.
+
+    The number of points of the decimated envelopes used by the fast mode
+    of comp_roughness is also defined by the plan: the envelopes are then
+    sampled at n_envelope / 0.2 Hz (2560 Hz by default), well above the
+    highest modulation frequency selected by the weighting functions H
+    (about 500 Hz).
+
+    Parameters
+    ----------
+    fs : integer
+        sampling frequency
+    n : integer
+        number of points of the frames (200 ms by default)
+    n_envelope : integer
+        number of points of the decimated envelopes of the fast mode
+
+    Example
+    -------
+    >>> plan = RoughnessPlan(48000)
+    >>> for signal in signals:
+    ...     roughness = comp_roughness(signal, 48000, overlap=0.5, plan=plan)
+    """
+
+    def __init__(self, fs, n=None, n_envelope=512):
+        if n is None:
+            # Number of points within each frame according to the time
+            # resolution of 200ms
+            n = int(0.2 * fs)
+        self.fs = fs
+        self.n = n
+
+        # Blackman analysis window
+        window = np.blackman(n)
+        self.window = window / sum(window)
+
+        # Highest frequency
+        self.nMax = round(n / 2)
+        nZ = np.arange(1, self.nMax + 1, 1)
+        # Frequency axis in Hertz
+        self.freqs = nZ * (fs / n)
+        # Frequency axis in Bark
+        self.barks = freq2bark(self.freqs)
+
+        # Zwicker a0 factor (transfer characteristic of the outer and inner ear)
+        self.a0 = np.zeros((n))
+        self.a0[nZ - 1] = db2amp(a0tab(self.barks), ref=1)
+
+        # Threshold of the audible components within the spectrum
+        self.threshold = LTQ(self.barks, reference="roughness")
+
+        # Minimum excitation level of the 47 channels
+        self.minExcitDB = min_excitation(self.threshold, n, fs)
+
+        # Weighting functions H and g
+        self.hWeight = H_function(n, fs)
+        # Aures modulation depth weighting function
+        self.gzi = gzi_definition(np.arange(1, 48, 1) / 2)
+
+        # Number of points of the decimated envelopes (the weighting
+        # functions shall be null above their Nyquist frequency)
+        if self.hWeight[:, n_envelope // 2 :].any():
+            raise ValueError(
+                "ERROR: n_envelope is too small for the weighting functions H"
+            )
+        self.n_envelope = n_envelope
+
+
+def min_excitation(threshold, n, fs):
+    """Minimum excitation level of the 47 channels
+
+    Parameters
+    ----------
+    threshold : numpy.array
+        threshold in quiet along the frequency axis in dB
+    n : integer
+        number of points of the frame
+    fs : integer
+        sampling frequency
+
+    Outputs
+    -------
+    minExcitDB : numpy.array
+        minimum excitation level of each channel in dB
+    """
+    nZ = np.arange(1, threshold.size + 1, 1)
+    # The excitation pattern are calculated for 47 overlapping 1-bark-wide channels
+    n_channel = 47
+    # Channels number
+    zi = np.arange(1, n_channel + 1) / 2
+    # Center frequencies for each channel
+    zb = bark2freq(zi) * n / fs
+    # Minimum excitation level
+    return np.interp(zb, nZ, threshold)
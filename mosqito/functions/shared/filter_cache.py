@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard library imports
+import copy
+import functools
+import hashlib
+import inspect
+import os
+from collections import OrderedDict
+
+# Third party imports
+import numpy as np
+
+
+class FilterCache:
+    """Least recently used cache of filter coefficients, with an optional
+    on-disk store
+
+    The coefficients are indexed by the name of their design function and
+    the design parameters (center frequency, sampling frequency,
+    order...). When the cache is full, the least recently used
+    coefficients are evicted. If a directory is given, the coefficients
+    are also stored in it (one .npz file per design, read without
+    unpickling), so that they are shared between processes and kept from
+    one run to another.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of designs kept in memory
+    directory : str
+        Directory of the on-disk store (None to keep the designs in memory
+        only)
+
+    Example
+    -------
+    >>> cache = FilterCache(maxsize=512, directory="/tmp/mosqito_filters")
+    >>> b, a = cache.get(("oct3dsgn", 1000, 48000, 3), oct3dsgn, 1000, 48000)
+    """
+
+    def __init__(self, maxsize=1024, directory=None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.designs = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, design, *args, **kwargs):
+        """Coefficients of a design, computed only if they are not cached
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the design (name of the design function and design
+            parameters)
+        design : function
+            Design function, called with args and kwargs if the key is
+            not cached
+
+        Outputs
+        -------
+        coefficients : any
+            Copy of the cached coefficients
+        """
+        if key in self.designs:
+            self.hits += 1
+            self.designs.move_to_end(key)
+            return copy.deepcopy(self.designs[key])
+        coefficients = self._load(key)
+        if coefficients is None:
+            self.misses += 1
+            coefficients = design(*args, **kwargs)
+            self._save(key, coefficients)
+        else:
+            self.hits += 1
+        self.designs[key] = coefficients
+        if len(self.designs) > self.maxsize:
+            self.designs.popitem(last=False)
+        return copy.deepcopy(coefficients)
+
+    def clear(self):
+        """Remove all the designs from memory (the on-disk store is kept)"""
+        self.designs.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        """Path of the file storing a design"""
+        name = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + ".npz")
+
+    def _load(self, key):
+        """Design read from the on-disk store (None if not stored)"""
+        if self.directory is None:
+            return None
+        try:
+            with np.load(self._path(key), allow_pickle=False) as data:
+                # (hash collision or file written by another version)
+                if str(data["key"]) != repr(key):
+                    return None
+                kinds = data["kinds"].tolist()
+                items = [data["item_{}".format(i)] for i in range(len(kinds))]
+                is_tuple = bool(data["is_tuple"])
+        except Exception:
+            # Missing, partial or foreign file: the design is computed again
+            return None
+        items = [
+            item.tolist() if kind == "list" else item
+            for item, kind in zip(items, kinds)
+        ]
+        return tuple(items) if is_tuple else items[0]
+
+    def _save(self, key, coefficients):
+        """Write a design in the on-disk store"""
+        if self.directory is None:
+            return
+        # The coefficients (array, list or tuple of them) are stored as
+        # numerical arrays, with the type of each item
+        is_tuple = isinstance(coefficients, tuple)
+        items = coefficients if is_tuple else (coefficients,)
+        arrays = {
+            "item_{}".format(i): np.asarray(item) for i, item in enumerate(items)
+        }
+        if any(array.dtype == object for array in arrays.values()):
+            return
+        kinds = ["list" if isinstance(item, list) else "array" for item in items]
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        # Written in a temporary file and renamed, so that a concurrent
+        # process never reads a partial file
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp_path, "wb") as file:
+            np.savez(
+                file,
+                key=np.array(repr(key)),
+                kinds=np.array(kinds),
+                is_tuple=np.array(is_tuple),
+                **arrays
+            )
+        os.replace(tmp_path, path)
+
+
+# Cache shared by all the filter design functions (the on-disk store is
+# enabled by the MOSQITO_FILTER_CACHE environment variable or by
+# set_filter_cache)
+filter_cache = FilterCache(directory=os.environ.get("MOSQITO_FILTER_CACHE"))
+
+
+def set_filter_cache(maxsize=None, directory=None):
+    """Configure the cache shared by the filter design functions
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of designs kept in memory (unchanged if None)
+    directory : str
+        Directory of the on-disk store (unchanged if None, "" to disable
+        the on-disk store)
+    """
+    if maxsize is not None:
+        filter_cache.maxsize = maxsize
+        while len(filter_cache.designs) > maxsize:
+            filter_cache.designs.popitem(last=False)
+    if directory is not None:
+        filter_cache.directory = directory if directory != "" else None
+
+
+def cached_design(design):
+    """Decorator caching the output of a filter design function in the
+    shared filter cache
+
+    The key of the cache is made of the name of the function and of the
+    values of all its parameters (defaults included, so that f(fs),
+    f(fs, 3) and f(fs, n=3) share the same key). Calls with unhashable
+    arguments (arrays...) are not cached.
+
+    Parameters
+    ----------
+    design : function
+        Filter design function
+
+    Outputs
+    -------
+    cached : function
+        Function returning a copy of the cached output of design
+    """
+    name = design.__module__ + "." + design.__qualname__
+    signature = inspect.signature(design)
+
+    @functools.wraps(design)
+    def cached(*args, **kwargs):
+        try:
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            key = (name, tuple(arguments.arguments.items()))
+            hash(key)
+        except TypeError:
+            return design(*args, **kwargs)
+        return filter_cache.get(key, design, *args, **kwargs)
+
+    return cached
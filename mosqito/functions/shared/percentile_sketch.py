@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+
+
+class PercentileSketch:
+    """Bounded-error percentiles of several series of positive values
+    accumulated block by block
+
+    The values of each series are counted in logarithmic bins, so that the
+    memory use does not depend on the number of values. The percentiles
+    are computed with the same linear interpolation as numpy.percentile,
+    from the center of the bins: the relative error is lower than
+    rel_accuracy for values between min_value and max_value, the values
+    lower than min_value are counted as 0 (absolute error lower than
+    min_value) and the values higher than max_value are counted as
+    max_value. The maximum of each series is exact.
+
+    Parameters
+    ----------
+    n_series : int
+        Number of series
+    rel_accuracy : float
+        Relative accuracy of the percentiles
+    min_value : float
+        Lowest value distinguished from 0
+    max_value : float
+        Highest value counted without clipping
+
+    Example
+    -------
+    >>> sketch = PercentileSketch(240)
+    >>> for block in blocks:
+    ...     sketch.update(block)
+    >>> N5 = sketch.percentile(95)
+    """
+
+    def __init__(self, n_series, rel_accuracy=1e-3, min_value=1e-4, max_value=1e4):
+        self.n_series = n_series
+        self.min_value = min_value
+        # Bin i (i >= 1) contains the values between
+        # min_value * gamma**(i - 1) and min_value * gamma**i, bin 0 the
+        # values lower than min_value
+        self.gamma = (1 + rel_accuracy) / (1 - rel_accuracy)
+        self.n_bins = (
+            int(np.ceil(np.log(max_value / min_value) / np.log(self.gamma))) + 1
+        )
+        # Values of the bins with a relative error lower than rel_accuracy
+        self.bin_values = np.zeros(self.n_bins)
+        self.bin_values[1:] = (
+            2 * min_value * self.gamma ** np.arange(1, self.n_bins) / (self.gamma + 1)
+        )
+        self.counts = np.zeros((n_series, self.n_bins), dtype=np.int64)
+        self.max = np.full(n_series, -np.inf)
+        self.n_values = 0
+
+    def update(self, values):
+        """Count a block of values
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Values of the series (dim [n_series, time] or [time] for 1
+            series)
+        """
+        values = np.reshape(values, (self.n_series, -1))
+        if values.shape[1] == 0:
+            return
+        self.max = np.maximum(self.max, values.max(axis=1))
+        self.n_values += values.shape[1]
+        i_bins = np.zeros(values.shape, dtype=np.int64)
+        is_counted = values >= self.min_value
+        i_bins[is_counted] = np.clip(
+            np.ceil(np.log(values[is_counted] / self.min_value) / np.log(self.gamma)),
+            1,
+            self.n_bins - 1,
+        )
+        i_bins += np.arange(self.n_series)[:, np.newaxis] * self.n_bins
+        self.counts += np.bincount(
+            i_bins.ravel(), minlength=self.n_series * self.n_bins
+        ).reshape(self.n_series, self.n_bins)
+
+    def percentile(self, q):
+        """Percentile of each series
+
+        Parameters
+        ----------
+        q : float
+            Percentile to compute, between 0 and 100
+
+        Outputs
+        -------
+        values : numpy.ndarray
+            Percentile of each series (dim [n_series])
+        """
+        if self.n_values == 0:
+            raise ValueError("ERROR: no value has been counted")
+        # Ranks of the sorted values around the percentile
+        rank = q / 100 * (self.n_values - 1)
+        rank_low = int(np.floor(rank))
+        rank_high = min(rank_low + 1, self.n_values - 1)
+        cum_counts = np.cumsum(self.counts, axis=1)
+        value_low = self.bin_values[
+            [np.searchsorted(c, rank_low, side="right") for c in cum_counts]
+        ]
+        value_high = self.bin_values[
+            [np.searchsorted(c, rank_high, side="right") for c in cum_counts]
+        ]
+        values = value_low + (rank - rank_low) * (value_high - value_low)
+        # The maximum is exact
+        if q == 100:
+            return self.max.copy()
+        return np.minimum(values, self.max)
@@ -11,19 +11,23 @@ from mosqito.functions.oct3filter.calc_third_octave_levels import (
 from mosqito.functions.oct3filter.oct3spec import oct3spec
 
 
-def comp_3oct_spec(self, unit="dB"):
+def comp_3oct_spec(self, unit="dB", method="time"):
     """Method to compute third-octave spectrum according to ISO
 
     Parameter
     ---------
     unit : string
         'dB' or 'dBA'
+    method : string
+        for stationary signals, 'time' (by default, filter bank) or 'fft'
+        (power spectrum integrated over the filter responses), see
+        oct3spec
 
     """
 
     # Compute third octave band spectrum
     if self.is_stationary:
-        third_spec, freq_val = oct3spec(self.signal.values, self.fs)
+        third_spec, freq_val = oct3spec(self.signal.values, self.fs, method=method)
     else:
         third_spec, freq_val, time_val = calc_third_octave_levels(
             self.signal.values, self.fs
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import numpy as np
 from SciDataTool import DataLinspace, DataTime, DataFreq, Data1D
 
 from mosqito.functions.loudness_zwicker.loudness_zwicker_stationary import (
@@ -10,13 +11,19 @@ from mosqito.functions.loudness_zwicker.loudness_zwicker_time import (
 )
 
 
-def compute_loudness(self, field_type="free"):
+def compute_loudness(self, field_type="free", out=None, dtype=np.float64):
     """Method to compute the loudness according to Zwicker's method
 
     Parameter
     ----------
     field-type: string
         'free' by default or 'diffuse'
+    out: numpy.array
+        for time-varying signals, array where the specific loudness is
+        written, e.g. a numpy.memmap or a h5py dataset (None by default)
+    dtype: numpy.dtype
+        for time-varying signals, data type of the specific loudness if
+        out is None (np.float64 by default)
 
     """
 
@@ -45,7 +52,10 @@ def compute_loudness(self, field_type="free"):
         axes = [barks]
     else:
         N, N_specific = loudness_zwicker_time(
-            self.third_spec.get_along("freqs", "time", unit="dB")["x"], field_type
+            self.third_spec.get_along("freqs", "time", unit="dB")["x"],
+            field_type,
+            out,
+            dtype,
         )
         # Get time axis
         # Decimation from temporal resolution 0.5 ms to 2ms
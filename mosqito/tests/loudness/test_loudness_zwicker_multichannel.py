@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.shared.load import load
+from mosqito.functions.loudness_zwicker.comp_loudness import comp_loudness
+
+
+@pytest.mark.loudness_zwtv  # to skip or run only loudness zwicker time-varying tests
+def test_loudness_zwicker_multichannel():
+    """Test function for the time-varying loudness of multichannel signals
+
+    The loudness of a 2 channels signal (ISO 532-1 annex B4, test signal 6
+    and the same signal reversed and attenuated) shall be identical to the
+    loudness of each channel computed separately.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    None
+    """
+    sig, fs = load(
+        False,
+        "mosqito/tests/loudness/data/ISO_532-1/Annex B.4/Test signal 6 (tone 250 Hz 30 dB - 80 dB).wav",
+        calib=2 * 2 ** 0.5,
+    )
+    sig = sig[:fs]
+    sig = np.stack((sig, 0.5 * sig[::-1]))
+
+    loudness = comp_loudness(False, sig, fs)
+
+    assert loudness["values"].shape[0] == 2
+    assert loudness["specific values"].shape[:2] == (2, 240)
+    for i_channel in range(2):
+        loudness_channel = comp_loudness(False, sig[i_channel], fs)
+        assert np.array_equal(loudness["values"][i_channel], loudness_channel["values"])
+        assert np.array_equal(
+            loudness["specific values"][i_channel], loudness_channel["specific values"]
+        )
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.loudness_zwicker.loudness_zwicker_nonlinear_decay import (
+    calc_nl_loudness,
+    calc_nl_init,
+    calc_nl_run,
+)
+
+
+@pytest.mark.loudness_zwtv  # to skip or run only loudness zwicker time-varying tests
+def test_loudness_zwicker_nonlinear_decay():
+    """Test function for the nonlinear temporal decay computed by chunks
+
+    The core loudness of fluctuating noises, of tone bursts and of a
+    sound followed by silence (the decay then needs more than one chunk to
+    forget its initial state) is processed by time chunks. The output
+    shall be identical to the sample by sample calculation.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    None
+    """
+    rng = np.random.default_rng(0)
+    num_samples = 2501
+    core_loudness = np.abs(rng.standard_normal((6, num_samples))).cumsum(axis=1)
+    core_loudness = core_loudness % 3
+    core_loudness[1] = np.repeat(rng.uniform(0, 2, num_samples // 50 + 1), 50)[
+        :num_samples
+    ]
+    core_loudness[2, 100:] = 0
+    core_loudness[3, ::200] += 5
+
+    nl_ref = calc_nl_run(core_loudness, calc_nl_init(6))
+    nl_loudness = calc_nl_loudness(core_loudness)
+
+    assert np.array_equal(nl_loudness[:, :-1], nl_ref)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.loudness_zwicker.loudness_zwicker_stationary import (
+    loudness_zwicker_stationary,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_stationary_batch import (
+    loudness_zwicker_stationary_batch,
+)
+
+
+@pytest.mark.loudness_zwst  # to skip or run only loudness zwicker stationary tests
+def test_loudness_zwicker_stationary_batch():
+    """Test function for the script loudness_zwicker_stationary_batch
+
+    The loudness of a batch of random third octave spectra shall be
+    identical to the loudness of each spectrum computed with
+    loudness_zwicker_stationary, in free and diffuse field.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    None
+    """
+    spectra = np.random.default_rng(0).uniform(-10, 100, (28, 50))
+
+    for field_type in ["free", "diffuse"]:
+        N, N_specific = loudness_zwicker_stationary_batch(
+            spectra, field_type=field_type
+        )
+
+        assert N.shape == (50,)
+        assert N_specific.shape == (240, 50)
+        for k in range(spectra.shape[1]):
+            N_k, N_specific_k = loudness_zwicker_stationary(
+                spectra[:, k], field_type=field_type
+            )
+            assert N[k] == N_k
+            assert np.array_equal(N_specific[:, k], N_specific_k)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.shared.load import load
+from mosqito.functions.oct3filter.calc_third_octave_levels import (
+    calc_third_octave_levels,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_time import (
+    loudness_zwicker_time,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_stream import (
+    ZwickerLoudnessStream,
+)
+
+
+@pytest.mark.loudness_zwtv  # to skip or run only loudness zwicker time-varying tests
+def test_loudness_zwicker_stream():
+    """Test function for the class ZwickerLoudnessStream
+
+    The signal (ISO 532-1 annex B4, test signal 6) is processed by
+    blocks of random length, the concatenated outputs shall be identical
+    to the output of loudness_zwicker_time for the whole signal.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    None
+    """
+    sig, fs = load(
+        False,
+        "mosqito/tests/loudness/data/ISO_532-1/Annex B.4/Test signal 6 (tone 250 Hz 30 dB - 80 dB).wav",
+        calib=2 * 2 ** 0.5,
+    )
+    sig = sig[: fs + 101]
+
+    # Loudness of the whole signal
+    third_octave_levels, _, _ = calc_third_octave_levels(sig, fs)
+    N, N_specific = loudness_zwicker_time(third_octave_levels, "free")
+
+    # Loudness block by block
+    stream = ZwickerLoudnessStream("free", fs)
+    block_limits = np.sort(np.random.default_rng(0).integers(0, len(sig), 30))
+    outputs = [stream.process(block) for block in np.split(sig, block_limits)]
+    outputs.append(stream.flush())
+    N_stream = np.concatenate([out[0] for out in outputs])
+    N_specific_stream = np.concatenate([out[1] for out in outputs], axis=1)
+
+    assert np.array_equal(N_stream, N)
+    assert np.array_equal(N_specific_stream, N_specific)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.shared.load import load
+from mosqito.functions.loudness_zwicker.comp_loudness import comp_loudness
+
+
+@pytest.mark.loudness_zwtv  # to skip or run only loudness zwicker time-varying tests
+def test_loudness_zwicker_time_out(tmp_path):
+    """Test function for the output options of loudness_zwicker_time
+
+    The specific loudness of the signal (ISO 532-1 annex B4, test signal 6)
+    written in float32 to a numpy.memmap, and in float16, shall be equal
+    to the float64 specific loudness rounded to these data types.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory (pytest fixture)
+
+    Outputs
+    -------
+    None
+    """
+    sig, fs = load(
+        False,
+        "mosqito/tests/loudness/data/ISO_532-1/Annex B.4/Test signal 6 (tone 250 Hz 30 dB - 80 dB).wav",
+        calib=2 * 2 ** 0.5,
+    )
+    loudness = comp_loudness(False, sig, fs)
+    N_specific = loudness["specific values"]
+
+    out = np.lib.format.open_memmap(
+        tmp_path / "N_specific.npy", mode="w+", dtype=np.float32, shape=N_specific.shape
+    )
+    loudness_memmap = comp_loudness(False, sig, fs, out=out)
+    out.flush()
+    assert loudness_memmap["specific values"] is out
+    assert np.array_equal(loudness_memmap["values"], loudness["values"])
+    assert np.array_equal(
+        np.load(tmp_path / "N_specific.npy"), N_specific.astype(np.float32)
+    )
+
+    loudness_f16 = comp_loudness(False, sig, fs, dtype=np.float16)
+    assert loudness_f16["specific values"].dtype == np.float16
+    assert np.array_equal(
+        loudness_f16["specific values"], N_specific.astype(np.float16)
+    )
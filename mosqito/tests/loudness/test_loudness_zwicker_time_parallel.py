@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.shared.load import load
+from mosqito.functions.loudness_zwicker.comp_loudness import comp_loudness
+
+
+@pytest.mark.loudness_zwtv  # to skip or run only loudness zwicker time-varying tests
+def test_loudness_zwicker_time_parallel():
+    """Test function for the script loudness_zwicker_time_parallel
+
+    The loudness of the signal (ISO 532-1 annex B4, test signal 6)
+    computed by chunks of 1 s in parallel processes shall not differ by
+    more than 1e-6 sone from the loudness of the whole signal.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    None
+    """
+    sig, fs = load(
+        False,
+        "mosqito/tests/loudness/data/ISO_532-1/Annex B.4/Test signal 6 (tone 250 Hz 30 dB - 80 dB).wav",
+        calib=2 * 2 ** 0.5,
+    )
+
+    loudness = comp_loudness(False, sig, fs)
+    loudness_chunks = comp_loudness(False, sig, fs, chunk_duration=1, max_workers=2)
+
+    assert loudness_chunks["values"].shape == loudness["values"].shape
+    assert np.allclose(loudness_chunks["values"], loudness["values"], rtol=0, atol=1e-6)
+    assert np.allclose(
+        loudness_chunks["specific values"],
+        loudness["specific values"],
+        rtol=0,
+        atol=1e-6,
+    )
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.shared.load import load
+from mosqito.functions.loudness_zwicker.comp_loudness import comp_loudness
+
+
+@pytest.mark.loudness_zwtv  # to skip or run only loudness zwicker time-varying tests
+def test_loudness_zwicker_time_stats():
+    """Test function for the script loudness_zwicker_time_stats
+
+    The N5, N10 and Nmax statistics of the loudness of the signal (ISO
+    532-1 annex B4, test signal 6) accumulated while the signal is
+    processed by blocks shall not differ by more than 0.1 % from the
+    percentiles of the loudness over time, Nmax shall be exact.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    None
+    """
+    sig, fs = load(
+        False,
+        "mosqito/tests/loudness/data/ISO_532-1/Annex B.4/Test signal 6 (tone 250 Hz 30 dB - 80 dB).wav",
+        calib=2 * 2 ** 0.5,
+    )
+
+    loudness = comp_loudness(False, sig, fs)
+    loudness_stats = comp_loudness(False, sig, fs, statistics=[5, 10])
+
+    N = loudness["values"]
+    N_specific = loudness["specific values"]
+    for x in [5, 10]:
+        key = "N{}".format(x)
+        assert np.isclose(
+            loudness_stats["values"][key], np.percentile(N, 100 - x), rtol=1e-3
+        )
+        assert np.allclose(
+            loudness_stats["specific values"][key],
+            np.percentile(N_specific, 100 - x, axis=1),
+            rtol=1e-3,
+            atol=1e-4,
+        )
+    assert loudness_stats["values"]["Nmax"] == N.max()
+    assert np.array_equal(loudness_stats["specific values"]["Nmax"], N_specific.max(1))
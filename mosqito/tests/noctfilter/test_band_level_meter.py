@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.noctfilter.n_oct_filter import getFrequencies
+from mosqito.functions.noctfilter.filter_bank import FilterBank
+from mosqito.functions.noctfilter.band_level_meter import BandLevelMeter
+
+
+@pytest.mark.noctfilter  # to skip or run only n-octave filter bank tests
+def test_band_level_meter():
+    """Test function for the class BandLevelMeter
+
+    The levels of a multichannel signal processed by blocks of random
+    lengths shall be equal to the levels per frame of the whole signal
+    computed by FilterBank, for third octave and octave bands.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    None
+    """
+    fs = 48000
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((2 * fs + 1000, 2))
+    for b in [1, 3]:
+        levels_ref = FilterBank(getFrequencies(25, 12500, b), fs).levels(
+            data, frame_size=6000
+        )
+        meter = BandLevelMeter(25, 12500, b, fs, frame_duration=0.125)
+        levels = []
+        i_start = 0
+        while i_start < data.shape[0]:
+            block_size = rng.integers(1, 10000)
+            levels.append(meter.process(data[i_start : i_start + block_size]))
+            i_start += block_size
+        levels.append(meter.flush())
+        levels = np.concatenate(levels)
+        assert levels.shape == levels_ref.shape
+        assert np.allclose(levels, levels_ref, atol=1e-9)
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.noctfilter.n_oct_filter import (
+    getFrequencies,
+    designFilters,
+    filterData,
+)
+from mosqito.functions.noctfilter.filter_bank import FilterBank
+
+
+@pytest.mark.noctfilter  # to skip or run only n-octave filter bank tests
+def test_filter_bank():
+    """Test function for the class FilterBank
+
+    The signals filtered by the filter bank, with or without threads,
+    shall be identical to the signals filtered by filterData, and the rms
+    values per frame shall be consistent with the overall rms values.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    None
+    """
+    fs = 48000
+    data = np.random.default_rng(0).standard_normal((fs, 2))
+    freqDict = getFrequencies(25, 12500, 3)
+    filteredSignal = filterData(designFilters(freqDict, fs), data)
+
+    bank = FilterBank(freqDict, fs)
+    assert np.array_equal(bank.filter(data), filteredSignal)
+    bank_threads = FilterBank(freqDict, fs, max_workers=4)
+    assert np.array_equal(bank_threads.filter(data), filteredSignal)
+
+    rmsSignal = bank.rms(data)
+    assert rmsSignal.shape == (bank.n_bands, 2)
+    assert np.allclose(rmsSignal, np.sqrt(np.mean(filteredSignal ** 2, axis=0)))
+    rmsFrames = bank.rms(data, frame_size=6000)
+    assert rmsFrames.shape == (8, bank.n_bands, 2)
+    assert np.allclose(np.sqrt(np.mean(rmsFrames ** 2, axis=0)), rmsSignal)
+    assert np.allclose(
+        bank.levels(data[:, 0]), 20 * np.log10((rmsSignal[:, 0] + 1e-12) / 2e-5)
+    )
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard library imports
+from concurrent.futures import ThreadPoolExecutor
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.oct3filter.calc_third_octave_levels import (
+    calc_third_octave_levels,
+)
+
+
+@pytest.mark.oct3filter  # to skip or run only third octave filter tests
+def test_calc_third_octave_levels_parallel():
+    """Test function for the third octave levels computed by a thread pool
+
+    The levels of a white noise, mono or multichannel, computed by a pool
+    of threads, created for the call or given, shall be identical to the
+    levels computed by the calling thread.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    None
+    """
+    fs = 48000
+    noise = np.random.default_rng(0).standard_normal((2, fs)) * 0.1
+    for sig in [noise[0], noise]:
+        levels_ref, freq_ref, time_ref = calc_third_octave_levels(
+            sig, fs, block_size=20000
+        )
+
+        levels, freq, time = calc_third_octave_levels(
+            sig, fs, block_size=20000, max_workers=2
+        )
+        assert np.array_equal(levels, levels_ref)
+        assert np.array_equal(freq, freq_ref)
+        assert np.array_equal(time, time_ref)
+
+        with ThreadPoolExecutor(2) as executor:
+            levels, _, _ = calc_third_octave_levels(
+                sig, fs, block_size=20000, executor=executor
+            )
+        assert np.array_equal(levels, levels_ref)
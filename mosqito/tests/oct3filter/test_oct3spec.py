@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.oct3filter.oct3spec import oct3spec, oct3bands
+from mosqito.functions.oct3filter.oct3level import oct3level
+
+
+@pytest.mark.oct3filter  # to skip or run only third octave filter tests
+def test_oct3spec():
+    """Test function for the third octave spectrum computed with the
+    octave decimation tree
+
+    The time-varying levels of a pink-ish noise shall be identical to the
+    levels computed band by band by oct3level (same decimation factors),
+    and the stationary levels shall not differ by more than 0.01 dB.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    None
+    """
+    fs = 48000
+    sig = np.cumsum(np.random.default_rng(0).standard_normal(fs)) * 2e-3
+    fexact, _ = oct3bands(25, 12500)
+
+    spec, _ = oct3spec(sig, fs, 25, 12500, sig_type="time-varying", dec_factor=24)
+    spec_ref = np.array([oct3level(sig, fs, fc, "time-varying", 24) for fc in fexact])
+    spec_ref = 20 * np.log10((spec_ref + 1e-12) / (2 * 10 ** -5))
+    assert np.array_equal(spec, spec_ref)
+
+    spec, _ = oct3spec(sig, fs, 25, 12500)
+    spec_ref = np.array([oct3level(sig, fs, fc) for fc in fexact])
+    spec_ref = 20 * np.log10((spec_ref + 1e-12) / (2 * 10 ** -5))
+    assert np.allclose(spec[:, 0], spec_ref, rtol=0, atol=0.01)
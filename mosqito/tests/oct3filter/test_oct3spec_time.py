@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.oct3filter.oct3spec import oct3spec
+from mosqito.functions.oct3filter.oct3spec_time import oct3spec_time
+
+
+@pytest.mark.oct3filter  # to skip or run only third octave filter tests
+def test_oct3spec_time():
+    """Test function for the script oct3spec_time
+
+    The energy average of the linearly averaged levels of a white noise
+    shall be equal to its stationary third octave spectrum, the "fast"
+    level of a 1 kHz tone shall reach its stationary level in its band,
+    the frames shall cover the signal for any sampling frequency, and the
+    frames shorter than the sampling period of a band shall hold its last
+    sample.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    None
+    """
+    fs = 48000
+    noise = np.random.default_rng(0).standard_normal(2 * fs) * 0.1
+    spec_ref, fpref_ref = oct3spec(noise, fs)
+    spec, fpref, time_axis = oct3spec_time(noise, fs, averaging="linear")
+    assert np.array_equal(fpref, fpref_ref)
+    assert spec.shape == (28, 16)
+    assert np.allclose(time_axis, np.arange(1, 17) * 0.125)
+    spec_mean = 10 * np.log10(np.mean(10 ** (spec / 10), axis=1))
+    assert np.allclose(spec_mean, spec_ref[:, 0], atol=0.01)
+
+    tone = 0.02 * np.sin(2 * np.pi * 1000 * np.arange(2 * fs) / fs)
+    spec_ref, _ = oct3spec(tone, fs)
+    spec, fpref, time_axis = oct3spec_time(tone, fs, averaging="fast")
+    i_band = np.flatnonzero(fpref == 1000)[0]
+    assert np.allclose(spec[i_band, 8:], spec_ref[i_band, 0], atol=0.1)
+
+    fs = 44100
+    spec, fpref, time_axis = oct3spec_time(noise[:fs], fs, time_resolution=0.01)
+    assert spec.shape == (len(fpref), 100)
+    assert time_axis[-1] == 1
+
+    # Frames shorter than the sampling period of the 25 Hz band (decimated
+    # by 16): the frames without any sample hold the last sample
+    fs = 48000
+    spec_ref, _, _ = oct3spec_time(
+        noise[: fs // 10], fs, fc_max=25, time_resolution=16 / fs, averaging="linear"
+    )
+    spec, _, _ = oct3spec_time(
+        noise[: fs // 10], fs, fc_max=25, time_resolution=4 / fs, averaging="linear"
+    )
+    assert np.array_equal(spec[0], np.repeat(spec_ref[0], 4))
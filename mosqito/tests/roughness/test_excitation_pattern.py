@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.roughness_danielweber.comp_roughness import (
+    roughness_spectrum,
+)
+from mosqito.functions.roughness_danielweber.excitation_pattern import (
+    excitation_pattern,
+)
+from mosqito.functions.roughness_danielweber.roughness_plan import RoughnessPlan
+from mosqito.validations.roughness_danielweber.benchmark_roughness_stages import (
+    excitation_pattern_loops,
+)
+
+
+@pytest.mark.roughness_dw  # to skip or run only Daniel and Weber roughness tests
+def test_excitation_pattern():
+    """Test function for the script excitation_pattern
+
+    The excitation pattern of the audible components of a white noise
+    frame, completed by components located exactly on the channel limits,
+    shall be identical to the one computed by loops over the components
+    and the channels.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    None
+    """
+    fs = 48000
+    plan = RoughnessPlan(fs)
+    noise = np.random.default_rng(0).standard_normal(plan.n) * 2e-5 * 10 ** (70 / 20)
+    _, _, spec_dB = roughness_spectrum(noise, plan)
+    audible_index = np.where(spec_dB > plan.threshold)[0]
+    assert audible_index.size > 1000
+
+    # Components on the limits of the 47 channels (multiples of 0.5 Bark)
+    barks_limits = np.arange(1, 48) * 0.5
+    freqs = np.append(
+        plan.freqs[audible_index], np.interp(barks_limits, plan.barks, plan.freqs)
+    )
+    barks = np.append(plan.barks[audible_index], barks_limits)
+    levels = np.append(spec_dB[audible_index], np.full(barks_limits.size, 60.0))
+
+    slopes_ref = excitation_pattern_loops(freqs, barks, levels, plan.minExcitDB)
+    slopes = excitation_pattern(freqs, barks, levels, plan.minExcitDB)
+    for ref, new in zip(slopes_ref, slopes):
+        assert np.array_equal(new, ref)
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.roughness_danielweber.comp_roughness import comp_roughness
+from mosqito.functions.roughness_danielweber.roughness_plan import RoughnessPlan
+from mosqito.tests.roughness.signals_test_generation import signal_test
+
+
+@pytest.mark.roughness_dw  # to skip or run only Daniel and Weber roughness tests
+def test_roughness_fast():
+    """Test function for the fast mode of the roughness calculation
+
+    The roughness of amplitude-modulated signals computed with decimated
+    envelopes shall be close to the roughness computed in default mode,
+    and identical when computed by a pool of processes. The decimated
+    envelopes shall be long enough for the weighting functions H.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    None
+    """
+    fs = 48000
+    plan = RoughnessPlan(fs)
+    for fc, fmod in [(250, 30), (1000, 70), (4000, 120)]:
+        stimulus = signal_test(fc=fc, fmod=fmod, mdepth=1, fs=fs, d=0.6, dB=60)
+        R_ref = comp_roughness(stimulus, fs, overlap=0.5, plan=plan)
+        R = comp_roughness(stimulus, fs, overlap=0.5, plan=plan, fast=True)
+        assert np.allclose(R["values"], R_ref["values"], atol=0.02)
+
+    R_parallel = comp_roughness(stimulus, fs, 0.5, plan=plan, max_workers=2, fast=True)
+    assert np.array_equal(R_parallel["values"], R["values"])
+
+    with pytest.raises(ValueError):
+        RoughnessPlan(fs, n_envelope=128)
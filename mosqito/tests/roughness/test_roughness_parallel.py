@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard imports
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.roughness_danielweber.comp_roughness import comp_roughness
+from mosqito.tests.roughness.signals_test_generation import signal_test
+
+
+@pytest.mark.roughness_dw  # to skip or run only Daniel and Weber roughness tests
+def test_roughness_parallel():
+    """Test function for the roughness calculation by a pool of processes
+
+    The roughness of an amplitude-modulated signal computed by a pool of
+    processes, created for the call or given, shall be identical to the
+    roughness computed by the calling process.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    None
+    """
+    fs = 44100
+    stimulus = signal_test(fc=1000, fmod=70, mdepth=1, fs=fs, d=3, dB=60)
+    R_ref = comp_roughness(stimulus, fs, overlap=0.5)
+
+    R = comp_roughness(stimulus, fs, overlap=0.5, max_workers=2)
+    assert np.array_equal(R["values"], R_ref["values"])
+    assert np.array_equal(R["time"], R_ref["time"])
+
+    with ProcessPoolExecutor(2) as executor:
+        R = comp_roughness(stimulus, fs, overlap=0.5, executor=executor)
+    assert np.array_equal(R["values"], R_ref["values"])
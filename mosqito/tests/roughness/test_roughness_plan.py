@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.roughness_danielweber.comp_roughness import comp_roughness
+from mosqito.functions.roughness_danielweber.roughness_plan import RoughnessPlan
+from mosqito.tests.roughness.signals_test_generation import signal_test
+
+
+@pytest.mark.roughness_dw  # to skip or run only Daniel and Weber roughness tests
+def test_roughness_plan():
+    """Test function for the class RoughnessPlan
+
+    The roughness of amplitude-modulated signals computed with a plan
+    reused from one signal to another shall be equal to the roughness
+    computed without plan, and a plan shall not be used at another
+    sampling frequency.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    None
+    """
+    fs = 44100
+    plan = RoughnessPlan(fs)
+    for fmod in [30, 70]:
+        stimulus = signal_test(fc=1000, fmod=fmod, mdepth=1, fs=fs, d=0.6, dB=60)
+        R_ref = comp_roughness(stimulus, fs, overlap=0.5)
+        R = comp_roughness(stimulus, fs, overlap=0.5, plan=plan)
+        assert np.array_equal(R["values"], R_ref["values"])
+
+    with pytest.raises(ValueError):
+        comp_roughness(stimulus, 48000, overlap=0.5, plan=plan)
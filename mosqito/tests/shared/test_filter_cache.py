@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from mosqito.functions.shared.filter_cache import FilterCache, filter_cache
+from mosqito.functions.oct3filter.oct3dsgn import oct3dsgn
+
+
+@pytest.mark.filter_cache  # to skip or run only filter design cache tests
+def test_filter_cache(tmp_path):
+    """Test function for the filter design cache
+
+    The cached designs shall be identical to the designs computed from
+    scratch, the cache shall return copies of the designs, index them by
+    the values of all the design parameters, evict the least recently
+    used designs and share the designs through its on-disk store.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory of the on-disk store (pytest fixture)
+
+    Outputs
+    -------
+    None
+    """
+    # Cached oct3dsgn designs
+    b_ref, a_ref = oct3dsgn.__wrapped__(1000, 48000, 3)
+    oct3dsgn(1000, 48000, 3)
+    hits = filter_cache.hits
+    b, a = oct3dsgn(1000, 48000, 3)
+    assert filter_cache.hits == hits + 1
+    assert np.array_equal(b, b_ref) and np.array_equal(a, a_ref)
+    b[:] = 0
+    b, a = oct3dsgn(1000, 48000, 3)
+    assert np.array_equal(b, b_ref)
+    # (same key with default or keyword arguments)
+    oct3dsgn(1000, 48000)
+    oct3dsgn(1000, fs=48000, n=3)
+    assert filter_cache.hits == hits + 4
+
+    # Least recently used eviction
+    cache = FilterCache(maxsize=2)
+    for fc in [500, 1000, 500, 2000]:
+        cache.get(("oct3dsgn", fc), oct3dsgn.__wrapped__, fc, 48000)
+    assert list(cache.designs) == [("oct3dsgn", 500), ("oct3dsgn", 2000)]
+    assert cache.hits == 1 and cache.misses == 3
+
+    # On-disk store shared by two caches
+    cache = FilterCache(directory=str(tmp_path))
+    cache.get(("oct3dsgn", 1000), oct3dsgn.__wrapped__, 1000, 48000)
+    cache = FilterCache(directory=str(tmp_path))
+    b, a = cache.get(("oct3dsgn", 1000), oct3dsgn.__wrapped__, 1000, 48000)
+    assert cache.hits == 1 and cache.misses == 0
+    assert np.array_equal(b, b_ref) and np.array_equal(a, a_ref)
+
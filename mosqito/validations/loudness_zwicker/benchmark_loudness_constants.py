@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard library imports
+import timeit
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from mosqito.functions.oct3filter.calc_third_octave_levels import (
+    calc_third_octave_init,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_shared import (
+    calc_main_loudness,
+    calc_slopes,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_nonlinear_decay import (
+    calc_nl_init,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_stationary import (
+    loudness_zwicker_stationary,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_stream import (
+    ZwickerLoudnessStream,
+)
+
+
+def benchmark_loudness_constants(n_calls=2000):
+    """Computation time per call of the Zwicker loudness functions on the
+    smallest inputs (one spectrum, one time frame, one 2 ms block of
+    signal), where the fixed cost of each call dominates
+
+    Parameters
+    ----------
+    n_calls : int
+        Number of calls of each function
+
+    Outputs
+    -------
+    comp_time : dict
+        Computation time per call of each function [s]
+    """
+    rng = np.random.default_rng(0)
+    spec_third = rng.uniform(20, 90, 28)
+    core_loudness = calc_main_loudness(spec_third, "free")
+    sig = rng.normal(0, 0.1, 96 * n_calls)
+    stream = ZwickerLoudnessStream("free", 48000)
+    blocks = iter(np.split(sig, n_calls))
+
+    functions = {
+        "calc_third_octave_init": lambda: calc_third_octave_init(48000),
+        "calc_nl_init": lambda: calc_nl_init(21),
+        "calc_main_loudness (1 spectrum)": lambda: calc_main_loudness(
+            spec_third, "free"
+        ),
+        "calc_slopes (1 frame)": lambda: calc_slopes(core_loudness),
+        "loudness_zwicker_stationary": lambda: loudness_zwicker_stationary(
+            spec_third
+        ),
+        "ZwickerLoudnessStream.process (2 ms)": lambda: stream.process(next(blocks)),
+    }
+    comp_time = {}
+    for name, function in functions.items():
+        comp_time[name] = timeit.timeit(function, number=n_calls) / n_calls
+        print("{:40s} {:10.1f} us".format(name, comp_time[name] * 1e6))
+    return comp_time
+
+
+if __name__ == "__main__":
+    benchmark_loudness_constants()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard library imports
+import time
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from mosqito.functions.loudness_zwicker.loudness_zwicker_stationary import (
+    loudness_zwicker_stationary,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_stationary_batch import (
+    loudness_zwicker_stationary_batch,
+)
+
+
+def benchmark_loudness_stationary_batch(n_spectra=10000, field_type="free"):
+    """Throughput of loudness_zwicker_stationary_batch versus a loop on
+    loudness_zwicker_stationary
+
+    Random third octave spectra between -10 and 100 dB are processed in
+    one batch and one by one, the results are checked to be identical.
+    One by one, calc_slopes processes each spectrum band by band (see
+    calc_slopes_spectrum), at the cost per spectrum of the implementation
+    preceding the batch processing.
+
+    Parameters
+    ----------
+    n_spectra : int
+        Number of spectra
+    field_type : str
+        Type of soundfield ("free" by default or "diffuse")
+
+    Outputs
+    -------
+    throughput_batch : float
+        Number of spectra processed per second in batch
+    throughput_loop : float
+        Number of spectra processed per second one by one
+    """
+    spectra = np.random.default_rng(0).uniform(-10, 100, (28, n_spectra))
+
+    t_start = time.perf_counter()
+    N, N_specific = loudness_zwicker_stationary_batch(spectra, field_type=field_type)
+    throughput_batch = n_spectra / (time.perf_counter() - t_start)
+
+    t_start = time.perf_counter()
+    results = [
+        loudness_zwicker_stationary(spectra[:, k], field_type=field_type)
+        for k in range(n_spectra)
+    ]
+    throughput_loop = n_spectra / (time.perf_counter() - t_start)
+
+    assert np.array_equal(N, [res[0] for res in results])
+    assert np.array_equal(N_specific, np.stack([res[1] for res in results], axis=1))
+    print(
+        "{} spectra: batch {:.0f} spectra/s, loop {:.0f} spectra/s, "
+        "speedup x{:.1f}".format(
+            n_spectra,
+            throughput_batch,
+            throughput_loop,
+            throughput_batch / throughput_loop,
+        )
+    )
+    return throughput_batch, throughput_loop
+
+
+if __name__ == "__main__":
+    benchmark_loudness_stationary_batch()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard library imports
+import time
+
+# Third party imports
+import numpy as np
+from scipy import signal
+
+# Local application imports
+from mosqito.functions.shared.load import load
+from mosqito.functions.oct3filter.oct3level import oct3level, oct3dec
+from mosqito.functions.oct3filter.oct3spec import oct3spec
+from mosqito.functions.oct3filter.oct3tree import oct3tree, oct3tree_factors
+
+
+def benchmark_oct3tree(data_file, duration=60):
+    """Computation time of the decimations of oct3spec with and without
+    the octave decimation tree
+
+    The decimations of the signal done by oct3spec with the octave
+    decimation tree (see oct3tree) are compared to the decimations done
+    separately for each band (one decimation of the full rate signal per
+    band, see oct3level) and to one full rate anti-aliasing filtering
+    pass (decimation of the full rate signal by 2).
+    The stationary spectrum with the tree is compared to the spectrum
+    computed band by band with oct3level.
+
+    Parameters
+    ----------
+    data_file : str
+        Path to the .wav signal
+    duration : float
+        Duration of the signal [s]
+
+    Outputs
+    -------
+    time_bands : float
+        Computation time of the decimations done for each band [s]
+    time_tree : float
+        Computation time of the decimations of the tree [s]
+    time_filter : float
+        Computation time of one full rate filtering pass [s]
+    """
+    sig, fs = load(False, data_file, calib=2 * 2 ** 0.5)
+    sig = np.resize(sig, int(duration * fs))
+    # Exact center frequencies of the bands of oct3spec (base 10)
+    fexact = 10 ** (np.arange(14, 42) / 10)
+
+    # Decimations done for each band
+    fs_divisor = [n for n in range(1, (fs + 1)) if fs % n == 0]
+    t_start = time.perf_counter()
+    for fc in fexact:
+        factor = oct3dec(fs, fc, fs_divisor)
+        if factor > 1:
+            signal.decimate(sig, factor)
+    time_bands = time.perf_counter() - t_start
+
+    # Decimations of the tree
+    t_start = time.perf_counter()
+    oct3tree(sig, oct3tree_factors(fs, fexact[0]))
+    time_tree = time.perf_counter() - t_start
+
+    # Full rate anti-aliasing filtering pass
+    t_start = time.perf_counter()
+    signal.decimate(sig, 2)
+    time_filter = time.perf_counter() - t_start
+
+    print(
+        "Decimations per band: {:.2f} s ({:.1f} filtering passes)".format(
+            time_bands, time_bands / time_filter
+        )
+    )
+    print(
+        "Decimation tree: {:.2f} s ({:.1f} filtering passes)".format(
+            time_tree, time_tree / time_filter
+        )
+    )
+
+    # Spectrum with and without the tree
+    spec, _ = oct3spec(sig, fs)
+    spec_bands = np.array([oct3level(sig, fs, fc) for fc in fexact])
+    spec_bands = 20 * np.log10((spec_bands + 1e-12) / (2 * 10 ** -5))
+    print(
+        "Max. level difference: {:.3f} dB".format(
+            np.max(np.abs(spec[:, 0] - spec_bands))
+        )
+    )
+    return time_bands, time_tree, time_filter
+
+
+if __name__ == "__main__":
+    benchmark_oct3tree(
+        "./mosqito/validations/loudness_zwicker/data/ISO_532-1/Test signal 5 (pinknoise 60 dB).wav"
+    )
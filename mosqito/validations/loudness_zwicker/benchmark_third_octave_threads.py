@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard library imports
+import os
+import time
+
+# Third party imports
+import numpy as np
+import matplotlib.pyplot as plt
+
+# Local application imports
+from mosqito.functions.shared.load import load
+from mosqito.functions.oct3filter.calc_third_octave_levels import (
+    calc_third_octave_levels,
+)
+
+
+def benchmark_third_octave_threads(data_file, duration=600, max_workers=None):
+    """Computation time of calc_third_octave_levels versus the number of
+    threads processing the bands
+
+    The signal is repeated to the given duration, the levels computed
+    with threads are checked to be identical to the levels computed
+    without thread. One .png scaling plot is generated.
+
+    Parameters
+    ----------
+    data_file : str
+        Path to the .wav signal
+    duration : float
+        Duration of the signal [s]
+    max_workers : int
+        Maximum number of threads (number of cores by default)
+
+    Outputs
+    -------
+    n_workers : numpy.ndarray
+        Number of threads
+    comp_time : numpy.ndarray
+        Computation times [s]
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count()
+    sig, fs = load(False, data_file, calib=2 * 2 ** 0.5)
+    sig = np.resize(sig, int(duration * fs))
+
+    n_workers = np.arange(1, max_workers + 1)
+    comp_time = np.zeros(n_workers.size)
+    for i, workers in enumerate(n_workers):
+        t_start = time.perf_counter()
+        levels, _, _ = calc_third_octave_levels(sig, fs, max_workers=workers)
+        comp_time[i] = time.perf_counter() - t_start
+        if workers == 1:
+            levels_ref = levels
+        else:
+            assert np.array_equal(levels, levels_ref)
+        print(
+            "{} thread(s): {:.2f} s, speedup x{:.2f}".format(
+                workers, comp_time[i], comp_time[0] / comp_time[i]
+            )
+        )
+
+    plt.plot(n_workers, comp_time[0] / comp_time, "o-", label="MOSQITO")
+    plt.plot(n_workers, n_workers, "k--", label="Ideal scaling")
+    plt.title(
+        "calc_third_octave_levels, {:g} s signal ({} cores)".format(
+            duration, os.cpu_count()
+        ),
+        fontsize=10,
+    )
+    plt.xlabel("Number of threads")
+    plt.ylabel("Speedup")
+    plt.legend()
+    plt.savefig(
+        "./mosqito/validations/loudness_zwicker/output/"
+        + "benchmark_third_octave_threads.png",
+        format="png",
+    )
+    plt.clf()
+    return n_workers, comp_time
+
+
+if __name__ == "__main__":
+    benchmark_third_octave_threads(
+        "./mosqito/validations/loudness_zwicker/data/ISO_532-1/Annex B.5/Test signal 15 (vehicle interior 40 kmh).wav"
+    )
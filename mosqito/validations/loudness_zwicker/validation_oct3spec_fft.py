@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard library imports
+import time
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from mosqito.functions.shared.load import load
+from mosqito.functions.oct3filter.oct3spec import oct3spec
+from mosqito.functions.loudness_zwicker.loudness_zwicker_stationary import (
+    loudness_zwicker_stationary,
+)
+
+
+def validation_oct3spec_fft(data_file, field_type="free"):
+    """Compare the third octave spectrum computed with the "fft" method of
+    oct3spec to the spectrum computed with the "time" method, and the
+    corresponding stationary loudness
+
+    Parameters
+    ----------
+    data_file : str
+        Path to the .wav stationary signal
+    field_type : str
+        Type of soundfield ("free" or "diffuse")
+
+    Outputs
+    -------
+    level_error : float
+        Maximum level difference in the bands whose level is less than
+        40 dB below the highest band level [dB]
+    loudness_error : float
+        Relative loudness difference
+    """
+    sig, fs = load(True, data_file, calib=2 * 2 ** 0.5)
+
+    spec_ref, _ = oct3spec(sig, fs)
+    spec, _ = oct3spec(sig, fs, method="fft")
+    N_ref, _ = loudness_zwicker_stationary(spec_ref, field_type=field_type)
+    N, _ = loudness_zwicker_stationary(spec, field_type=field_type)
+
+    error = np.abs(spec - spec_ref)
+    level_error = error[spec_ref >= spec_ref.max() - 40].max()
+    loudness_error = abs(N - N_ref) / N_ref
+    print(
+        data_file.split("/")[-1],
+        ": max. level difference {:.3f} dB ({:.3f} dB in all the bands), "
+        "loudness difference {:.3f} %".format(
+            level_error, error.max(), 100 * loudness_error
+        ),
+    )
+    return level_error, loudness_error
+
+
+def benchmark_oct3spec_fft(data_file, duration=60):
+    """Compare the computation time of the "time" and "fft" methods of
+    oct3spec on a stationary signal repeated to the given duration
+
+    Parameters
+    ----------
+    data_file : str
+        Path to the .wav signal
+    duration : float
+        Duration of the signal [s]
+
+    Outputs
+    -------
+    speedup : float
+        Ratio of the computation times
+    """
+    sig, fs = load(True, data_file, calib=2 * 2 ** 0.5)
+    sig = np.resize(sig, int(duration * fs))
+
+    t_start = time.perf_counter()
+    spec_ref, _ = oct3spec(sig, fs)
+    t_ref = time.perf_counter() - t_start
+    t_start = time.perf_counter()
+    spec, _ = oct3spec(sig, fs, method="fft")
+    t_fft = time.perf_counter() - t_start
+
+    print(
+        "{:g} s signal: time method {:.2f} s, fft method {:.2f} s, "
+        "speedup x{:.1f}, max. level difference {:.3f} dB".format(
+            duration, t_ref, t_fft, t_ref / t_fft, np.abs(spec - spec_ref).max()
+        )
+    )
+    return t_ref / t_fft
+
+
+if __name__ == "__main__":
+    data_path = "./mosqito/validations/loudness_zwicker/data/ISO_532-1/"
+    for data_file in [
+        "Test signal 2 (250 Hz 80 dB).wav",
+        "Test signal 3 (1 kHz 60 dB).wav",
+        "Test signal 4 (4 kHz 40 dB).wav",
+        "Test signal 5 (pinknoise 60 dB).wav",
+        "PinkNoise_40dBpHz@1000Hz.wav",
+        "sinus_1000Hz_60dBSPL.wav",
+    ]:
+        validation_oct3spec_fft(data_path + data_file)
+
+    for duration in [10, 60]:
+        benchmark_oct3spec_fft(
+            data_path + "Test signal 5 (pinknoise 60 dB).wav", duration
+        )
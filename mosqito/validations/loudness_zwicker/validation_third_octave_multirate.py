@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard library imports
+import glob
+import time
+
+# Third party imports
+import numpy as np
+
+# Local application imports
+from mosqito.functions.shared.load import load
+from mosqito.functions.oct3filter.calc_third_octave_levels import (
+    calc_third_octave_levels,
+)
+from mosqito.functions.oct3filter.calc_third_octave_levels_multirate import (
+    calc_third_octave_levels_multirate,
+)
+from mosqito.functions.loudness_zwicker.loudness_zwicker_time import (
+    loudness_zwicker_time,
+)
+
+
+def validation_third_octave_multirate(data_file, field_type="free"):
+    """Compare the loudness computed with the multirate filterbank to the
+    loudness computed with the ISO 532-1 filterbank
+
+    The tolerances of ISO 532-1 section 6.1 are used: the loudness shall
+    not differ by more than 5% or 0.1 sone from the reference in more
+    than 1% of the time samples, and never by more than 10% or 0.2 sone.
+
+    Parameters
+    ----------
+    data_file : str
+        Path to the .wav test signal
+    field_type : str
+        Type of soundfield ("free" or "diffuse")
+
+    Outputs
+    -------
+    tst : bool
+        Compliance to the reference loudness
+    """
+    sig, fs = load(False, data_file, calib=2 * 2 ** 0.5)
+
+    N_ref, _ = loudness_zwicker_time(calc_third_octave_levels(sig, fs)[0], field_type)
+    N, _ = loudness_zwicker_time(
+        calc_third_octave_levels_multirate(sig, fs)[0], field_type
+    )
+
+    error = np.abs(N - N_ref)
+    out_5 = np.mean(error > np.maximum(0.05 * N_ref, 0.1))
+    out_10 = np.mean(error > np.maximum(0.1 * N_ref, 0.2))
+    tst = out_5 <= 0.01 and out_10 == 0
+    print(
+        data_file.split("/")[-1],
+        ": max. error {:.3f} sone, {:.2%} of time outside 5% tolerance".format(
+            error.max(), out_5
+        ),
+    )
+    return tst
+
+
+def benchmark_third_octave_multirate(data_file, duration=60):
+    """Compare the computation time of the multirate and ISO 532-1
+    filterbanks on a signal repeated to the given duration
+
+    Parameters
+    ----------
+    data_file : str
+        Path to the .wav signal
+    duration : float
+        Duration of the signal [s]
+
+    Outputs
+    -------
+    speedup : float
+        Ratio of the computation times
+    """
+    sig, fs = load(False, data_file, calib=2 * 2 ** 0.5)
+    sig = np.resize(sig, int(duration * fs))
+
+    t_start = time.perf_counter()
+    calc_third_octave_levels(sig, fs)
+    t_ref = time.perf_counter() - t_start
+    t_start = time.perf_counter()
+    calc_third_octave_levels_multirate(sig, fs)
+    t_multirate = time.perf_counter() - t_start
+
+    print(
+        "{:g} s signal: ISO filterbank {:.2f} s, multirate filterbank {:.2f} s, "
+        "speedup x{:.2f}".format(duration, t_ref, t_multirate, t_ref / t_multirate)
+    )
+    return t_ref / t_multirate
+
+
+if __name__ == "__main__":
+    data_files = sorted(
+        glob.glob("./mosqito/validations/loudness_zwicker/data/ISO_532-1/Annex B.*/*.wav")
+    )
+    for data_file in data_files:
+        if "vehicle interior" in data_file:
+            field_type = "diffuse"
+        else:
+            field_type = "free"
+        assert validation_third_octave_multirate(data_file, field_type)
+
+    benchmark_third_octave_multirate(
+        "./mosqito/validations/loudness_zwicker/data/ISO_532-1/Annex B.5/Test signal 15 (vehicle interior 40 kmh).wav"
+    )
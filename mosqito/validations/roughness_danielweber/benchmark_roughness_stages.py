@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard imports
+import glob
+import math
+import time
+import numpy as np
+
+# Local application imports
+from mosqito.functions.shared.load import load
+from mosqito.functions.shared.conversion import db2amp
+from mosqito.functions.roughness_danielweber.comp_roughness import (
+    roughness_spectrum,
+    roughness_modulation,
+    roughness_total,
+)
+from mosqito.functions.roughness_danielweber.excitation_pattern import (
+    excitation_pattern,
+)
+from mosqito.functions.roughness_danielweber.roughness_plan import RoughnessPlan
+
+
+def excitation_pattern_loops(freqs, barks, spec_dB, minExcitDB):
+    """Former implementation of excitation_pattern, with loops over the
+    components and the channels (reference for the benchmark)"""
+    n_aud = freqs.size
+    n_channel = 47
+    s1 = -27
+    s2 = np.zeros((n_aud))
+    for k in np.arange(0, n_aud, 1):
+        s2[k] = min(-24 - (230 / freqs[k]) + (0.2 * spec_dB[k]), 0)
+    ch_low = np.zeros((n_aud))
+    ch_high = np.zeros((n_aud))
+    for i in np.arange(0, n_aud):
+        ch_low[i] = math.floor(2 * barks[i]) - 1
+        ch_high[i] = math.ceil(2 * barks[i]) - 1
+    slopes = np.zeros((n_aud, n_channel))
+    for k in np.arange(0, n_aud):
+        levDB = spec_dB[k]
+        b = barks[k]
+        for j in np.arange(0, int(ch_low[k] + 1)):
+            sl = (s1 * (b - ((j + 1) * 0.5))) + levDB
+            if sl > minExcitDB[j]:
+                slopes[k, j] = db2amp(sl, ref=0.00002)
+        for j in np.arange(int(ch_high[k]), n_channel):
+            sl = (s2[k] * (((j + 1) * 0.5) - b)) + levDB
+            if sl > minExcitDB[j]:
+                slopes[k, j] = db2amp(sl, ref=0.00002)
+    return slopes, ch_low, ch_high
+
+
+def benchmark_roughness_stages(signals, fs=48000, n_frames=5):
+    """Computation time of each stage of the roughness model of Daniel and
+    Weber, with the former and the vectorized excitation pattern
+
+    The stages are timed on the first 200 ms frames of each signal, and the
+    excitation patterns of both implementations are checked to be
+    identical.
+
+    Parameters
+    ----------
+    signals : dict
+        Signals sampled at fs, indexed by their name
+    fs : int
+        Sampling frequency [Hz]
+    n_frames : int
+        Number of frames timed per signal
+
+    Outputs
+    -------
+    comp_time : dict
+        Mean computation time per frame of each stage [s], indexed by the
+        name of the signals
+    """
+    plan = RoughnessPlan(fs)
+    n = plan.n
+    stages = ["stage 0", "stage 1 (loops)", "stage 1", "stage 2", "stage 3"]
+    header = "{:<40}".format("Signal (audible components)")
+    print(header + "".join("{:>17}".format(stage) for stage in stages))
+    comp_time = {}
+    for name, sig in signals.items():
+        times = np.zeros(len(stages))
+        n_aud = 0
+        for i_frame in range(min(n_frames, sig.size // n)):
+            segment = sig[i_frame * n : (i_frame + 1) * n]
+            t_0 = time.perf_counter()
+            spectrum, module, spec_dB = roughness_spectrum(segment, plan)
+            audible_index = np.where(spec_dB > plan.threshold)[0]
+            t_1 = time.perf_counter()
+            slopes_ref = excitation_pattern_loops(
+                plan.freqs[audible_index],
+                plan.barks[audible_index],
+                spec_dB[audible_index],
+                plan.minExcitDB,
+            )
+            t_2 = time.perf_counter()
+            slopes, ch_low, ch_high = excitation_pattern(
+                plan.freqs[audible_index],
+                plan.barks[audible_index],
+                spec_dB[audible_index],
+                plan.minExcitDB,
+            )
+            t_3 = time.perf_counter()
+            hBP, mod_depth = roughness_modulation(
+                spectrum, module, audible_index, slopes, ch_low, ch_high, plan.hWeight
+            )
+            t_4 = time.perf_counter()
+            roughness_total(hBP, mod_depth, plan.gzi)
+            t_5 = time.perf_counter()
+            for ref, new in zip(slopes_ref, (slopes, ch_low, ch_high)):
+                assert np.array_equal(ref, new)
+            times += np.diff([t_0, t_1, t_2, t_3, t_4, t_5])
+            n_aud = max(n_aud, audible_index.size)
+        comp_time[name] = times / (i_frame + 1)
+        print(
+            "{:<40}".format("{} ({})".format(name, n_aud))
+            + "".join("{:>14.1f} ms".format(1000 * t) for t in comp_time[name])
+        )
+    return comp_time
+
+
+if __name__ == "__main__":
+    signals = {}
+    for file in sorted(
+        glob.glob("./mosqito/validations/roughness_danielweber/Sounds/*.wav")
+    ):
+        sig, fs = load(True, file, calib=1)
+        signals[file.split("/")[-1][:-4]] = sig
+    # Broadband signal (white noise at 70 dB)
+    signals["White noise 70 dB"] = (
+        np.random.default_rng(0).standard_normal(fs) * 2e-5 * 10 ** (70 / 20)
+    )
+    benchmark_roughness_stages(signals, fs)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard imports
+import glob
+import os
+import time
+import numpy as np
+import matplotlib.pyplot as plt
+
+# Local application imports
+from mosqito.functions.shared.load import load
+from mosqito.functions.roughness_danielweber.comp_roughness import comp_roughness
+from mosqito.functions.roughness_danielweber.roughness_plan import RoughnessPlan
+
+
+def benchmark_roughness_workers(sig, fs, overlap=0.5, max_workers=None):
+    """Computation time of comp_roughness versus the number of processes
+    computing the frames
+
+    The roughness computed by several processes is checked to be
+    identical to the roughness computed by the calling process. One .png
+    scaling plot is generated.
+
+    Parameters
+    ----------
+    sig : numpy.ndarray
+        Time signal [Pa]
+    fs : int
+        Sampling frequency [Hz]
+    overlap : float
+        Overlapping coefficient of the 200 ms frames
+    max_workers : int
+        Maximum number of processes (number of cores by default)
+
+    Outputs
+    -------
+    n_workers : numpy.ndarray
+        Number of processes
+    comp_time : numpy.ndarray
+        Computation times [s]
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count()
+    plan = RoughnessPlan(fs)
+
+    n_workers = np.arange(1, max_workers + 1)
+    comp_time = np.zeros(n_workers.size)
+    for i, workers in enumerate(n_workers):
+        t_start = time.perf_counter()
+        R = comp_roughness(sig, fs, overlap, plan=plan, max_workers=workers)
+        comp_time[i] = time.perf_counter() - t_start
+        if workers == 1:
+            R_ref = R["values"]
+        else:
+            assert np.array_equal(R["values"], R_ref)
+        print(
+            "{} process(es): {:.2f} s, speedup x{:.2f}".format(
+                workers, comp_time[i], comp_time[0] / comp_time[i]
+            )
+        )
+
+    plt.plot(n_workers, comp_time[0] / comp_time, "o-", label="MOSQITO")
+    plt.plot(n_workers, n_workers, "k--", label="Ideal scaling")
+    plt.title(
+        "comp_roughness, {:g} s signal ({} cores)".format(
+            sig.size / fs, os.cpu_count()
+        ),
+        fontsize=10,
+    )
+    plt.xlabel("Number of processes")
+    plt.ylabel("Speedup")
+    plt.legend()
+    plt.savefig(
+        "./mosqito/validations/roughness_danielweber/"
+        + "benchmark_roughness_workers.png",
+        format="png",
+    )
+    plt.clf()
+    return n_workers, comp_time
+
+
+if __name__ == "__main__":
+    # The validation sounds are put end to end (80 s signal)
+    signals = []
+    for file in sorted(
+        glob.glob("./mosqito/validations/roughness_danielweber/Sounds/*.wav")
+    ):
+        sig, fs = load(True, file, calib=1)
+        signals.append(sig)
+    benchmark_roughness_workers(np.concatenate(signals), fs)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+@date Created on Sun Oct 18 2026
+"""
+
+# Standard imports
+import glob
+import time
+import numpy as np
+import matplotlib.pyplot as plt
+
+# Local application imports
+from mosqito.functions.shared.load import load
+from mosqito.tests.roughness.signals_test_generation import signal_test
+from mosqito.validations.roughness_danielweber.reference_values.references import (
+    ref_dw,
+)
+from mosqito.functions.roughness_danielweber.comp_roughness import comp_roughness
+from mosqito.functions.roughness_danielweber.roughness_plan import RoughnessPlan
+
+
+def validation_roughness_fast():
+    """Comparison of the fast mode of comp_roughness with the default mode
+    and with the reference values of Daniel and Weber
+
+    The roughness of 200 ms amplitude-modulated tones (carrier frequencies
+    from 125 Hz to 8 kHz, modulation frequencies from 10 to 160 Hz,
+    modulation depth of 1, 60 dB) is computed in both modes, and compared
+    to the values given in "Psychoacoustical roughness: implementation of
+    an optimized model" by Daniel and Weber in 1997. One .png comparison
+    plot is generated.
+
+    Parameters
+    ----------
+    None
+
+    Outputs
+    -------
+    R : numpy.ndarray
+        Roughness of the tones in default mode [asper] (dim [carriers,
+        modulation frequencies])
+    R_fast : numpy.ndarray
+        Roughness of the tones in fast mode [asper]
+    """
+    fs = 44100
+    carrier = np.array([125, 250, 500, 1000, 2000, 4000, 8000])
+    fmod = np.array([10, 20, 30, 40, 50, 60, 70, 80, 100, 120, 140, 160])
+    plan = RoughnessPlan(fs)
+
+    r_dw = np.zeros((carrier.size, fmod.size))
+    R = np.zeros((carrier.size, fmod.size))
+    R_fast = np.zeros((carrier.size, fmod.size))
+    for ind_fc in range(carrier.size):
+        r_dw[ind_fc] = ref_dw(carrier[ind_fc], fmod)
+        for ind_fmod in range(fmod.size):
+            signal = signal_test(carrier[ind_fc], fmod[ind_fmod], 1, fs, 0.2, 60)
+            R[ind_fc, ind_fmod] = comp_roughness(signal, fs, 0, plan=plan)[
+                "values"
+            ][0]
+            R_fast[ind_fc, ind_fmod] = comp_roughness(
+                signal, fs, 0, plan=plan, fast=True
+            )["values"][0]
+
+    print(
+        "{:>8}{:>24}{:>24}{:>24}".format(
+            "fc [Hz]", "|R - R_dw|", "|R_fast - R_dw|", "|R_fast - R|"
+        )
+    )
+    print("{:>8}{:>12}{:>12}{:>12}{:>12}{:>12}".format("", *["mean", "max"] * 3))
+    for ind_fc in range(carrier.size):
+        err = np.abs(R[ind_fc] - r_dw[ind_fc])
+        err_fast = np.abs(R_fast[ind_fc] - r_dw[ind_fc])
+        diff = np.abs(R_fast[ind_fc] - R[ind_fc])
+        print(
+            "{:>8}".format(carrier[ind_fc])
+            + "".join(
+                "{:>12.3f}".format(e)
+                for e in [err.mean(), err.max(), err_fast.mean(), err_fast.max()]
+                + [diff.mean(), diff.max()]
+            )
+        )
+
+    fig, axs = plt.subplots(carrier.size, 1, figsize=(6, 14), constrained_layout=True)
+    for ind_fc in range(carrier.size):
+        axs[ind_fc].plot(
+            fmod, r_dw[ind_fc], marker="x", color="red", label="Daniel and Weber"
+        )
+        axs[ind_fc].plot(fmod, R[ind_fc], marker="s", color="#69c3c5", label="mosqito")
+        axs[ind_fc].plot(
+            fmod, R_fast[ind_fc], marker="o", color="#0069a1", label="mosqito (fast)"
+        )
+        axs[ind_fc].set(xlim=(0, 170), ylim=(0, 1.1))
+        axs[ind_fc].set_title(
+            "Carrier frequency of " + str(carrier[ind_fc]) + " Hz", fontsize=11
+        )
+        axs[ind_fc].set_ylabel("Roughness [asper]")
+    axs[0].legend(loc="upper right", shadow=True)
+    axs[-1].set_xlabel("Modulation frequency [Hz]")
+    fig.savefig(
+        "./mosqito/validations/roughness_danielweber/validation_roughness_fast.png",
+        format="png",
+    )
+    plt.close(fig)
+    return R, R_fast
+
+
+def benchmark_roughness_fast(sig, fs, overlap=0.5):
+    """Computation time of comp_roughness in default and fast mode
+
+    Parameters
+    ----------
+    sig : numpy.ndarray
+        Time signal [Pa]
+    fs : int
+        Sampling frequency [Hz]
+    overlap : float
+        Overlapping coefficient of the 200 ms frames
+
+    Outputs
+    -------
+    comp_time : numpy.ndarray
+        Computation times in default and fast mode [s]
+    """
+    plan = RoughnessPlan(fs)
+    comp_time = np.zeros(2)
+    for i, fast in enumerate([False, True]):
+        t_start = time.perf_counter()
+        comp_roughness(sig, fs, overlap, plan=plan, fast=fast)
+        comp_time[i] = time.perf_counter() - t_start
+    print(
+        "{:g} s signal: {:.2f} s, fast mode {:.2f} s, speedup x{:.1f}".format(
+            sig.size / fs, comp_time[0], comp_time[1], comp_time[0] / comp_time[1]
+        )
+    )
+    return comp_time
+
+
+if __name__ == "__main__":
+    validation_roughness_fast()
+    # The validation sounds are put end to end (80 s signal)
+    signals = []
+    for file in sorted(
+        glob.glob("./mosqito/validations/roughness_danielweber/Sounds/*.wav")
+    ):
+        sig, fs = load(True, file, calib=1)
+        signals.append(sig)
+    benchmark_roughness_fast(np.concatenate(signals), fs)
+    # Broadband signal (white noise at 70 dB)
+    benchmark_roughness_fast(
+        np.random.default_rng(0).standard_normal(20 * fs) * 2e-5 * 10 ** (70 / 20),
+        fs,
+    )